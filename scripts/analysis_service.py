@@ -0,0 +1,350 @@
+"""
+Analysis Service
+Long-running asyncio HTTP service that keeps warm SkillGapAnalyzer instances
+so callers such as the Next.js frontend do not pay the interpreter start-up,
+imports and analyzer construction on every request.
+
+Concurrent requests are collected into micro-batches (up to --batch-size
+pairs or --max-wait-ms, whichever comes first). Each batch is analyzed in a
+worker process with SkillGapAnalyzer.analyze_pairs, which scores the whole
+batch in one vectorized step. When more than --max-queue requests are waiting,
+new ones are rejected immediately with 503 and a Retry-After header.
+
+A request may carry a latency budget ("budget_ms", counted from its arrival).
+Such pairs are analyzed first and individually with analyze(budget=...); fields
+estimated to meet the budget are listed in the response's "approximate" key.
+
+Endpoints:
+    POST /analyze   {"resume": "...", "job": "...", "budget_ms": 50} -> analysis results
+                    ("budget_ms" is optional)
+    GET  /health    liveness check
+    GET  /metrics   queue depth, batch sizes, rejections and p50/p99 latency
+
+Example:
+    python scripts/analysis_service.py --port 8321 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
+from resume_skill_gap_analyzer import SkillGapAnalyzer, DocumentCache
+
+# Per-process analyzer, built once by _init_worker
+_worker_analyzer = None
+
+_STATUS_TEXT = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable',
+}
+
+
+def _init_worker(minimal: bool, cache_bytes: int):
+    """Build the warm per-process analyzer (with a profile cache for repeated jobs)."""
+    global _worker_analyzer
+    _worker_analyzer = SkillGapAnalyzer(cache=DocumentCache(max_bytes=cache_bytes), minimal=minimal)
+    # Pay the remaining lazy imports now rather than on the first request
+    _worker_analyzer.analyze_pairs([("python", "python")])
+
+
+def _analyze_batch(pairs: List[Tuple[str, str, Optional[float]]]) -> List[str]:
+    """
+    Analyze one micro-batch in a worker process, returning JSON response bodies.
+
+    Pairs with a budget (seconds left when dispatched) go first, one by one;
+    the others are analyzed together with analyze_pairs.
+    """
+    start = time.perf_counter()
+    results = [None] * len(pairs)
+    for i, (resume_text, job_desc_text, budget) in enumerate(pairs):
+        if budget is not None:
+            budget = max(0.0, budget - (time.perf_counter() - start))
+            results[i] = _worker_analyzer.analyze(resume_text, job_desc_text, budget=budget).to_json()
+    rest = [i for i, (_, _, budget) in enumerate(pairs) if budget is None]
+    if rest:
+        batch = _worker_analyzer.analyze_pairs([pairs[i][:2] for i in rest])
+        for i, result in zip(rest, batch):
+            results[i] = result.to_json()
+    return results
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class AnalysisService:
+    """Micro-batching front end over a pool of warm analyzer processes."""
+
+    def __init__(self, workers: int = None, batch_size: int = 32, max_wait_ms: float = 5.0,
+                 max_queue: int = 1024, max_body_bytes: int = 2 * 1024 * 1024,
+                 minimal: bool = False, cache_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the service (call start() inside the event loop).
+
+        Args:
+            workers: Worker processes (default: CPU count)
+            batch_size: Maximum pairs per micro-batch
+            max_wait_ms: How long the first request of a batch waits for company
+            max_queue: Waiting requests beyond which new ones get 503
+            max_body_bytes: Largest accepted request body
+            minimal: Analyze without NLTK or scikit-learn
+            cache_bytes: Profile cache size per worker
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_body_bytes = max_body_bytes
+        self.minimal = minimal
+        self.cache_bytes = cache_bytes
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.pool = None
+        self._batcher = None
+        self._slots = asyncio.Semaphore(self.workers)
+        self.latencies = deque(maxlen=10000)
+        self.requests = 0
+        self.rejected = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_pairs = 0
+
+    async def start(self):
+        """Start the worker pool and the batching task."""
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                        initargs=(self.minimal, self.cache_bytes))
+        self._batcher = asyncio.get_running_loop().create_task(self._batch_loop())
+
+    async def stop(self):
+        """Stop batching and shut the worker pool down."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+    async def submit(self, resume_text: str, job_desc_text: str, budget: float = None) -> Dict:
+        """
+        Queue one pair for analysis and wait for its result.
+
+        Args:
+            resume_text: Resume text
+            job_desc_text: Job description text
+            budget: Optional latency budget in seconds, from now
+
+        Raises:
+            asyncio.QueueFull: If the service is overloaded
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        deadline = None if budget is None else loop.time() + budget
+        self.queue.put_nowait((resume_text, job_desc_text, deadline, future))
+        return await future
+
+    async def _batch_loop(self):
+        """Collect queued requests into micro-batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # At most one batch per worker in flight; the rest keep queueing
+            await self._slots.acquire()
+            loop.create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Tuple[str, str, Optional[float], asyncio.Future]]):
+        """Analyze a batch in the pool and resolve its futures."""
+        loop = asyncio.get_running_loop()
+        try:
+            # Budgets shrink by the time spent queueing
+            now = loop.time()
+            pairs = [(resume, job, None if deadline is None else deadline - now)
+                     for resume, job, deadline, _ in batch]
+            results = await loop.run_in_executor(self.pool, _analyze_batch, pairs)
+            self.batches += 1
+            self.batched_pairs += len(batch)
+            for (_, _, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._slots.release()
+
+    def metrics(self) -> Dict:
+        """Current service metrics, including latency percentiles in milliseconds."""
+        latencies = list(self.latencies)
+        return {
+            'requests': self.requests,
+            'rejected': self.rejected,
+            'errors': self.errors,
+            'queue_depth': self.queue.qsize(),
+            'batches': self.batches,
+            'mean_batch_size': round(self.batched_pairs / self.batches, 2) if self.batches else 0.0,
+            'latency_ms': {
+                'p50': round(_percentile(latencies, 0.50) * 1000, 3),
+                'p99': round(_percentile(latencies, 0.99) * 1000, 3),
+                'samples': len(latencies),
+            },
+        }
+
+    async def _handle_analyze(self, body: bytes) -> Tuple[int, Union[Dict, str], Dict]:
+        """Validate an /analyze request and run it through the batcher."""
+        try:
+            payload = json.loads(body)
+            resume_text, job_desc_text = payload['resume'], payload['job']
+            if not isinstance(resume_text, str) or not isinstance(job_desc_text, str):
+                raise TypeError
+            budget_ms = payload.get('budget_ms')
+        except (ValueError, KeyError, TypeError):
+            return 400, {'error': 'Expected a JSON object with "resume" and "job" strings'}, {}
+        if budget_ms is not None and (isinstance(budget_ms, bool) or not isinstance(budget_ms, (int, float))
+                                      or budget_ms <= 0):
+            return 400, {'error': '"budget_ms" must be a positive number'}, {}
+        if not resume_text.strip():
+            return 400, {'error': 'Resume text cannot be empty'}, {}
+        if not job_desc_text.strip():
+            return 400, {'error': 'Job description text cannot be empty'}, {}
+
+        start = time.perf_counter()
+        try:
+            result = await self.submit(resume_text, job_desc_text,
+                                       None if budget_ms is None else budget_ms / 1000)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return 503, {'error': 'Service overloaded, retry later'}, {'Retry-After': '1'}
+        except Exception as e:
+            self.errors += 1
+            return 500, {'error': str(e)}, {}
+        self.latencies.append(time.perf_counter() - start)
+        return 200, result, {}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve HTTP/1.1 requests on one connection (keep-alive supported)."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': 'Malformed request line'}, close=True)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                close = (headers.get('connection', '').lower() == 'close'
+                         or version == 'HTTP/1.0' and headers.get('connection', '').lower() != 'keep-alive')
+
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                    if length < 0:
+                        raise ValueError
+                except ValueError:
+                    await self._respond(writer, 400, {'error': 'Invalid Content-Length header'}, close=True)
+                    break
+                if length > self.max_body_bytes:
+                    await self._respond(writer, 413, {'error': 'Request body too large'}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                self.requests += 1
+                extra_headers = {}
+                if path == '/analyze':
+                    if method != 'POST':
+                        status, payload = 405, {'error': 'Use POST'}
+                    else:
+                        status, payload, extra_headers = await self._handle_analyze(body)
+                elif path == '/health' and method == 'GET':
+                    status, payload = 200, {'status': 'ok'}
+                elif path == '/metrics' and method == 'GET':
+                    status, payload = 200, self.metrics()
+                else:
+                    status, payload = 404, {'error': 'Not found'}
+                await self._respond(writer, status, payload, extra_headers, close)
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: Union[Dict, str],
+                       extra_headers: Dict[str, str] = None, close: bool = False):
+        """Write a JSON response (payload is a dictionary or an encoded JSON string)."""
+        if not isinstance(payload, str):
+            payload = json.dumps(payload)
+        body = payload.encode('utf-8')
+        headers = {
+            'Content-Type': 'application/json',
+            'Content-Length': str(len(body)),
+            'Connection': 'close' if close else 'keep-alive',
+            **(extra_headers or {}),
+        }
+        head = f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, '')}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        writer.write(head.encode('latin-1') + b"\r\n" + body)
+        await writer.drain()
+
+
+async def serve(host: str, port: int, **options):
+    """Run the service until cancelled."""
+    service = AnalysisService(**options)
+    await service.start()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"✅ Analysis service listening on http://{host}:{port} with {service.workers} workers",
+          file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv: List[str] = None):
+    """Parse command-line arguments and run the service."""
+    parser = argparse.ArgumentParser(description="Serve skill gap analysis over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8321, help="Port (default: 8321)")
+    parser.add_argument('--workers', '-w', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--batch-size', type=int, default=32, help="Maximum pairs per batch (default: 32)")
+    parser.add_argument('--max-wait-ms', type=float, default=5.0,
+                        help="Maximum time to wait for a batch to fill (default: 5)")
+    parser.add_argument('--max-queue', type=int, default=1024,
+                        help="Waiting requests before answering 503 (default: 1024)")
+    parser.add_argument('--minimal', action='store_true', help="Analyze without NLTK or scikit-learn")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, workers=args.workers, batch_size=args.batch_size,
+                          max_wait_ms=args.max_wait_ms, max_queue=args.max_queue, minimal=args.minimal))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,326 @@
+"""
+Analysis Session
+Incremental re-analysis for a resume (or job description) that is edited
+and re-analyzed many times, as in the chatbot and learning-plan UI.
+
+A session keeps per-line term counts and skill matches (by offset in the line
+where they start) for both documents. When a document changes, only the lines
+between the unchanged prefix and suffix are rescanned, with enough neighbouring
+text for skills spanning line breaks; the differences are applied to the document totals and to running
+sums of the TF-IDF similarity, so re-analysis cost follows the size of the
+edit rather than the size of the document. Analyzers with another scoring
+engine (e.g. scoring='hashing') score the current term totals with that
+engine instead. Results are identical to SkillGapAnalyzer.analyze on the
+full texts.
+
+Example:
+    session = AnalysisSession(resume_text, job_desc_text)
+    result = session.result()
+    result = session.update_resume(edited_resume_text)
+"""
+
+import math
+from bisect import bisect_right
+from collections import Counter
+from itertools import chain
+from typing import Dict, List, Set, Tuple
+
+from resume_skill_gap_analyzer import (
+    AnalysisResult, SkillGapAnalyzer, DocumentProfile, count_terms, tfidf_similarity,
+)
+
+# Two-document smoothed IDF of a term found in only one document, squared
+_RARE_IDF_SQUARED = (math.log(1.5) + 1) ** 2
+
+
+def _validate(text: str, label: str):
+    """Reject non-string and empty documents the same way analyze() does."""
+    if text is not None and not isinstance(text, str):
+        raise ValueError(f"{label} must be a string, not {type(text).__name__}")
+    if not text or not text.strip():
+        raise ValueError(f"{label} cannot be empty")
+
+
+class DocumentState:
+    """Per-line skill matches and term counts of one document, with running totals."""
+
+    def __init__(self, analyzer: SkillGapAnalyzer, text: str):
+        """
+        Scan a document line by line.
+
+        Args:
+            analyzer: Analyzer whose skill extractor is used
+            text: Document text
+        """
+        self.extractor = analyzer.skill_extractor
+        # Context needed around an edit: a match plus the character after it
+        self.context = self.extractor.matcher.max_pattern_length + 1
+        self.lines: List[str] = []
+        # (offset, skill) of the matches starting in each line
+        self.line_skills: List[Set[Tuple[int, str]]] = []
+        self.line_terms: List[Dict[str, int]] = []
+        self.skill_counts = Counter()
+        self.term_counts: Dict[str, int] = {}
+        self.replace_lines(0, 0, text.split('\n'))
+
+    @property
+    def text(self) -> str:
+        """Current document text."""
+        return '\n'.join(self.lines)
+
+    def profile(self) -> DocumentProfile:
+        """Current profile (without tokens, which the results do not use)."""
+        return DocumentProfile(
+            tokens=(),
+            skills=frozenset(self.skill_counts),
+            skill_counts=dict(self.skill_counts),
+            term_counts=self.term_counts,
+        )
+
+    def diff(self, text: str) -> Tuple[int, int, List[str]]:
+        """
+        Find the changed block between the current text and a new one.
+
+        Args:
+            text: New document text
+
+        Returns:
+            (start, stop, new_lines): lines[start:stop] become new_lines
+        """
+        new_lines = text.split('\n')
+        old_lines = self.lines
+        start = 0
+        limit = min(len(old_lines), len(new_lines))
+        while start < limit and old_lines[start] == new_lines[start]:
+            start += 1
+        end = 0
+        limit -= start
+        while end < limit and old_lines[-1 - end] == new_lines[-1 - end]:
+            end += 1
+        return start, len(old_lines) - end, new_lines[start:len(new_lines) - end]
+
+    def replace_lines(self, start: int, stop: int, new_lines: List[str]) -> Dict[str, int]:
+        """
+        Replace lines[start:stop] and update the totals.
+
+        Terms never span a line break, so per-line term counts add up to those
+        of the whole document. Multi-word skills can (the matcher treats line
+        breaks as spaces), so the rescan starts far enough before the edit to
+        cover any match reaching into it and reads past the edit to complete
+        matches starting in it. Matches starting after the edit depend only on
+        the text from the preceding line break on, so they stay valid.
+
+        Args:
+            start: First replaced line
+            stop: End of the replaced range (exclusive)
+            new_lines: Replacement lines
+
+        Returns:
+            Term count changes (term -> difference)
+        """
+        lines = self.lines
+        lo, chars = start, 0
+        while lo > 0 and chars < self.context:
+            lo -= 1
+            chars += len(lines[lo]) + 1
+        tail, chars = stop, 0
+        while tail < len(lines) and chars < self.context:
+            chars += len(lines[tail]) + 1
+            tail += 1
+        block = lines[lo:start] + new_lines
+        line_starts = []
+        offset = 0
+        for line in block + lines[stop:tail]:
+            line_starts.append(offset)
+            offset += len(line) + 1
+        new_skills = [set() for _ in block]
+        for match in self.extractor.find_skills('\n'.join(block + lines[stop:tail])):
+            row = bisect_right(line_starts, match.start) - 1
+            if row < len(block):
+                new_skills[row].add((match.start - line_starts[row], match.skill))
+        new_terms = [count_terms(line) for line in new_lines]
+
+        skill_delta = Counter()
+        term_delta = Counter()
+        for matches in self.line_skills[lo:stop]:
+            skill_delta.subtract(skill for _, skill in matches)
+        for matches in new_skills:
+            skill_delta.update(skill for _, skill in matches)
+        for counts in self.line_terms[start:stop]:
+            term_delta.subtract(counts)
+        for counts in new_terms:
+            term_delta.update(counts)
+
+        self.lines[start:stop] = new_lines
+        self.line_skills[lo:stop] = new_skills
+        self.line_terms[start:stop] = new_terms
+
+        for skill, change in skill_delta.items():
+            if change:
+                count = self.skill_counts[skill] + change
+                if count:
+                    self.skill_counts[skill] = count
+                else:
+                    del self.skill_counts[skill]
+        changes = {}
+        for term, change in term_delta.items():
+            if change:
+                count = self.term_counts.get(term, 0) + change
+                if count:
+                    self.term_counts[term] = count
+                else:
+                    del self.term_counts[term]
+                changes[term] = change
+        return changes
+
+
+class AnalysisSession:
+    """Keeps the analysis state of a resume / job description pair between edits."""
+
+    def __init__(self, resume_text: str, job_desc_text: str, analyzer: SkillGapAnalyzer = None,
+                 max_features: int = 500):
+        """
+        Analyze a pair and keep the state for incremental updates.
+
+        Args:
+            resume_text: Candidate's resume text
+            job_desc_text: Job description text
+            analyzer: Analyzer providing skill extraction and result building
+            max_features: Vocabulary size limit of the similarity (as in analyze)
+        """
+        _validate(resume_text, "Resume text")
+        _validate(job_desc_text, "Job description text")
+        self.analyzer = analyzer or SkillGapAnalyzer()
+        self.max_features = max_features
+        self.resume = DocumentState(self.analyzer, resume_text)
+        self.job = DocumentState(self.analyzer, job_desc_text)
+
+        # Integer sums behind the similarity: dot product over shared terms and
+        # squared counts of each document split into shared and one-sided terms
+        self._dot = 0
+        self._resume_shared = self._resume_only = 0
+        self._job_shared = self._job_only = 0
+        self._vocabulary_size = 0
+        for term in self.resume.term_counts.keys() | self.job.term_counts.keys():
+            self._account(self.resume.term_counts.get(term, 0), self.job.term_counts.get(term, 0), 1)
+        self._result = None
+
+    def _account(self, resume_count: int, job_count: int, sign: int):
+        """Add (sign=1) or remove (sign=-1) one term's contribution to the sums."""
+        if resume_count and job_count:
+            self._dot += sign * resume_count * job_count
+            self._resume_shared += sign * resume_count * resume_count
+            self._job_shared += sign * job_count * job_count
+        elif resume_count:
+            self._resume_only += sign * resume_count * resume_count
+        elif job_count:
+            self._job_only += sign * job_count * job_count
+        else:
+            return
+        self._vocabulary_size += sign
+
+    def _apply(self, changes: Dict[str, int], changed_is_resume: bool):
+        """Move the similarity sums along with a document's term changes."""
+        if changed_is_resume:
+            changed, other = self.resume.term_counts, self.job.term_counts
+        else:
+            changed, other = self.job.term_counts, self.resume.term_counts
+        for term, change in changes.items():
+            new_count = changed.get(term, 0)
+            other_count = other.get(term, 0)
+            if changed_is_resume:
+                self._account(new_count - change, other_count, -1)
+                self._account(new_count, other_count, 1)
+            else:
+                self._account(other_count, new_count - change, -1)
+                self._account(other_count, new_count, 1)
+        self._result = None
+
+    def similarity(self) -> float:
+        """Cosine similarity of the current texts, as computed by analyze()."""
+        if self.analyzer.scoring != 'tfidf':
+            # The running sums are TF-IDF specific; other engines score the totals directly
+            return self.analyzer._similarity(self.resume.term_counts, self.job.term_counts)
+        if self.max_features and self._vocabulary_size > self.max_features:
+            # The vocabulary limit depends on every term's total; score from scratch
+            return tfidf_similarity(self.resume.term_counts, self.job.term_counts, self.max_features,
+                                    use_numpy=not self.analyzer.minimal)
+        norm_resume = self._resume_shared + _RARE_IDF_SQUARED * self._resume_only
+        norm_job = self._job_shared + _RARE_IDF_SQUARED * self._job_only
+        if not norm_resume or not norm_job:
+            return 0.0
+        return self._dot / math.sqrt(norm_resume * norm_job)
+
+    def result(self) -> AnalysisResult:
+        """
+        Analysis results for the current texts.
+
+        Returns:
+            AnalysisResult equal to SkillGapAnalyzer.analyze of the current texts
+        """
+        if self._result is None:
+            match_percentage = round(self.similarity() * 100, 2)
+            self._result = self.analyzer._build_result(self.resume.profile(), self.job.profile(),
+                                                       match_percentage)
+        return self._result
+
+    def update_resume(self, resume_text: str) -> AnalysisResult:
+        """
+        Re-analyze after the resume changed.
+
+        Args:
+            resume_text: Full new resume text
+
+        Returns:
+            Updated AnalysisResult
+        """
+        _validate(resume_text, "Resume text")
+        self._apply(self.resume.replace_lines(*self.resume.diff(resume_text)), True)
+        return self.result()
+
+    def update_job(self, job_desc_text: str) -> AnalysisResult:
+        """
+        Re-analyze after the job description changed.
+
+        Args:
+            job_desc_text: Full new job description text
+
+        Returns:
+            Updated AnalysisResult
+        """
+        _validate(job_desc_text, "Job description text")
+        self._apply(self.job.replace_lines(*self.job.diff(job_desc_text)), False)
+        return self.result()
+
+    def edit_resume(self, start: int, stop: int, new_lines: List[str]) -> AnalysisResult:
+        """
+        Re-analyze after replacing a known range of resume lines.
+
+        Args:
+            start: First replaced line
+            stop: End of the replaced range (exclusive)
+            new_lines: Replacement lines (strings without line breaks)
+
+        Returns:
+            Updated AnalysisResult
+
+        Raises:
+            ValueError: If the range is not within the resume's lines, a
+                replacement line is not a single line of text or the edit
+                leaves the resume empty
+        """
+        lines = self.resume.lines
+        if not all(isinstance(bound, int) and not isinstance(bound, bool) for bound in (start, stop)):
+            raise ValueError("start and stop must be integers")
+        if not 0 <= start <= stop <= len(lines):
+            raise ValueError(f"Invalid line range {start}:{stop} for a resume of {len(lines)} lines")
+        if not isinstance(new_lines, (list, tuple)) or not all(
+                isinstance(line, str) and '\n' not in line for line in new_lines):
+            raise ValueError("new_lines must be a list of strings without line breaks")
+        # Usually settled by the first line checked; only blank edits look further
+        if not any(line.strip() for line in new_lines) and not any(
+                lines[index].strip() for index in chain(range(start), range(stop, len(lines)))):
+            raise ValueError("Resume text cannot be empty")
+        new_lines = list(new_lines)
+        self._apply(self.resume.replace_lines(start, stop, new_lines), True)
+        return self.result()
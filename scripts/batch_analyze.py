@@ -0,0 +1,240 @@
+"""
+Batch Skill Gap Analysis
+Non-interactive command that analyzes every resume against every job
+description and streams the results as JSON Lines (or, with --output-format,
+CSV, Parquet or Arrow through results_writer.ResultsWriter).
+
+Inputs can be directories (one document per file) or JSONL files with one
+{"id": ..., "text": ...} object per line. Resumes are read lazily and fanned
+out over a process pool in chunks; each worker builds its SkillGapAnalyzer and
+loads the job descriptions once.
+
+Example:
+    python scripts/batch_analyze.py --resumes resumes/ --jobs jobs.jsonl \\
+        --workers 8 --chunk-size 16 --output results.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from typing import Dict, Iterator, List, Tuple
+
+from resume_skill_gap_analyzer import (
+    DEFAULT_FUZZY_THRESHOLD, SCORING_ENGINES, TOKENIZER_ENGINES, HashingVectorizer, SkillGapAnalyzer,
+    read_from_file,
+)
+from results_writer import FORMATS, ResultsWriter, infer_format
+
+# Per-process state, set up once by _init_worker
+_worker_analyzer = None
+_worker_jobs: List[Tuple[str, str]] = []
+
+
+def parse_record(path: str, line_no: int, line: str) -> Tuple[str, str]:
+    """
+    Parse one JSONL document line.
+
+    Args:
+        path: Source file (for error messages)
+        line_no: 1-based line number, the id of records without one
+        line: Stripped, non-empty line
+
+    Returns:
+        (document_id, text) tuple
+    """
+    try:
+        record = json.loads(line)
+        text = record['text']
+    except (ValueError, KeyError, TypeError):
+        raise ValueError(f"{path}:{line_no}: expected a JSON object with a 'text' field")
+    return str(record.get('id', line_no)), text
+
+
+def iter_documents(path: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (document_id, text) pairs from a directory or a JSONL file.
+
+    Args:
+        path: Directory of text files, or a .jsonl file with "id" and "text" fields
+
+    Yields:
+        (document_id, text) tuples
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            file_path = os.path.join(path, name)
+            if os.path.isfile(file_path) and not name.startswith('.'):
+                yield name, read_from_file(file_path)
+    elif os.path.isfile(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if line:
+                    yield parse_record(path, line_no, line)
+    else:
+        raise FileNotFoundError(f"File not found: {path}")
+
+
+def _init_worker(jobs: List[Tuple[str, str]], minimal: bool = False, taxonomy_file: str = None,
+                 scoring: str = 'tfidf', idf_file: str = None, fuzzy_threshold: float = None,
+                 tokenizer: str = 'regex'):
+    """Build the per-process analyzer and keep the job descriptions."""
+    global _worker_analyzer, _worker_jobs
+    taxonomy = None
+    if taxonomy_file:
+        from skill_taxonomy import SkillTaxonomy
+        taxonomy = SkillTaxonomy.load(taxonomy_file)
+    hasher = HashingVectorizer.load(idf_file) if idf_file else None
+    _worker_analyzer = SkillGapAnalyzer(minimal=minimal, taxonomy=taxonomy, scoring=scoring, hasher=hasher,
+                                        fuzzy_threshold=fuzzy_threshold, tokenizer=tokenizer)
+    _worker_jobs = jobs
+
+
+def _analyze_chunk(resumes: List[Tuple[str, str]]) -> List[Dict]:
+    """Analyze a chunk of resumes against every job description."""
+    records = []
+    for resume_id, resume_text in resumes:
+        for job_id, job_text in _worker_jobs:
+            record = {'resume_id': resume_id, 'job_id': job_id}
+            try:
+                record.update(_worker_analyzer.analyze(resume_text, job_text))
+            except ValueError as e:
+                record['error'] = str(e)
+            records.append(record)
+    return records
+
+
+def _chunks(items: Iterator, size: int) -> Iterator[List]:
+    """Split an iterator into lists of at most size items."""
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(resumes: Iterator[Tuple[str, str]], jobs: List[Tuple[str, str]], out,
+              workers: int = None, chunk_size: int = 8, max_pending: int = None,
+              minimal: bool = False, taxonomy_file: str = None, scoring: str = 'tfidf',
+              idf_file: str = None, fuzzy_threshold: float = None, tokenizer: str = 'regex') -> Dict:
+    """
+    Analyze resumes against jobs in a process pool, writing the results to out.
+
+    At most max_pending chunks are queued at any time, so memory stays bounded
+    no matter how many resumes are read.
+
+    Args:
+        resumes: Iterator of (resume_id, text) pairs
+        jobs: List of (job_id, text) pairs
+        out: Writable text stream (JSON Lines) or a ResultsWriter
+        workers: Number of worker processes (default: CPU count)
+        chunk_size: Resumes per task
+        max_pending: Maximum number of chunks in flight (default: 2 x workers)
+        minimal: Analyze without NLTK or scikit-learn
+        taxonomy_file: Compiled skill taxonomy to use instead of the built-in skills
+        scoring: Match scoring engine ('tfidf' or 'hashing')
+        idf_file: Corpus statistics for the hashing engine (see HashingVectorizer.save)
+        fuzzy_threshold: Also match misspelled skills (see SkillExtractor)
+        tokenizer: Preprocessing tokenizer engine ('regex' or 'nltk')
+
+    Returns:
+        Summary dictionary with counts and throughput
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    pairs = errors = 0
+    start = time.perf_counter()
+
+    def write(records: List[Dict]):
+        nonlocal pairs, errors
+        if isinstance(out, ResultsWriter):
+            out.write_many(records)
+        else:
+            out.write(''.join(json.dumps(record) + '\n' for record in records))
+            out.flush()
+        pairs += len(records)
+        errors += sum('error' in record for record in records)
+
+    initargs = (jobs, minimal, taxonomy_file, scoring, idf_file, fuzzy_threshold, tokenizer)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        pending = set()
+        for chunk in _chunks(iter(resumes), chunk_size):
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    write(future.result())
+            pending.add(pool.submit(_analyze_chunk, chunk))
+        for future in wait(pending).done:
+            write(future.result())
+
+    elapsed = time.perf_counter() - start
+    return {
+        'pairs': pairs,
+        'errors': errors,
+        'elapsed_seconds': round(elapsed, 3),
+        'pairs_per_second': round(pairs / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def main(argv: List[str] = None):
+    """Parse command-line arguments and run the batch analysis."""
+    parser = argparse.ArgumentParser(description="Analyze resumes against job descriptions in bulk.")
+    parser.add_argument('--resumes', required=True, help="Directory or JSONL file of resumes")
+    parser.add_argument('--jobs', required=True, help="Directory or JSONL file of job descriptions")
+    parser.add_argument('--output', '-o', default='-', help="Output file (default: JSONL on stdout)")
+    parser.add_argument('--output-format', choices=FORMATS, default=None,
+                        help="Output format (default: inferred from the --output extension, else jsonl)")
+    parser.add_argument('--workers', '-w', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=8, help="Resumes per task (default: 8)")
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help="Maximum tasks in flight (default: 2 x workers)")
+    parser.add_argument('--minimal', action='store_true', help="Analyze without NLTK or scikit-learn")
+    parser.add_argument('--taxonomy', default=None,
+                        help="Compiled skill taxonomy (see skill_taxonomy.py) to use instead of the built-in skills")
+    parser.add_argument('--scoring', choices=SCORING_ENGINES, default='tfidf',
+                        help="Match scoring engine (default: tfidf)")
+    parser.add_argument('--idf', default=None, help="Corpus IDF statistics for the hashing engine")
+    parser.add_argument('--fuzzy', type=float, nargs='?', const=DEFAULT_FUZZY_THRESHOLD, default=None,
+                        metavar='THRESHOLD',
+                        help=f"Also match misspelled skills (trigram similarity, default {DEFAULT_FUZZY_THRESHOLD})")
+    parser.add_argument('--tokenizer', choices=TOKENIZER_ENGINES, default='regex',
+                        help="Preprocessing tokenizer engine (default: regex)")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = list(iter_documents(args.jobs))
+        resumes = iter_documents(args.resumes)
+        if args.output == '-':
+            out = sys.stdout
+        else:
+            output_format = args.output_format
+            if output_format is None:
+                try:
+                    output_format = infer_format(args.output)
+                except ValueError:
+                    output_format = 'jsonl'
+            out = ResultsWriter(args.output, output_format)
+        try:
+            summary = run_batch(resumes, jobs, out, workers=args.workers,
+                                chunk_size=args.chunk_size, max_pending=args.max_pending,
+                                minimal=args.minimal, taxonomy_file=args.taxonomy,
+                                scoring=args.scoring, idf_file=args.idf, fuzzy_threshold=args.fuzzy,
+                                tokenizer=args.tokenizer)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+    except (ValueError, FileNotFoundError, ImportError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    print(f"✅ Analyzed {summary['pairs']} pairs ({summary['errors']} errors) in "
+          f"{summary['elapsed_seconds']}s — {summary['pairs_per_second']} pairs/s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
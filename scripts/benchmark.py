@@ -0,0 +1,605 @@
+"""
+Benchmarks for the Resume Skill Gap Analyzer.
+
+Subcommands:
+    run       Per-stage timings, end-to-end throughput and peak memory on a
+              reproducible synthetic corpus, optionally compared to a baseline
+    corpus    Write a synthetic corpus as JSONL (usable by batch_analyze.py)
+    startup   Cold-start cost: module import time and the first analyze() call,
+              each measured in a fresh interpreter, in minimal and full mode
+    deadline  Tail latency of analyze(budget=...) across document sizes, with the
+              share of approximate results and their error against exact ones
+
+Examples:
+    python scripts/benchmark.py run --resumes 200 --jobs 20 --output bench.json
+    python scripts/benchmark.py run --baseline bench.json --tolerance 0.15
+    python scripts/benchmark.py startup --runs 10 --budget-ms 150
+    python scripts/benchmark.py deadline --budget-ms 5 20 50 --sizes 250 2500 25000
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from dedup import DedupIndex
+from result_store import ResultStore
+from skill_analytics import SkillDemandAnalytics
+from resume_skill_gap_analyzer import (
+    DEFAULT_FUZZY_THRESHOLD, SKILL_DICTIONARY, HashingVectorizer, SkillExtractor, SkillGapAnalyzer,
+    TextPreprocessor, count_terms, read_from_file, tfidf_similarity, _optional_import,
+)
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_RESUME = os.path.join(SCRIPTS_DIR, 'sample_resume.txt')
+SAMPLE_JOB = os.path.join(SCRIPTS_DIR, 'sample_job_description.txt')
+
+# Timed inside a fresh interpreter; prints elapsed milliseconds
+_IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import resume_skill_gap_analyzer
+print((time.perf_counter() - start) * 1000)
+"""
+
+_ANALYZE_SNIPPET = """
+import time
+start = time.perf_counter()
+from resume_skill_gap_analyzer import SkillGapAnalyzer, read_from_file
+analyzer = SkillGapAnalyzer(minimal={minimal})
+analyzer.analyze(read_from_file({resume!r}), read_from_file({job!r}))
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _time_snippet(snippet: str, runs: int) -> Dict[str, float]:
+    """Run a snippet in fresh interpreters and summarize the reported times."""
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', snippet], cwd=SCRIPTS_DIR,
+                                capture_output=True, text=True, check=True).stdout
+        times.append(float(output.strip().splitlines()[-1]))
+    return {
+        'median_ms': round(statistics.median(times), 2),
+        'min_ms': round(min(times), 2),
+        'max_ms': round(max(times), 2),
+    }
+
+
+def bench_startup(runs: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Measure cold-start costs in fresh interpreters.
+
+    Args:
+        runs: Number of interpreter launches per measurement
+
+    Returns:
+        Timings for the module import and for import + first analyze()
+    """
+    return {
+        'import': _time_snippet(_IMPORT_SNIPPET, runs),
+        'first_analyze_minimal': _time_snippet(
+            _ANALYZE_SNIPPET.format(minimal=True, resume=SAMPLE_RESUME, job=SAMPLE_JOB), runs),
+        'first_analyze_full': _time_snippet(
+            _ANALYZE_SNIPPET.format(minimal=False, resume=SAMPLE_RESUME, job=SAMPLE_JOB), runs),
+    }
+
+
+class CorpusGenerator:
+    """
+    Reproducible synthetic resumes and job descriptions.
+
+    Documents reuse the layout and vocabulary of sample_resume.txt and
+    sample_job_description.txt: bulleted lines of filler words from the
+    samples, with a configurable share of words replaced by dictionary skills.
+    """
+
+    def __init__(self, seed: int = 0, words_per_doc: int = 250, skill_density: float = 0.05):
+        """
+        Initialize the generator.
+
+        Args:
+            seed: Random seed; the same seed always yields the same corpus
+            words_per_doc: Approximate number of words per document
+            skill_density: Fraction of words that are skills (0-1)
+        """
+        self.rng = random.Random(seed)
+        self.words_per_doc = words_per_doc
+        self.skill_density = skill_density
+        self.skills = sorted(SKILL_DICTIONARY)
+        self.headings = {}
+        self.filler = {}
+        for kind, path in (('resume', SAMPLE_RESUME), ('job', SAMPLE_JOB)):
+            text = read_from_file(path)
+            self.headings[kind] = [line for line in text.splitlines() if line.isupper()]
+            words = re.findall(r"[A-Za-z][A-Za-z'-]+", text)
+            self.filler[kind] = [word for word in words if word.lower() not in SKILL_DICTIONARY]
+
+    def document(self, kind: str) -> str:
+        """
+        Generate one document.
+
+        Args:
+            kind: 'resume' or 'job'
+
+        Returns:
+            Document text
+        """
+        rng = self.rng
+        lines = []
+        remaining = self.words_per_doc
+        while remaining > 0:
+            if rng.random() < 0.1:
+                lines.extend(["", rng.choice(self.headings[kind])])
+            length = min(remaining, rng.randint(6, 16))
+            words = []
+            for _ in range(length):
+                if rng.random() < self.skill_density:
+                    skill = rng.choice(self.skills)
+                    words.append(skill.title() if rng.random() < 0.5 else skill)
+                else:
+                    words.append(rng.choice(self.filler[kind]))
+            lines.append("- " + " ".join(words))
+            remaining -= length
+        return "\n".join(lines)
+
+    def corpus(self, n_resumes: int, n_jobs: int) -> Tuple[List[str], List[str]]:
+        """Generate n_resumes resumes and n_jobs job descriptions."""
+        resumes = [self.document('resume') for _ in range(n_resumes)]
+        jobs = [self.document('job') for _ in range(n_jobs)]
+        return resumes, jobs
+
+
+def _time_stage(func: Callable[[], int], repeat: int) -> Dict[str, float]:
+    """Run a stage repeat times; func returns the number of items it processed."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        items = func()
+        times.append(time.perf_counter() - start)
+    seconds = statistics.median(times)
+    return {
+        'seconds': round(seconds, 6),
+        'items': items,
+        'per_item_us': round(seconds / items * 1e6, 3) if items else 0.0,
+        'items_per_second': round(items / seconds, 2) if seconds else 0.0,
+    }
+
+
+def bench_stages(resumes: List[str], jobs: List[str], repeat: int = 3,
+                 minimal: bool = False) -> Dict[str, Dict[str, float]]:
+    """
+    Time each analysis stage separately and end to end.
+
+    Args:
+        resumes: Resume texts
+        jobs: Job description texts
+        repeat: Repetitions per stage (the median is reported)
+        minimal: Benchmark the minimal (no NLTK / scikit-learn) analyzer
+
+    Returns:
+        Timings per stage
+    """
+    analyzer = SkillGapAnalyzer(minimal=minimal)
+    documents = resumes + jobs
+    tokens = [analyzer.preprocessor.preprocess(text) for text in documents]
+    terms = [count_terms(text) for text in documents]
+    pairs = [(resume, job) for resume in resumes for job in jobs]
+
+    def preprocess():
+        for text in documents:
+            analyzer.preprocessor.preprocess(text)
+        return len(documents)
+
+    nltk_preprocessor = TextPreprocessor(minimal=minimal, tokenizer='nltk')
+
+    def preprocess_nltk():
+        for text in documents:
+            nltk_preprocessor.preprocess(text)
+        return len(documents)
+
+    def extract_skills():
+        for doc_tokens, text in zip(tokens, documents):
+            analyzer.skill_extractor.extract_skill_counts(doc_tokens, text)
+        return len(documents)
+
+    fuzzy_extractor = SkillExtractor(analyzer.skill_extractor.skill_dict, fuzzy_threshold=DEFAULT_FUZZY_THRESHOLD)
+
+    def extract_skills_fuzzy():
+        for doc_tokens, text in zip(tokens, documents):
+            fuzzy_extractor.extract_skill_counts(doc_tokens, text)
+        return len(documents)
+
+    dedup_index = DedupIndex()
+
+    def dedup_signature():
+        for text in documents:
+            dedup_index.signature(text)
+        return len(documents)
+
+    def vectorize():
+        for text in documents:
+            count_terms(text)
+        return len(documents)
+
+    def score():
+        resume_terms, job_terms = terms[:len(resumes)], terms[len(resumes):]
+        for resume_counts in resume_terms:
+            for job_counts in job_terms:
+                tfidf_similarity(resume_counts, job_counts, use_numpy=not minimal)
+        return len(pairs)
+
+    hasher = HashingVectorizer()
+    hasher.fit_idf(terms)
+    vectors = [hasher.transform(counts) for counts in terms]
+
+    def hash_vectorize():
+        for counts in terms:
+            hasher.transform(counts)
+        return len(documents)
+
+    def score_hashing():
+        resume_vectors, job_vectors = vectors[:len(resumes)], vectors[len(resumes):]
+        for resume_vector in resume_vectors:
+            for job_vector in job_vectors:
+                hasher.similarity(resume_vector, job_vector)
+        return len(pairs)
+
+    def analyze():
+        for resume, job in pairs:
+            analyzer.analyze(resume, job)
+        return len(pairs)
+
+    def analyze_many():
+        return sum(1 for _ in analyzer.analyze_many(resumes, jobs))
+
+    results = [result for _, _, result in analyzer.analyze_many(resumes, jobs)]
+
+    def serialize():
+        for result in results:
+            result.to_json()
+        return len(results)
+
+    def store_results():
+        with ResultStore(analyzer=analyzer) as store:
+            return store.add_many((str(i), str(i % len(jobs)), result) for i, result in enumerate(results))
+
+    resume_skills = [analyzer.profile(resume).skills for resume in resumes]
+    job_skills = [analyzer.profile(job).skills for job in jobs]
+
+    def skill_gaps():
+        for required in job_skills:
+            for skills in resume_skills:
+                len(skills & required), len(required - skills), len(skills - required)
+        return len(pairs)
+
+    def sketch_skills():
+        analytics = SkillDemandAnalytics(analyzer.skill_extractor)
+        for skills in job_skills:
+            analytics.add_job(skills=skills)
+        for skills in resume_skills:
+            analytics.add_resume(skills=skills)
+        analytics.report()
+        return len(documents)
+
+    stages = {
+        'preprocess': preprocess,
+        'preprocess_nltk': preprocess_nltk,
+        'extract_skills': extract_skills,
+        'extract_skills_fuzzy': extract_skills_fuzzy,
+        'dedup_signature': dedup_signature,
+        'vectorize': vectorize,
+        'score': score,
+        'hash_vectorize': hash_vectorize,
+        'score_hashing': score_hashing,
+        'analyze': analyze,
+        'analyze_many': analyze_many,
+        'serialize': serialize,
+        'store_results': store_results,
+        'skill_gaps': skill_gaps,
+        'sketch_skills': sketch_skills,
+    }
+
+    if not minimal and _optional_import('numpy') is not None:
+        from skill_bitsets import CandidatePool
+
+        pool = CandidatePool(analyzer)
+        for i, skills in enumerate(resume_skills):
+            pool.add_skills(str(i), skills)
+
+        def bitset_gaps():
+            for required in job_skills:
+                pool.gap_counts(required)
+            return len(pairs)
+
+        stages['bitset_gaps'] = bitset_gaps
+    return {name: _time_stage(func, repeat) for name, func in stages.items()}
+
+
+def bench_scoring_accuracy(resumes: List[str], jobs: List[str], minimal: bool = False) -> Dict[str, Dict]:
+    """
+    Compare hashing-engine match percentages with the TF-IDF engine.
+
+    Args:
+        resumes: Resume texts
+        jobs: Job description texts
+        minimal: Use the minimal analyzer for the TF-IDF reference
+
+    Returns:
+        Mean and maximum absolute differences in percentage points, for hashed
+        term frequencies and hashed TF-IDF with IDF statistics over the corpus,
+        against per-pair TF-IDF (analyze) and corpus TF-IDF (score_many)
+    """
+    reference = SkillGapAnalyzer(minimal=minimal)
+    per_pair = [[reference.calculate_match_percentage(resume, job) for job in jobs] for resume in resumes]
+    corpus = reference.score_many(resumes, jobs)
+
+    with_idf = HashingVectorizer()
+    with_idf.fit_idf(count_terms(text) for text in resumes + jobs)
+    engines = {
+        'hashing_tf': SkillGapAnalyzer(minimal=minimal, scoring='hashing'),
+        'hashing_idf': SkillGapAnalyzer(minimal=minimal, scoring='hashing', hasher=with_idf),
+    }
+
+    def differences(scores, expected) -> Dict[str, float]:
+        diffs = [abs(float(a) - float(b)) for row_a, row_b in zip(scores, expected) for a, b in zip(row_a, row_b)]
+        return {'mean_abs_diff': round(statistics.mean(diffs), 3), 'max_abs_diff': round(max(diffs), 3)}
+
+    accuracy = {}
+    for name, analyzer in engines.items():
+        scores = analyzer.score_many(resumes, jobs)
+        accuracy[name] = {
+            'vs_per_pair_tfidf': differences(scores, per_pair),
+            'vs_corpus_tfidf': differences(scores, corpus),
+        }
+    return accuracy
+
+
+def bench_tokenizer_parity(resumes: List[str], jobs: List[str], minimal: bool = False) -> Dict[str, float]:
+    """
+    Check that the regex and NLTK tokenizer engines give the same analyses.
+
+    Args:
+        resumes: Resume texts
+        jobs: Job description texts
+        minimal: Use minimal analyzers
+
+    Returns:
+        Numbers of documents with different skills and pairs with different
+        results (both expected to be 0), and the mean Jaccard similarity of
+        the two engines' token sets
+    """
+    regex = SkillGapAnalyzer(minimal=minimal, tokenizer='regex')
+    nltk = SkillGapAnalyzer(minimal=minimal, tokenizer='nltk')
+    documents = resumes + jobs
+    skill_mismatches = 0
+    agreement = []
+    for text in documents:
+        regex_profile, nltk_profile = regex.profile(text), nltk.profile(text)
+        skill_mismatches += regex_profile.skill_counts != nltk_profile.skill_counts
+        regex_tokens, nltk_tokens = set(regex_profile.tokens), set(nltk_profile.tokens)
+        union = regex_tokens | nltk_tokens
+        agreement.append(len(regex_tokens & nltk_tokens) / len(union) if union else 1.0)
+    result_mismatches = sum(regex.analyze(resume, job) != nltk.analyze(resume, job)
+                            for resume in resumes for job in jobs)
+    return {
+        'documents': len(documents),
+        'skill_mismatches': skill_mismatches,
+        'result_mismatches': result_mismatches,
+        'token_jaccard': round(statistics.mean(agreement), 4),
+    }
+
+
+def bench_peak_memory(resumes: List[str], jobs: List[str], minimal: bool = False) -> float:
+    """Peak traced memory (MB) of analyzing every pair once."""
+    analyzer = SkillGapAnalyzer(minimal=minimal)
+    tracemalloc.start()
+    try:
+        for resume in resumes:
+            for job in jobs:
+                analyzer.analyze(resume, job)
+        return round(tracemalloc.get_traced_memory()[1] / 1e6, 3)
+    finally:
+        tracemalloc.stop()
+
+
+def bench_deadline(budgets_ms: List[float], sizes: List[int], pairs: int = 100, seed: int = 0,
+                   minimal: bool = False) -> Dict[str, Dict[str, Dict]]:
+    """
+    Tail latency and accuracy of deadline-aware analysis across document sizes.
+
+    Args:
+        budgets_ms: Latency budgets to test
+        sizes: Words per document of each synthetic corpus
+        pairs: Resume/job pairs per size
+        seed: Random seed
+        minimal: Benchmark the minimal analyzer
+
+    Returns:
+        Per size and budget: p50, p99 and maximum latency in milliseconds, the
+        share of approximate results, and for those the mean absolute error of
+        the match percentage, the share of the job's skills still found and
+        the mean Jaccard similarity of the missing skills, all against an
+        exact analysis
+    """
+    analyzer = SkillGapAnalyzer(minimal=minimal)
+    results = {}
+    for size in sizes:
+        resumes, jobs = CorpusGenerator(seed, size).corpus(pairs, pairs)
+        exact = [analyzer.analyze(resume, job) for resume, job in zip(resumes, jobs)]
+        by_budget = results[f'{size}_words'] = {}
+        for budget_ms in budgets_ms:
+            latencies, score_errors, recalls, overlaps = [], [], [], []
+            for resume, job, expected in zip(resumes, jobs, exact):
+                start = time.perf_counter()
+                result = analyzer.analyze(resume, job, budget=budget_ms / 1000)
+                latencies.append((time.perf_counter() - start) * 1000)
+                if result.exact:
+                    continue
+                score_errors.append(abs(result['match_percentage'] - expected['match_percentage']))
+                job_skills = set(expected['matched_skills']) | set(expected['missing_skills'])
+                found = (set(result['matched_skills']) | set(result['missing_skills'])) & job_skills
+                recalls.append(len(found) / len(job_skills) if job_skills else 1.0)
+                missing, expected_missing = set(result['missing_skills']), set(expected['missing_skills'])
+                union = missing | expected_missing
+                overlaps.append(len(missing & expected_missing) / len(union) if union else 1.0)
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))]
+            by_budget[f'{budget_ms:g}_ms'] = {
+                'p50_ms': round(statistics.median(latencies), 3),
+                'p99_ms': round(p99, 3),
+                'max_ms': round(latencies[-1], 3),
+                'within_budget': p99 <= budget_ms,
+                'approximate_share': round(len(score_errors) / len(latencies), 3),
+                'score_mean_abs_error': round(statistics.mean(score_errors), 3) if score_errors else 0.0,
+                'job_skill_recall': round(statistics.mean(recalls), 4) if recalls else 1.0,
+                'missing_skills_jaccard': round(statistics.mean(overlaps), 4) if overlaps else 1.0,
+            }
+    return results
+
+
+def compare_to_baseline(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Compare per-stage timings with a baseline run.
+
+    Args:
+        results: Output of the current run
+        baseline: Output of a previous run (same corpus settings)
+        tolerance: Allowed relative slowdown, e.g. 0.1 for 10%
+
+    Returns:
+        Description of every stage that regressed beyond the tolerance
+    """
+    regressions = []
+    print(f"{'stage':<16}{'baseline us':>14}{'current us':>14}{'change':>10}", file=sys.stderr)
+    for name, stage in results['stages'].items():
+        previous = baseline.get('stages', {}).get(name)
+        if not previous or not previous['per_item_us']:
+            continue
+        change = stage['per_item_us'] / previous['per_item_us'] - 1
+        print(f"{name:<16}{previous['per_item_us']:>14}{stage['per_item_us']:>14}{change:>+10.1%}",
+              file=sys.stderr)
+        if change > tolerance:
+            regressions.append(f"{name} is {change:.1%} slower than the baseline")
+    return regressions
+
+
+def bench_run(n_resumes: int, n_jobs: int, words_per_doc: int, skill_density: float,
+              seed: int, repeat: int, minimal: bool) -> Dict:
+    """Generate the corpus and collect every measurement of the run subcommand."""
+    resumes, jobs = CorpusGenerator(seed, words_per_doc, skill_density).corpus(n_resumes, n_jobs)
+    return {
+        'config': {
+            'resumes': n_resumes, 'jobs': n_jobs, 'words_per_doc': words_per_doc,
+            'skill_density': skill_density, 'seed': seed, 'repeat': repeat, 'minimal': minimal,
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'stages': bench_stages(resumes, jobs, repeat, minimal),
+        'scoring_accuracy': bench_scoring_accuracy(resumes, jobs, minimal),
+        'tokenizer_parity': bench_tokenizer_parity(resumes, jobs, minimal),
+        'peak_memory_mb': bench_peak_memory(resumes, jobs, minimal),
+    }
+
+
+def main(argv: List[str] = None):
+    """Parse command-line arguments and run the selected benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the Resume Skill Gap Analyzer.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_corpus_arguments(subparser):
+        subparser.add_argument('--resumes', type=int, default=50, help="Synthetic resumes (default: 50)")
+        subparser.add_argument('--jobs', type=int, default=10, help="Synthetic job descriptions (default: 10)")
+        subparser.add_argument('--words-per-doc', type=int, default=250, help="Words per document (default: 250)")
+        subparser.add_argument('--skill-density', type=float, default=0.05,
+                               help="Fraction of words that are skills (default: 0.05)")
+        subparser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+
+    run = subparsers.add_parser('run', help="Per-stage timings, throughput and peak memory")
+    add_corpus_arguments(run)
+    run.add_argument('--repeat', type=int, default=3, help="Repetitions per stage (default: 3)")
+    run.add_argument('--minimal', action='store_true', help="Benchmark the minimal analyzer")
+    run.add_argument('--output', '-o', default=None, help="Write the results as JSON to this file")
+    run.add_argument('--baseline', default=None, help="Compare with the JSON results of an earlier run")
+    run.add_argument('--tolerance', type=float, default=0.1,
+                     help="Allowed per-stage slowdown vs. the baseline (default: 0.1)")
+
+    corpus = subparsers.add_parser('corpus', help="Write a synthetic corpus as JSONL")
+    add_corpus_arguments(corpus)
+    corpus.add_argument('--output-dir', required=True, help="Directory for resumes.jsonl and jobs.jsonl")
+
+    startup = subparsers.add_parser('startup', help="Import and first-analysis cold-start times")
+    startup.add_argument('--runs', type=int, default=5, help="Interpreter launches per measurement")
+    startup.add_argument('--budget-ms', type=float, default=None,
+                         help="Fail if the median import time exceeds this budget")
+
+    deadline = subparsers.add_parser('deadline', help="Tail latency of analyze() under latency budgets")
+    deadline.add_argument('--budget-ms', type=float, nargs='+', default=[5.0, 20.0, 50.0],
+                          help="Latency budgets (default: 5 20 50)")
+    deadline.add_argument('--sizes', type=int, nargs='+', default=[250, 2500, 25000],
+                          help="Words per document (default: 250 2500 25000)")
+    deadline.add_argument('--pairs', type=int, default=100, help="Pairs per document size (default: 100)")
+    deadline.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+    deadline.add_argument('--minimal', action='store_true', help="Benchmark the minimal analyzer")
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = bench_run(args.resumes, args.jobs, args.words_per_doc, args.skill_density,
+                            args.seed, args.repeat, args.minimal)
+        output = json.dumps(results, indent=2)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+        else:
+            print(output)
+        if args.baseline:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+            if baseline.get('config') != results['config']:
+                print("Warning: baseline was run with different settings", file=sys.stderr)
+            regressions = compare_to_baseline(results, baseline, args.tolerance)
+            for regression in regressions:
+                print(f"❌ {regression}", file=sys.stderr)
+            if regressions:
+                return 1
+    elif args.command == 'corpus':
+        resumes, jobs = CorpusGenerator(args.seed, args.words_per_doc, args.skill_density).corpus(
+            args.resumes, args.jobs)
+        os.makedirs(args.output_dir, exist_ok=True)
+        for name, documents in (('resumes', resumes), ('jobs', jobs)):
+            with open(os.path.join(args.output_dir, f'{name}.jsonl'), 'w', encoding='utf-8') as f:
+                for i, text in enumerate(documents):
+                    f.write(json.dumps({'id': f'{name[:-1]}-{i}', 'text': text}) + '\n')
+    elif args.command == 'startup':
+        results = bench_startup(args.runs)
+        print(json.dumps(results, indent=2))
+        if args.budget_ms is not None and results['import']['median_ms'] > args.budget_ms:
+            print(f"❌ Import took {results['import']['median_ms']} ms, budget is {args.budget_ms} ms",
+                  file=sys.stderr)
+            return 1
+    elif args.command == 'deadline':
+        results = bench_deadline(args.budget_ms, args.sizes, args.pairs, args.seed, args.minimal)
+        print(json.dumps(results, indent=2))
+        overruns = [f"{size}, {budget}: p99 {stats['p99_ms']} ms"
+                    for size, by_budget in results.items()
+                    for budget, stats in by_budget.items() if not stats['within_budget']]
+        for overrun in overruns:
+            print(f"❌ Over budget at {overrun}", file=sys.stderr)
+        if overruns:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
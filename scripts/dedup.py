@@ -0,0 +1,521 @@
+"""
+Near-Duplicate Detection
+MinHash signatures with LSH banding over the preprocessor's token stream, so
+re-submitted resumes and reposted job descriptions can reuse an existing
+analysis instead of going through SkillGapAnalyzer.analyze again.
+
+A document's signature is the minimum of num_perm hash permutations over its
+word shingles. It is computed while the tokens stream past, so memory per
+document is the signature plus one shingle window. The signature is split
+into bands; documents sharing any band bucket are candidates, and a candidate
+whose estimated Jaccard similarity reaches the threshold is a near-duplicate.
+Buckets live in an indexed SQLite table, so a lookup touches only the matching
+buckets however many documents are indexed. The first document of a group is
+its canonical copy; later near-duplicates resolve to it. Each id is stored
+with a digest of its text, so a document changed under a known id is
+resolved (and analyzed) again instead of reusing its old mapping. Ids and
+buckets are scoped by document kind (e.g. 'resume' and 'job'), so a resume
+and a job with the same id never collide or match each other.
+
+Example:
+    with DedupIndex('signatures.sqlite') as index:
+        analyzer = DedupAnalyzer(index)
+        result = analyzer.analyze(resume_text, job_text, resume_id='r1', job_id='j1')
+
+    python scripts/dedup.py scan resumes.jsonl --index signatures.sqlite -o duplicates.jsonl
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import zlib
+from array import array
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from resume_skill_gap_analyzer import (
+    AnalysisResult, SkillGapAnalyzer, TextPreprocessor, iter_file_chunks, _optional_import,
+)
+
+# Permutations are multiply-shift hashes: the top 32 bits of (a * x + b) mod 2**64
+_MASK64 = (1 << 64) - 1
+_MAX_HASH = 0xFFFFFFFF
+
+# Tokens hashed per vectorized batch
+_HASH_BATCH = 2048
+
+# Index rows written between commits
+_COMMIT_EVERY = 1000
+
+# Bump when the database layout changes (part of the stored settings)
+_SCHEMA_VERSION = 3
+
+# Kind of documents indexed without one
+DEFAULT_KIND = 'document'
+
+
+def _digesting(chunks: Iterable[str], digest) -> Iterator[str]:
+    """Pass chunks through, feeding them to a hashlib digest on the way."""
+    for chunk in chunks:
+        digest.update(chunk.encode('utf-8'))
+        yield chunk
+
+
+def content_digest(text: str) -> str:
+    """Digest of a document's text, as stored with its id."""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class MinHasher:
+    """MinHash signatures of word shingles, computed from a token stream."""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        """
+        Args:
+            num_perm: Signature length (hash permutations)
+            shingle_size: Words per shingle
+            seed: Seed of the permutation parameters
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        # Deterministic 64-bit permutation parameters (odd multipliers), identical in every process
+        parameters = [int.from_bytes(hashlib.blake2b(f"{seed}:{i}".encode('ascii'), digest_size=8).digest(),
+                                     'little') for i in range(2 * num_perm)]
+        self.a = [value | 1 for value in parameters[:num_perm]]
+        self.b = parameters[num_perm:]
+        self._np = _optional_import('numpy')
+        if self._np is not None:
+            self._a = self._np.array(self.a, dtype=self._np.uint64)
+            self._b = self._np.array(self.b, dtype=self._np.uint64)
+
+    def _shingle_hashes(self, tokens: Iterable[str]) -> Iterator[int]:
+        """32-bit hashes of the word shingles of a token stream."""
+        size = self.shingle_size
+        window = deque(maxlen=size)
+        seen = 0
+        for token in tokens:
+            window.append(zlib.crc32(token.encode('utf-8')))
+            seen += 1
+            if seen >= size:
+                value = 0
+                for token_hash in window:
+                    value = (value * 0x01000193 + token_hash) & _MAX_HASH
+                yield value
+        if 0 < seen < size:
+            # Shorter than one shingle: the whole document is the shingle
+            value = 0
+            for token_hash in window:
+                value = (value * 0x01000193 + token_hash) & _MAX_HASH
+            yield value
+
+    def signature(self, tokens: Iterable[str]) -> array:
+        """
+        Compute the signature of a token stream.
+
+        Args:
+            tokens: Processed tokens (e.g. TextPreprocessor.iter_tokens)
+
+        Returns:
+            array('I') of num_perm minimum hash values (all 0xFFFFFFFF when empty)
+        """
+        hashes = self._shingle_hashes(tokens)
+        if self._np is None:
+            signature = [_MAX_HASH] * self.num_perm
+            pairs = list(zip(self.a, self.b))
+            for value in hashes:
+                for i, (a, b) in enumerate(pairs):
+                    permuted = ((a * value + b) & _MASK64) >> 32
+                    if permuted < signature[i]:
+                        signature[i] = permuted
+            return array('I', signature)
+
+        np = self._np
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # Token hashes of the current batch; each batch after the first starts
+        # with the last shingle_size - 1 tokens of the previous one
+        size = self.shingle_size
+        tokens = iter(tokens)
+        carry = []
+        flushed = False
+        while True:
+            chunk = list(islice(tokens, _HASH_BATCH))
+            if not chunk:
+                break
+            batch = carry + [zlib.crc32(token.encode('utf-8')) for token in chunk]
+            if len(batch) >= size:
+                self._update(signature, self._combine(batch, size))
+                carry = batch[len(batch) - size + 1:]
+                flushed = True
+            else:
+                carry = batch
+        if carry and not flushed:
+            # Shorter than one shingle: the whole document is the shingle
+            self._update(signature, self._combine(carry, len(carry)))
+        return array('I', signature.astype(np.uint32).tobytes())
+
+    def _combine(self, token_hashes: List[int], size: int):
+        """Shingle hashes of consecutive token hashes (as in _shingle_hashes)."""
+        np = self._np
+        values = np.array(token_hashes, dtype=np.uint64)
+        count = len(values) - size + 1
+        shingles = np.zeros(count, dtype=np.uint64)
+        for offset in range(size):
+            shingles = (shingles * np.uint64(0x01000193) + values[offset:offset + count]) & np.uint64(_MAX_HASH)
+        return shingles
+
+    def _update(self, signature, shingles):
+        """Fold a batch of shingle hashes into the running minimum."""
+        np = self._np
+        # uint64 arithmetic wraps around, which is the mod 2**64 of the hash
+        permuted = (self._a * shingles[:, None] + self._b) >> np.uint64(32)
+        np.minimum(signature, permuted.min(axis=0), out=signature)
+
+    @staticmethod
+    def similarity(signature_a: array, signature_b: array) -> float:
+        """Estimated Jaccard similarity: the fraction of equal signature values."""
+        if not signature_a:
+            return 0.0
+        return sum(a == b for a, b in zip(signature_a, signature_b)) / len(signature_a)
+
+
+class DedupIndex:
+    """Persisted LSH index of MinHash signatures (SQLite)."""
+
+    def __init__(self, path: str = ':memory:', num_perm: int = 128, bands: int = 16,
+                 threshold: float = 0.8, shingle_size: int = 3, preprocessor: TextPreprocessor = None):
+        """
+        Open or create an index.
+
+        With 128 permutations in 16 bands of 8 rows, pairs at 0.8 Jaccard
+        similarity become candidates 95% of the time and pairs below 0.5
+        less than 7% of the time.
+
+        Args:
+            path: SQLite database file (':memory:' for a temporary index)
+            num_perm: Signature length; must be a multiple of bands
+            bands: LSH bands
+            threshold: Minimum estimated Jaccard similarity of a near-duplicate
+            shingle_size: Words per shingle
+            preprocessor: Token source (default: the minimal preprocessor, whose
+                built-in stop words keep signatures independent of NLTK)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.path = path
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.preprocessor = preprocessor or TextPreprocessor(minimal=True)
+        self.hasher = MinHasher(num_perm, shingle_size)
+        self._pending = 0
+
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS documents (kind TEXT, doc_id TEXT, signature BLOB NOT NULL, digest TEXT,
+                                                  PRIMARY KEY (kind, doc_id));
+            CREATE TABLE IF NOT EXISTS buckets (bucket INTEGER, kind TEXT, doc_id TEXT);
+            CREATE INDEX IF NOT EXISTS buckets_by_key ON buckets (bucket);
+            CREATE TABLE IF NOT EXISTS duplicates (kind TEXT, doc_id TEXT, canonical_id TEXT, similarity REAL,
+                                                   digest TEXT, PRIMARY KEY (kind, doc_id));
+            CREATE INDEX IF NOT EXISTS duplicates_by_canonical ON duplicates (kind, canonical_id);
+        """)
+        settings = json.dumps({'schema': _SCHEMA_VERSION, 'num_perm': num_perm, 'bands': bands, 'shingle_size': shingle_size,
+                               'seed': self.hasher.seed, 'tokenizer': self.preprocessor.tokenizer})
+        stored = self.conn.execute("SELECT value FROM meta WHERE key = 'settings'").fetchone()
+        if stored is None:
+            self.conn.execute("INSERT INTO meta VALUES ('settings', ?)", (settings,))
+            self.conn.commit()
+        elif stored[0] != settings:
+            raise ValueError(f"{path} was built with different settings: {stored[0]}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of canonical documents."""
+        return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def signature(self, text: str = None, chunks: Iterable[str] = None) -> array:
+        """
+        Signature of a document given as text or as a stream of chunks.
+
+        Args:
+            text: Document text
+            chunks: Iterable of text chunks (e.g. from iter_file_chunks)
+
+        Returns:
+            MinHash signature
+        """
+        if chunks is None:
+            chunks = (text or '',)
+        return self.hasher.signature(self.preprocessor.iter_tokens(chunks))
+
+    def _band_keys(self, signature: array, kind: str) -> List[int]:
+        """Bucket of each band: a signed 64-bit hash of the kind, the band number and its values."""
+        data = signature.tobytes()
+        width = self.rows * signature.itemsize
+        prefix = kind.encode('utf-8') + b'\0'
+        return [int.from_bytes(hashlib.blake2b(prefix + data[band * width:(band + 1) * width], digest_size=8,
+                                               person=band.to_bytes(2, 'little')).digest(),
+                               'little', signed=True)
+                for band in range(self.bands)]
+
+    def query(self, signature: array, kind: str = DEFAULT_KIND) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar indexed document of a kind.
+
+        Args:
+            signature: MinHash signature
+            kind: Document kind to search
+
+        Returns:
+            (doc_id, estimated similarity) of the best near-duplicate at or above
+            the threshold, or None
+        """
+        # One integer key per band, so the IN list is a set of index lookups
+        keys = self._band_keys(signature, kind)
+        candidates = self.conn.execute(
+            f"SELECT DISTINCT d.doc_id, d.signature FROM buckets b "
+            f"JOIN documents d ON d.kind = b.kind AND d.doc_id = b.doc_id "
+            f"WHERE b.bucket IN ({', '.join('?' * len(keys))}) AND b.kind = ?", keys + [kind]).fetchall()
+        best = None
+        for doc_id, blob in candidates:
+            other = array('I')
+            other.frombytes(blob)
+            score = MinHasher.similarity(signature, other)
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (doc_id, score)
+        return best
+
+    def add(self, doc_id: str, signature: array, digest: str = None, kind: str = DEFAULT_KIND):
+        """
+        Index a document as a canonical copy.
+
+        Args:
+            doc_id: Document identifier (unique within its kind)
+            signature: MinHash signature
+            digest: content_digest of its text (without one, resolve treats
+                the document as changed the next time it is seen)
+            kind: Document kind
+        """
+        if self.conn.execute("SELECT 1 FROM documents WHERE kind = ? AND doc_id = ?", (kind, doc_id)).fetchone():
+            # Re-indexing is rare; buckets are keyed for lookup, not by document
+            self.conn.execute("DELETE FROM buckets WHERE kind = ? AND doc_id = ?", (kind, doc_id))
+        self.conn.execute("INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+                          (kind, doc_id, signature.tobytes(), digest))
+        self.conn.executemany("INSERT INTO buckets VALUES (?, ?, ?)",
+                              [(bucket, kind, doc_id) for bucket in self._band_keys(signature, kind)])
+        self._written()
+
+    def resolve(self, doc_id: str, text: str = None, chunks: Iterable[str] = None,
+                kind: str = DEFAULT_KIND) -> Tuple[str, float]:
+        """
+        Map a document to its canonical copy of the same kind, indexing it if it has none.
+
+        Args:
+            doc_id: Document identifier (unique within its kind)
+            text: Document text
+            chunks: Document as a stream of chunks instead of text
+            kind: Document kind, e.g. 'resume' or 'job'
+
+        Returns:
+            (canonical doc_id, estimated similarity); (doc_id, 1.0) for a new
+            or already indexed document
+        """
+        key = (kind, doc_id)
+        known = self.conn.execute("SELECT canonical_id, similarity, digest FROM duplicates "
+                                  "WHERE kind = ? AND doc_id = ?", key).fetchone()
+        indexed = self.conn.execute("SELECT digest FROM documents WHERE kind = ? AND doc_id = ?", key).fetchone()
+        if chunks is None:
+            # Whole text at hand: check it before computing a signature
+            digest = content_digest(text or '')
+            signature = None
+        else:
+            hasher = hashlib.sha1()
+            signature = self.signature(chunks=_digesting(chunks, hasher))
+            digest = hasher.hexdigest()
+        if known is not None and known[2] == digest:
+            return known[0], known[1]
+        if indexed is not None and indexed[0] == digest:
+            return doc_id, 1.0
+
+        # New, or changed since it was last seen: drop what was derived from the old text
+        if known is not None:
+            self.conn.execute("DELETE FROM duplicates WHERE kind = ? AND doc_id = ?", key)
+        if indexed is not None:
+            self.conn.execute("DELETE FROM documents WHERE kind = ? AND doc_id = ?", key)
+            self.conn.execute("DELETE FROM buckets WHERE kind = ? AND doc_id = ?", key)
+            # Its near-duplicates matched the old text; they are resolved again when next seen
+            self.conn.execute("DELETE FROM duplicates WHERE kind = ? AND canonical_id = ?", key)
+        if signature is None:
+            signature = self.signature(text)
+        match = self.query(signature, kind)
+        if match is None:
+            self.add(doc_id, signature, digest, kind)
+            return doc_id, 1.0
+        self.conn.execute("INSERT OR REPLACE INTO duplicates VALUES (?, ?, ?, ?, ?)",
+                          (kind, doc_id, match[0], match[1], digest))
+        self._written()
+        return match
+
+    def digest(self, doc_id: str, kind: str = DEFAULT_KIND) -> Optional[str]:
+        """content_digest of an indexed canonical document (None if unknown)."""
+        row = self.conn.execute("SELECT digest FROM documents WHERE kind = ? AND doc_id = ?",
+                                (kind, doc_id)).fetchone()
+        return row[0] if row is not None else None
+
+    def _written(self):
+        """Commit after every _COMMIT_EVERY writes."""
+        self._pending += 1
+        if self._pending >= _COMMIT_EVERY:
+            self.commit()
+
+    def commit(self):
+        """Write pending changes to the database file."""
+        self.conn.commit()
+        self._pending = 0
+
+    def close(self):
+        """Commit and close the database."""
+        if self.conn is not None:
+            self.commit()
+            self.conn.close()
+            self.conn = None
+
+
+class DedupAnalyzer:
+    """
+    SkillGapAnalyzer front end that analyzes each canonical pair only once.
+
+    Both documents are resolved to their canonical copies; the analysis of the
+    canonical pair is stored in the index database (as AnalysisResult.to_bytes,
+    keyed by the digests of the canonical texts, so it is never reused after
+    a canonical document changes) and returned for every near-duplicate pair. A reused result describes the
+    canonical documents, which differ from the given ones by at most the
+    index threshold.
+    """
+
+    def __init__(self, index: DedupIndex, analyzer: SkillGapAnalyzer = None):
+        """
+        Args:
+            index: Near-duplicate index (also stores the analyses)
+            analyzer: Analyzer for new canonical pairs
+        """
+        self.index = index
+        self.analyzer = analyzer or SkillGapAnalyzer()
+        self.reused = 0
+        self.analyzed = 0
+        index.conn.execute("CREATE TABLE IF NOT EXISTS analyses (resume_digest TEXT, job_digest TEXT, "
+                           "result BLOB, PRIMARY KEY (resume_digest, job_digest))")
+
+    def analyze(self, resume_text: str, job_desc_text: str, resume_id: str = None,
+                job_id: str = None) -> AnalysisResult:
+        """
+        Analyze a pair, reusing the analysis of a near-duplicate pair when one exists.
+
+        Args:
+            resume_text: Candidate's resume text
+            job_desc_text: Job description text
+            resume_id: Resume identifier (default: hash of the text)
+            job_id: Job identifier (default: hash of the text)
+
+        Returns:
+            AnalysisResult
+        """
+        if not resume_text or not resume_text.strip():
+            raise ValueError("Resume text cannot be empty")
+        if not job_desc_text or not job_desc_text.strip():
+            raise ValueError("Job description text cannot be empty")
+        resume_canonical, _ = self.index.resolve(resume_id or content_digest(resume_text), resume_text,
+                                                 kind='resume')
+        job_canonical, _ = self.index.resolve(job_id or content_digest(job_desc_text), job_desc_text, kind='job')
+        resume_key = self.index.digest(resume_canonical, 'resume')
+        job_key = self.index.digest(job_canonical, 'job')
+
+        table = self.analyzer.skill_table
+        stored = self.index.conn.execute("SELECT result FROM analyses WHERE resume_digest = ? AND job_digest = ?",
+                                         (resume_key, job_key)).fetchone()
+        if stored is not None:
+            try:
+                result = AnalysisResult.from_bytes(stored[0], table)
+                self.reused += 1
+                return result
+            except ValueError:
+                pass  # Written with another skill table; analyze again
+
+        result = self.analyzer.analyze(resume_text, job_desc_text)
+        self.index.conn.execute("INSERT OR REPLACE INTO analyses VALUES (?, ?, ?)",
+                                (resume_key, job_key, result.to_bytes()))
+        self.index._written()
+        self.analyzed += 1
+        return result
+
+
+def main(argv: List[str] = None):
+    """Find near-duplicate documents and keep their signatures in an index."""
+    from batch_analyze import iter_documents
+
+    parser = argparse.ArgumentParser(description="Detect near-duplicate resumes or job descriptions.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    scan_parser = subparsers.add_parser('scan', help="Resolve documents against the index, adding new ones")
+    scan_parser.add_argument('documents', help="Directory or JSONL file of documents")
+    scan_parser.add_argument('--index', required=True, help="SQLite index file (created if missing)")
+    scan_parser.add_argument('--threshold', type=float, default=0.8,
+                             help="Minimum estimated Jaccard similarity (default: 0.8)")
+    scan_parser.add_argument('--kind', default=DEFAULT_KIND,
+                             help=f"Document kind, e.g. resume or job; ids are unique per kind (default: {DEFAULT_KIND})")
+    scan_parser.add_argument('--output', '-o', default=None,
+                             help="Write {id, duplicate_of, similarity} JSONL for each duplicate")
+
+    check_parser = subparsers.add_parser('check', help="Look up one file without indexing it")
+    check_parser.add_argument('file', help="Document file")
+    check_parser.add_argument('--index', required=True, help="SQLite index file")
+    check_parser.add_argument('--threshold', type=float, default=0.8,
+                              help="Minimum estimated Jaccard similarity (default: 0.8)")
+    check_parser.add_argument('--kind', default=DEFAULT_KIND,
+                              help=f"Document kind to search (default: {DEFAULT_KIND})")
+    args = parser.parse_args(argv)
+
+    try:
+        with DedupIndex(args.index, threshold=args.threshold) as index:
+            if args.command == 'check':
+                match = index.query(index.signature(chunks=iter_file_chunks(args.file)), args.kind)
+                if match is None:
+                    print("✅ No near-duplicate indexed")
+                else:
+                    print(f"✅ Near-duplicate of {match[0]} (similarity {match[1]:.2f})")
+                return 0
+
+            out = open(args.output, 'w', encoding='utf-8') if args.output else None
+            documents = duplicates = 0
+            try:
+                for doc_id, text in iter_documents(args.documents):
+                    canonical_id, similarity = index.resolve(doc_id, text, kind=args.kind)
+                    documents += 1
+                    if canonical_id != doc_id:
+                        duplicates += 1
+                        if out is not None:
+                            out.write(json.dumps({'id': doc_id, 'duplicate_of': canonical_id,
+                                                  'similarity': similarity}) + '\n')
+            finally:
+                if out is not None:
+                    out.close()
+            print(f"✅ {documents} documents, {duplicates} near-duplicates, "
+                  f"{len(index)} canonical documents indexed", file=sys.stderr)
+    except (ValueError, FileNotFoundError, sqlite3.Error) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
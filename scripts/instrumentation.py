@@ -0,0 +1,246 @@
+"""
+Instrumentation for the Resume Skill Gap Analyzer.
+
+Attach an Instrumentation to a SkillGapAnalyzer to record wall time, CPU time
+and (optionally) allocated bytes for every analysis stage: clean, tokenize,
+remove_stopwords, skill_scan, vectorize, similarity, compare, top_skills and
+recommendations. Hooks receive every stage measurement as it happens, sampled
+requests can be captured with cProfile/tracemalloc, and the aggregated
+metrics can be exported as JSON or in the Prometheus text format.
+
+Example:
+    metrics = Instrumentation(profile_sample_rate=0.01, profile_dir='profiles')
+    analyzer = SkillGapAnalyzer(instrumentation=metrics)
+    ...
+    print(metrics.to_prometheus())
+"""
+
+import contextlib
+import json
+import os
+import random
+import threading
+import time
+from typing import Callable, Dict, List
+
+# Hook signature: hook(stage, wall_seconds, cpu_seconds, allocated_bytes)
+StageHook = Callable[[str, float, float, int], None]
+
+
+class StageMetrics:
+    """Running totals for one stage."""
+
+    __slots__ = ('calls', 'wall_seconds', 'cpu_seconds', 'max_wall_seconds', 'allocated_bytes')
+
+    def __init__(self):
+        self.calls = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.max_wall_seconds = 0.0
+        self.allocated_bytes = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        """Return the totals as a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Instrumentation:
+    """Collects per-stage metrics from a SkillGapAnalyzer."""
+
+    def __init__(self, track_allocations: bool = False, profile_sample_rate: float = 0.0,
+                 profile_dir: str = None, hooks: List[StageHook] = None):
+        """
+        Initialize the collector.
+
+        Args:
+            track_allocations: Record bytes allocated per stage with tracemalloc
+                (starts tracing, which slows the process down noticeably)
+            profile_sample_rate: Fraction of requests (0-1) to capture with cProfile
+            profile_dir: Directory for captures (required if sampling is enabled)
+            hooks: Callables invoked with every stage measurement
+        """
+        if profile_sample_rate and not profile_dir:
+            raise ValueError("profile_dir is required when profile_sample_rate is set")
+        self.track_allocations = track_allocations
+        self.profile_sample_rate = profile_sample_rate
+        self.profile_dir = profile_dir
+        self.hooks = list(hooks or [])
+        self.stages: Dict[str, StageMetrics] = {}
+        self.requests: Dict[str, StageMetrics] = {}
+        self.captures = 0
+        self._lock = threading.Lock()
+        self._tracemalloc = None
+        if track_allocations:
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+
+    def add_hook(self, hook: StageHook):
+        """
+        Register a callable invoked with every stage measurement.
+
+        Args:
+            hook: Called as hook(stage, wall_seconds, cpu_seconds, allocated_bytes)
+        """
+        self.hooks.append(hook)
+
+    def _record(self, table: Dict[str, StageMetrics], name: str, wall: float, cpu: float, allocated: int):
+        """Add one measurement to a metrics table."""
+        with self._lock:
+            metrics = table.get(name)
+            if metrics is None:
+                metrics = table[name] = StageMetrics()
+            metrics.calls += 1
+            metrics.wall_seconds += wall
+            metrics.cpu_seconds += cpu
+            metrics.allocated_bytes += allocated
+            if wall > metrics.max_wall_seconds:
+                metrics.max_wall_seconds = wall
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """
+        Measure one analysis stage.
+
+        Args:
+            name: Stage name
+        """
+        tracemalloc = self._tracemalloc
+        allocated_before = tracemalloc.get_traced_memory()[0] if tracemalloc else 0
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            allocated = max(0, tracemalloc.get_traced_memory()[0] - allocated_before) if tracemalloc else 0
+            self._record(self.stages, name, wall, cpu, allocated)
+            for hook in self.hooks:
+                hook(name, wall, cpu, allocated)
+
+    @contextlib.contextmanager
+    def request(self, name: str):
+        """
+        Measure a whole request, capturing a cProfile run for sampled ones.
+
+        Args:
+            name: Request type, e.g. 'analyze'
+        """
+        profiler = None
+        if self.profile_sample_rate and random.random() < self.profile_sample_rate:
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            self._record(self.requests, name, wall, cpu, 0)
+            if profiler is not None:
+                profiler.disable()
+                self._save_capture(name, profiler)
+
+    def _save_capture(self, name: str, profiler):
+        """Write a cProfile capture (and a tracemalloc snapshot, if tracing)."""
+        with self._lock:
+            self.captures += 1
+            capture_id = self.captures
+        prefix = os.path.join(self.profile_dir, f"{name}-{int(time.time())}-{os.getpid()}-{capture_id}")
+        profiler.dump_stats(prefix + '.prof')
+        if self._tracemalloc is not None:
+            self._tracemalloc.take_snapshot().dump(prefix + '.tracemalloc')
+
+    def reset(self):
+        """Clear all collected metrics."""
+        with self._lock:
+            self.stages.clear()
+            self.requests.clear()
+
+    def to_dict(self) -> Dict:
+        """Return all collected metrics as a dictionary."""
+        with self._lock:
+            return {
+                'stages': {name: metrics.to_dict() for name, metrics in self.stages.items()},
+                'requests': {name: metrics.to_dict() for name, metrics in self.requests.items()},
+                'captures': self.captures,
+            }
+
+    def to_json(self) -> str:
+        """Export the collected metrics as JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self, prefix: str = 'skill_gap') -> str:
+        """
+        Export the collected metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Metrics text
+        """
+        series = (
+            ('calls', 'calls_total', "Number of times the {kind} ran"),
+            ('wall_seconds', 'seconds_total', "Wall time spent in the {kind}"),
+            ('cpu_seconds', 'cpu_seconds_total', "CPU time spent in the {kind}"),
+            ('max_wall_seconds', 'max_seconds', "Slowest single run of the {kind}"),
+            ('allocated_bytes', 'allocated_bytes_total', "Bytes allocated in the {kind} (if tracked)"),
+        )
+        data = self.to_dict()
+        lines = []
+        for kind, label in (('stages', 'stage'), ('requests', 'request')):
+            for field, suffix, help_text in series:
+                metric = f"{prefix}_{label}_{suffix}"
+                metric_type = 'gauge' if field == 'max_wall_seconds' else 'counter'
+                lines.append(f"# HELP {metric} {help_text.format(kind=label)}")
+                lines.append(f"# TYPE {metric} {metric_type}")
+                for name, values in sorted(data[kind].items()):
+                    lines.append(f'{metric}{{{label}="{name}"}} {values[field]}')
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9108, host: str = '127.0.0.1'):
+        """
+        Serve the metrics over HTTP in a background thread.
+
+        GET /metrics returns the Prometheus text format, GET /metrics.json the JSON.
+
+        Args:
+            port: Port to listen on
+            host: Interface to bind (local only by default)
+
+        Returns:
+            The running server; call shutdown() to stop it
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        instrumentation = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body, content_type = instrumentation.to_prometheus(), 'text/plain; version=0.0.4'
+                elif self.path == '/metrics.json':
+                    body, content_type = instrumentation.to_json(), 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                payload = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
@@ -0,0 +1,292 @@
+"""
+Job Index
+Top-k job retrieval for a resume over a large, incrementally updated corpus
+of job descriptions.
+
+Every job is profiled once when it is added. The index keeps an inverted index
+from skills to jobs and an L2-normalized sparse TF-IDF vector per job, with
+IDF weights taken from the whole indexed corpus. A query prunes candidates
+through the resume's skill postings, ranks the shortlist by cosine similarity
+and runs the full gap analysis only on the best k jobs. Postings are counted
+with NumPy when it is available (and the analyzer is not in minimal mode).
+
+Example:
+    python scripts/job_index.py --jobs jobs.jsonl --resume resume.txt -k 10
+"""
+
+import argparse
+import heapq
+import json
+import math
+import pickle
+import sys
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from resume_skill_gap_analyzer import SkillGapAnalyzer, DocumentProfile, read_from_file, _optional_import
+
+
+class JobIndex:
+    """Inverted skill index plus TF-IDF vectors for fast top-k job retrieval."""
+
+    def __init__(self, analyzer: SkillGapAnalyzer = None, shortlist_size: int = 200,
+                 reweight_threshold: float = 0.1):
+        """
+        Initialize an empty index.
+
+        Args:
+            analyzer: Analyzer used to profile documents (default: a new one)
+            shortlist_size: Candidates kept after skill-based pruning
+            reweight_threshold: Relative corpus growth or shrinkage after which
+                all job vectors are recomputed with fresh IDF weights
+        """
+        self.analyzer = analyzer or SkillGapAnalyzer()
+        self.shortlist_size = shortlist_size
+        self.reweight_threshold = reweight_threshold
+        self._profiles: Dict[str, DocumentProfile] = {}
+        self._vectors: Dict[str, Dict[str, float]] = {}
+        # Postings hold integer slots so they can be counted as arrays
+        self._slots: Dict[str, int] = {}
+        self._job_ids: List[str] = []
+        self._skill_totals: List[int] = []
+        self._free_slots: List[int] = []
+        self._skill_postings: Dict[str, set] = {}
+        self._document_frequency = Counter()
+        self._weighted_size = 0
+        # NumPy views of the postings and skill totals, rebuilt after changes
+        self._posting_arrays = {}
+        self._totals_array = None
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._profiles
+
+    def add(self, job_id: str, job_desc_text: str):
+        """
+        Add or replace a job posting.
+
+        Args:
+            job_id: Unique job identifier
+            job_desc_text: Job description text
+        """
+        if not job_desc_text or not job_desc_text.strip():
+            raise ValueError("Job description text cannot be empty")
+        if job_id in self._profiles:
+            self.remove(job_id)
+
+        # Tokens are not needed for retrieval or gap analysis
+        profile = self.analyzer.profile(job_desc_text)._replace(tokens=())
+        self._profiles[job_id] = profile
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._job_ids[slot] = job_id
+            self._skill_totals[slot] = len(profile.skills)
+        else:
+            slot = len(self._job_ids)
+            self._job_ids.append(job_id)
+            self._skill_totals.append(len(profile.skills))
+        self._slots[job_id] = slot
+        for skill in profile.skills:
+            self._skill_postings.setdefault(skill, set()).add(slot)
+            self._posting_arrays.pop(skill, None)
+        self._totals_array = None
+        self._document_frequency.update(profile.term_counts.keys())
+        self._vectors[job_id] = self._weigh(profile.term_counts)
+
+    def remove(self, job_id: str):
+        """
+        Remove a job posting.
+
+        Args:
+            job_id: Identifier passed to add()
+        """
+        profile = self._profiles.pop(job_id, None)
+        if profile is None:
+            raise KeyError(job_id)
+        del self._vectors[job_id]
+        slot = self._slots.pop(job_id)
+        self._job_ids[slot] = None
+        self._skill_totals[slot] = 0
+        self._free_slots.append(slot)
+        for skill in profile.skills:
+            postings = self._skill_postings[skill]
+            postings.discard(slot)
+            self._posting_arrays.pop(skill, None)
+            if not postings:
+                del self._skill_postings[skill]
+        self._totals_array = None
+        self._document_frequency.subtract(profile.term_counts.keys())
+        for term in profile.term_counts:
+            if self._document_frequency[term] <= 0:
+                del self._document_frequency[term]
+
+    def _idf(self, term: str) -> float:
+        """Smoothed IDF, as computed by scikit-learn's TfidfTransformer."""
+        corpus_size = len(self._profiles)
+        return math.log((1 + corpus_size) / (1 + self._document_frequency[term])) + 1
+
+    def _weigh(self, term_counts: Dict[str, int]) -> Dict[str, float]:
+        """Turn term counts into an L2-normalized TF-IDF vector over the indexed vocabulary."""
+        vector = {term: count * self._idf(term) for term, count in term_counts.items()
+                  if term in self._document_frequency}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if not norm:
+            return {}
+        return {term: weight / norm for term, weight in vector.items()}
+
+    def reweight(self):
+        """Recompute every job vector with the current IDF weights."""
+        self._vectors = {job_id: self._weigh(profile.term_counts)
+                         for job_id, profile in self._profiles.items()}
+        self._weighted_size = len(self._profiles)
+
+    def _maybe_reweight(self):
+        """Reweight when the corpus size has drifted past the threshold."""
+        drift = abs(len(self._profiles) - self._weighted_size)
+        if drift > self.reweight_threshold * max(self._weighted_size, 1):
+            self.reweight()
+
+    def candidates(self, skills) -> List[str]:
+        """
+        Prune the corpus to the jobs sharing the most skills with a resume.
+
+        Args:
+            skills: Skills found in the resume
+
+        Returns:
+            Up to shortlist_size job ids, best skill coverage first
+        """
+        skills = [skill for skill in skills if skill in self._skill_postings]
+        if not skills:
+            return []
+        np = None if self.analyzer.minimal else _optional_import('numpy')
+        if np is not None:
+            return self._candidates_numpy(np, skills)
+
+        shared = Counter()
+        for skill in skills:
+            shared.update(self._skill_postings[skill])
+        if len(shared) > self.shortlist_size:
+            # Only jobs sharing at least as many skills as the shortlist_size-th
+            # best one can make the shortlist; skip ranking everything else
+            histogram = Counter(shared.values())
+            kept = 0
+            for threshold in sorted(histogram, reverse=True):
+                kept += histogram[threshold]
+                if kept >= self.shortlist_size:
+                    break
+            shared = {slot: count for slot, count in shared.items() if count >= threshold}
+
+        totals = self._skill_totals
+        best = heapq.nlargest(self.shortlist_size, shared, key=lambda slot: (
+            shared[slot], shared[slot] / totals[slot]))
+        return [self._job_ids[slot] for slot in best]
+
+    def _candidates_numpy(self, np, skills: List[str]) -> List[str]:
+        """Vectorized version of candidates() over the slot arrays."""
+        for skill in skills:
+            if skill not in self._posting_arrays:
+                self._posting_arrays[skill] = np.fromiter(self._skill_postings[skill], dtype=np.int64)
+        if self._totals_array is None:
+            self._totals_array = np.maximum(np.array(self._skill_totals, dtype=np.float64), 1)
+
+        shared = np.bincount(np.concatenate([self._posting_arrays[skill] for skill in skills]),
+                             minlength=len(self._job_ids))
+        # Shared skill count first, then coverage (kept below 1 so it only breaks ties)
+        score = shared + shared / self._totals_array / 2
+        slots = np.flatnonzero(shared)
+        if len(slots) > self.shortlist_size:
+            slots = slots[np.argpartition(-score[slots], self.shortlist_size - 1)[:self.shortlist_size]]
+        slots = slots[np.argsort(-score[slots], kind='stable')]
+        return [self._job_ids[slot] for slot in slots]
+
+    def top_k(self, resume_text: str, k: int = 10) -> List[Tuple[str, Dict]]:
+        """
+        Find the best matching jobs for a resume.
+
+        Args:
+            resume_text: Candidate's resume text
+            k: Number of jobs to return
+
+        Returns:
+            Up to k (job_id, analysis results) pairs, best match first. Match
+            percentages use corpus-wide IDF weights, so they are comparable
+            across jobs but differ from the per-pair scores of analyze().
+        """
+        if not resume_text or not resume_text.strip():
+            raise ValueError("Resume text cannot be empty")
+        self._maybe_reweight()
+
+        resume_profile = self.analyzer.profile(resume_text)
+        resume_vector = self._weigh(resume_profile.term_counts)
+        shortlist = self.candidates(resume_profile.skills)
+
+        scored = []
+        for job_id in shortlist:
+            job_vector = self._vectors[job_id]
+            similarity = sum(weight * job_vector.get(term, 0.0) for term, weight in resume_vector.items())
+            scored.append((similarity, job_id))
+
+        results = []
+        for similarity, job_id in heapq.nlargest(k, scored):
+            match_percentage = round(similarity * 100, 2)
+            results.append((job_id, self.analyzer._build_result(
+                resume_profile, self._profiles[job_id], match_percentage)))
+        return results
+
+    def save(self, filename: str):
+        """
+        Save the index contents (not the analyzer) to a file.
+
+        Args:
+            filename: Output path
+        """
+        state = (self._profiles, self._vectors, self._slots, self._job_ids, self._skill_totals,
+                 self._free_slots, self._skill_postings, self._document_frequency, self._weighted_size)
+        with open(filename, 'wb') as f:
+            pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+
+    def load(self, filename: str):
+        """
+        Replace the index contents with those saved by save().
+
+        Args:
+            filename: Path written by save()
+        """
+        with open(filename, 'rb') as f:
+            (self._profiles, self._vectors, self._slots, self._job_ids, self._skill_totals,
+             self._free_slots, self._skill_postings, self._document_frequency,
+             self._weighted_size) = pickle.load(f)
+        self._posting_arrays = {}
+        self._totals_array = None
+
+
+def main(argv: List[str] = None):
+    """Index a set of jobs and print the best matches for a resume."""
+    from batch_analyze import iter_documents
+
+    parser = argparse.ArgumentParser(description="Find the best matching jobs for a resume.")
+    parser.add_argument('--jobs', required=True, help="Directory or JSONL file of job descriptions")
+    parser.add_argument('--resume', required=True, help="Resume text file")
+    parser.add_argument('-k', type=int, default=10, help="Number of jobs to return (default: 10)")
+    parser.add_argument('--minimal', action='store_true', help="Analyze without NLTK or scikit-learn")
+    args = parser.parse_args(argv)
+
+    try:
+        index = JobIndex(SkillGapAnalyzer(minimal=args.minimal))
+        for job_id, text in iter_documents(args.jobs):
+            index.add(job_id, text)
+        matches = index.top_k(read_from_file(args.resume), args.k)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    for job_id, result in matches:
+        print(json.dumps({'job_id': job_id, **result}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
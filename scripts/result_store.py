@@ -0,0 +1,392 @@
+"""
+Result Store
+Embedded SQLite store of analysis results, indexed for questions across the
+candidate pool, such as "which candidates miss only kubernetes for job X" or
+"the top matches above 70%", without re-running any analysis.
+
+Each stored analysis keeps its AnalysisResult.to_bytes record. Matched and
+missing skills are also kept as inverted indexes: clustered (skill, job,
+analysis) posting tables, so the candidates of one job that have or lack a
+skill are one contiguous range. match_percentage is indexed on its own and
+per job, so top-N queries read the best rows first and stop. Loads run in
+batched transactions, and storing a (resume, job) pair again replaces the
+earlier analysis.
+
+Example:
+    with ResultStore('results.sqlite') as store:
+        store.add_many(records)   # e.g. from batch_analyze.run_batch output
+        hits = store.search(job_id='job-17', missing=['kubernetes'], max_missing=1)
+"""
+
+import argparse
+import glob
+import json
+import os
+import sqlite3
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from resume_skill_gap_analyzer import AnalysisResult, SkillGapAnalyzer, _optional_import
+
+# Posting tables of the inverted indexes, by result field
+POSTING_TABLES = {'matched': 'matched_ids', 'missing': 'missing_ids'}
+
+
+def iter_result_records(path: str) -> Iterator[Dict]:
+    """
+    Read exported result records.
+
+    Args:
+        path: JSONL or Parquet file from batch_analyze / ResultsWriter, or a
+            directory of them (e.g. the results/ of a sharded run)
+
+    Yields:
+        Record dictionaries with resume_id, job_id and the result fields
+    """
+    if os.path.isdir(path):
+        for name in sorted(glob.glob(os.path.join(path, '*.jsonl')) + glob.glob(os.path.join(path, '*.parquet'))):
+            yield from iter_result_records(name)
+        return
+    if path.endswith('.parquet'):
+        parquet = _optional_import('pyarrow.parquet')
+        if parquet is None:
+            raise ImportError("pyarrow is required to read Parquet results")
+        for batch in parquet.ParquetFile(path).iter_batches():
+            yield from batch.to_pylist()
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class ResultStore:
+    """SQLite store of analysis results with skill and score indexes."""
+
+    def __init__(self, path: str = ':memory:', analyzer: SkillGapAnalyzer = None):
+        """
+        Open or create a store.
+
+        Args:
+            path: SQLite database file
+            analyzer: Analyzer whose skill table the results use (default: the
+                built-in skills); a store only holds results of one skill set
+        """
+        self.path = path
+        self.analyzer = analyzer or SkillGapAnalyzer(minimal=True)
+        self.table = self.analyzer.skill_table
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS skills (skill_id INTEGER PRIMARY KEY, name TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS jobs (job_key INTEGER PRIMARY KEY, job_id TEXT NOT NULL UNIQUE);
+            CREATE TABLE IF NOT EXISTS analyses (
+                analysis_id INTEGER PRIMARY KEY, job_key INTEGER NOT NULL, resume_id TEXT NOT NULL,
+                match_percentage REAL NOT NULL, matched_count INTEGER NOT NULL,
+                missing_count INTEGER NOT NULL, result BLOB NOT NULL
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS analyses_by_pair ON analyses (job_key, resume_id);
+            CREATE INDEX IF NOT EXISTS analyses_by_job_score ON analyses (job_key, match_percentage);
+            CREATE INDEX IF NOT EXISTS analyses_by_score ON analyses (match_percentage);
+            CREATE TABLE IF NOT EXISTS matched (
+                skill_id INTEGER, job_key INTEGER, analysis_id INTEGER,
+                PRIMARY KEY (skill_id, job_key, analysis_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS missing (
+                skill_id INTEGER, job_key INTEGER, analysis_id INTEGER,
+                PRIMARY KEY (skill_id, job_key, analysis_id)
+            ) WITHOUT ROWID;
+        """)
+        stored = [name for (name,) in self.conn.execute("SELECT name FROM skills ORDER BY skill_id")]
+        if not stored:
+            with self.conn:
+                self.conn.executemany("INSERT INTO skills VALUES (?, ?)", enumerate(self.table.names))
+        elif tuple(stored) != self.table.names:
+            raise ValueError(f"{path} holds results of a different skill set; "
+                             f"open it with the analyzer (taxonomy) that wrote them")
+        self._job_keys: Dict[str, int] = dict(self.conn.execute("SELECT job_id, job_key FROM jobs"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of stored analyses."""
+        return self.conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+
+    def close(self):
+        """Refresh the query planner statistics and close the database."""
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
+
+    def _job_key(self, job_id: str) -> int:
+        """Integer key of a job, registering new jobs."""
+        key = self._job_keys.get(job_id)
+        if key is None:
+            key = self.conn.execute("INSERT INTO jobs (job_id) VALUES (?)", (job_id,)).lastrowid
+            self._job_keys[job_id] = key
+        return key
+
+    def skill_id(self, skill: str) -> int:
+        """
+        Id of a skill name or alias.
+
+        Args:
+            skill: Skill name (case-insensitive) or alias such as "k8s"
+
+        Returns:
+            Skill id in the store's skill table
+        """
+        name = skill.strip().lower()
+        name = self.analyzer.skill_extractor.aliases.get(name, name)
+        if name not in self.table.ids:
+            raise ValueError(f"Unknown skill {skill!r}")
+        return self.table.ids[name]
+
+    def _as_result(self, result) -> AnalysisResult:
+        """AnalysisResult of a result object or an exported result dictionary."""
+        if isinstance(result, AnalysisResult):
+            if result.table.checksum != self.table.checksum:
+                raise ValueError("Analysis result was written with a different skill table")
+            return result
+        try:
+            ids = self.table.ids
+            return AnalysisResult(
+                self.table, self.table.encode(result['matched_skills']), self.table.encode(result['missing_skills']),
+                self.table.encode(result['extra_skills']), tuple(ids[name] for name in result['top_relevant_skills']),
+                result['match_percentage'], result['total_resume_skills'], result['total_job_skills'],
+                tuple(result.get('approximate') or ()))
+        except KeyError as e:
+            raise ValueError(f"Result does not fit the store's skill table: {e}")
+
+    def add(self, resume_id: str, job_id: str, result) -> None:
+        """
+        Store one analysis (replacing an earlier one of the same pair).
+
+        Args:
+            resume_id: Resume identifier
+            job_id: Job identifier
+            result: AnalysisResult or exported result dictionary
+        """
+        self.add_many([(resume_id, job_id, result)])
+
+    def add_many(self, records: Iterable, batch_size: int = 10000) -> int:
+        """
+        Bulk-load analyses, one transaction per batch.
+
+        Args:
+            records: (resume_id, job_id, result) tuples, or record dictionaries
+                with resume_id and job_id (batch_analyze output); records with
+                an error are skipped
+            batch_size: Analyses per transaction
+
+        Returns:
+            Number of analyses stored
+        """
+        stored = 0
+        batch = []
+        for record in records:
+            if isinstance(record, tuple):
+                batch.append(record)
+            elif 'error' not in record or not record['error']:
+                batch.append((str(record['resume_id']), str(record['job_id']), record))
+            if len(batch) >= batch_size:
+                stored += self._insert_batch(batch)
+                batch = []
+        if batch:
+            stored += self._insert_batch(batch)
+        return stored
+
+    def _insert_batch(self, batch: List[Tuple[str, str, object]]) -> int:
+        """Insert one batch of analyses in a single transaction."""
+        conn = self.conn
+        postings = {table: [] for table in POSTING_TABLES}
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            next_id = (conn.execute("SELECT MAX(analysis_id) FROM analyses").fetchone()[0] or 0) + 1
+            for resume_id, job_id, result in batch:
+                result = self._as_result(result)
+                job_key = self._job_key(job_id)
+                previous = conn.execute("SELECT analysis_id, result FROM analyses WHERE job_key = ? AND resume_id = ?",
+                                        (job_key, resume_id)).fetchone()
+                if previous is None:
+                    analysis_id = next_id
+                    next_id += 1
+                else:
+                    # Replacing: pending postings may include this pair's, so write them first
+                    self._flush_postings(postings)
+                    analysis_id = previous[0]
+                    old = AnalysisResult.from_bytes(previous[1], self.table)
+                    for table, field in POSTING_TABLES.items():
+                        conn.executemany(f"DELETE FROM {table} WHERE skill_id = ? AND job_key = ? AND analysis_id = ?",
+                                         [(skill_id, job_key, analysis_id) for skill_id in getattr(old, field)])
+                conn.execute("INSERT OR REPLACE INTO analyses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             (analysis_id, job_key, resume_id, result.match_percentage, len(result.matched_ids),
+                              len(result.missing_ids), result.to_bytes()))
+                for table, field in POSTING_TABLES.items():
+                    postings[table].extend((skill_id, job_key, analysis_id) for skill_id in getattr(result, field))
+            self._flush_postings(postings)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            # Jobs registered in the rolled-back transaction are gone again
+            self._job_keys = dict(conn.execute("SELECT job_id, job_key FROM jobs"))
+            raise
+        return len(batch)
+
+    def _flush_postings(self, postings: Dict[str, List[Tuple[int, int, int]]]):
+        """Write pending inverted-index entries."""
+        for table, rows in postings.items():
+            if rows:
+                # In key order, so the clustered index is appended to page by page
+                rows.sort()
+                self.conn.executemany(f"INSERT INTO {table} VALUES (?, ?, ?)", rows)
+                rows.clear()
+
+    def get(self, resume_id: str, job_id: str) -> Optional[AnalysisResult]:
+        """
+        Stored analysis of a pair.
+
+        Args:
+            resume_id: Resume identifier
+            job_id: Job identifier
+
+        Returns:
+            AnalysisResult, or None if the pair is not stored
+        """
+        job_key = self._job_keys.get(job_id)
+        row = None if job_key is None else self.conn.execute(
+            "SELECT result FROM analyses WHERE job_key = ? AND resume_id = ?", (job_key, resume_id)).fetchone()
+        return None if row is None else AnalysisResult.from_bytes(row[0], self.table)
+
+    def _filter(self, job_id: str, matched: Sequence[str], missing: Sequence[str], max_missing: int,
+                min_match: float, max_match: float) -> Optional[Tuple[str, List]]:
+        """WHERE clause and parameters of a search; None if nothing can match."""
+        clauses, params = [], []
+        job_key = None
+        if job_id is not None:
+            job_key = self._job_keys.get(job_id)
+            if job_key is None:
+                return None
+            clauses.append("a.job_key = ?")
+            params.append(job_key)
+        for table, skills in (('matched', matched), ('missing', missing)):
+            for skill in skills:
+                # Postings are clustered by (skill, job), so this is a range of one index
+                job_clause = " AND job_key = ?" if job_key is not None else ""
+                clauses.append(f"a.analysis_id IN (SELECT analysis_id FROM {table} WHERE skill_id = ?{job_clause})")
+                params.append(self.skill_id(skill))
+                if job_key is not None:
+                    params.append(job_key)
+        for clause, value in (("a.missing_count <= ?", max_missing), ("a.match_percentage >= ?", min_match),
+                              ("a.match_percentage <= ?", max_match)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def search(self, job_id: str = None, matched: Sequence[str] = (), missing: Sequence[str] = (),
+               max_missing: int = None, min_match: float = None, max_match: float = None,
+               limit: int = 100) -> List[Tuple[str, str, AnalysisResult]]:
+        """
+        Find stored analyses, best match first.
+
+        Args:
+            job_id: Only analyses against this job
+            matched: Skills the resume must have matched
+            missing: Skills the resume must be missing
+            max_missing: At most this many missing skills (with missing=["kubernetes"]
+                and max_missing=1: missing only kubernetes)
+            min_match: Minimum match percentage
+            max_match: Maximum match percentage
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            (resume_id, job_id, AnalysisResult) tuples by descending match percentage
+        """
+        where = self._filter(job_id, matched, missing, max_missing, min_match, max_match)
+        if where is None:
+            return []
+        clause, params = where
+        sql = ("SELECT a.resume_id, j.job_id, a.result FROM analyses a JOIN jobs j ON j.job_key = a.job_key"
+               f"{clause} ORDER BY a.match_percentage DESC, a.analysis_id")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [(resume_id, job, AnalysisResult.from_bytes(blob, self.table))
+                for resume_id, job, blob in self.conn.execute(sql, params)]
+
+    def count(self, job_id: str = None, matched: Sequence[str] = (), missing: Sequence[str] = (),
+              max_missing: int = None, min_match: float = None, max_match: float = None) -> int:
+        """
+        Number of stored analyses that search() would find without a limit.
+
+        Args:
+            Same filters as search
+
+        Returns:
+            Count of matching analyses
+        """
+        where = self._filter(job_id, matched, missing, max_missing, min_match, max_match)
+        if where is None:
+            return 0
+        clause, params = where
+        return self.conn.execute(f"SELECT COUNT(*) FROM analyses a{clause}", params).fetchone()[0]
+
+
+def main(argv: List[str] = None):
+    """Load results into a store or query it."""
+    parser = argparse.ArgumentParser(description="Store analysis results and query them across candidates.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    load_parser = subparsers.add_parser('load', help="Add exported results (JSONL or Parquet files or directories)")
+    load_parser.add_argument('inputs', nargs='+', help="Result files, or directories such as a sharded run's results/")
+    load_parser.add_argument('--store', required=True, help="SQLite store file (created if missing)")
+    load_parser.add_argument('--taxonomy', default=None, help="Compiled skill taxonomy the results were analyzed with")
+
+    query_parser = subparsers.add_parser('query', help="Find stored analyses, best match first")
+    query_parser.add_argument('--store', required=True, help="SQLite store file")
+    query_parser.add_argument('--taxonomy', default=None, help="Compiled skill taxonomy the results were analyzed with")
+    query_parser.add_argument('--job', default=None, help="Only analyses against this job id")
+    query_parser.add_argument('--has', action='append', default=[], metavar='SKILL',
+                              help="Matched skill (repeatable)")
+    query_parser.add_argument('--missing', action='append', default=[], metavar='SKILL',
+                              help="Missing skill (repeatable)")
+    query_parser.add_argument('--max-missing', type=int, default=None, help="At most this many missing skills")
+    query_parser.add_argument('--min-match', type=float, default=None, help="Minimum match percentage")
+    query_parser.add_argument('--max-match', type=float, default=None, help="Maximum match percentage")
+    query_parser.add_argument('--top', '-k', type=int, default=20, help="Number of results (default: 20)")
+    query_parser.add_argument('--count', action='store_true', help="Only print the number of matching analyses")
+    args = parser.parse_args(argv)
+
+    try:
+        taxonomy = None
+        if args.taxonomy:
+            from skill_taxonomy import SkillTaxonomy
+            taxonomy = SkillTaxonomy.load(args.taxonomy)
+        with ResultStore(args.store, SkillGapAnalyzer(minimal=True, taxonomy=taxonomy)) as store:
+            if args.command == 'load':
+                stored = 0
+                for path in args.inputs:
+                    stored += store.add_many(iter_result_records(path))
+                print(f"✅ Stored {stored} analyses ({len(store)} in {args.store})", file=sys.stderr)
+                return 0
+
+            filters = dict(job_id=args.job, matched=args.has, missing=args.missing, max_missing=args.max_missing,
+                           min_match=args.min_match, max_match=args.max_match)
+            if args.count:
+                print(store.count(**filters))
+                return 0
+            for resume_id, job_id, result in store.search(limit=args.top, **filters):
+                print(json.dumps({'resume_id': resume_id, 'job_id': job_id, **result.to_dict()}))
+    except (ValueError, FileNotFoundError, ImportError, sqlite3.Error) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
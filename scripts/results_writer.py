@@ -0,0 +1,210 @@
+"""
+Results Writer
+Bulk export of analysis results to columnar (Parquet, Arrow IPC) and row
+(CSV, JSON Lines) formats.
+
+Results are buffered and written in row groups of row_group_size rows, so
+millions of results can be exported from a stream while only one row group
+is held in memory. Skill lists become list<string> columns in Parquet and
+Arrow (Parquet dictionary-encodes them, so each distinct skill is stored once
+per column chunk) and "|"-separated strings in CSV, where recommendations
+are reduced to skill:category pairs. The approximate column lists the fields
+a budgeted analysis estimated (empty for exact results). Parquet and Arrow
+need pyarrow.
+
+Example:
+    with ResultsWriter('results.parquet') as writer:
+        for resume_index, job_index, result in analyzer.analyze_many(resumes, jobs):
+            writer.write(result, resume_id=str(resume_index), job_id=str(job_index))
+"""
+
+import csv
+import json
+import os
+from typing import Dict, Iterable, List
+
+from resume_skill_gap_analyzer import AnalysisResult, _optional_import
+
+FORMATS = ('jsonl', 'csv', 'parquet', 'arrow')
+
+_EXTENSIONS = {
+    '.jsonl': 'jsonl', '.json': 'jsonl', '.csv': 'csv',
+    '.parquet': 'parquet', '.arrow': 'arrow', '.feather': 'arrow', '.ipc': 'arrow',
+}
+
+# Columns in output order: identifiers, scalar results, skill lists, the rest
+KEY_COLUMNS = ('resume_id', 'job_id')
+SCALAR_COLUMNS = ('match_percentage', 'match_count', 'total_resume_skills', 'total_job_skills')
+LIST_COLUMNS = ('matched_skills', 'missing_skills', 'extra_skills', 'top_relevant_skills')
+COLUMNS = KEY_COLUMNS + SCALAR_COLUMNS + LIST_COLUMNS + ('recommendations', 'approximate', 'error')
+
+# CSV writes skill lists as one field
+LIST_SEPARATOR = '|'
+
+
+def infer_format(filename: str) -> str:
+    """
+    Pick the output format from a file extension.
+
+    Args:
+        filename: Output path
+
+    Returns:
+        One of FORMATS
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in _EXTENSIONS:
+        raise ValueError(f"Cannot infer the output format of {filename!r}; choose one of {', '.join(FORMATS)}")
+    return _EXTENSIONS[extension]
+
+
+def _arrow_schema(pa):
+    """Arrow schema of the exported columns."""
+    recommendation = pa.struct([('skill', pa.string()), ('category', pa.string()), ('resource', pa.string())])
+    return pa.schema(
+        [(name, pa.string()) for name in KEY_COLUMNS]
+        + [('match_percentage', pa.float64())]
+        + [(name, pa.int32()) for name in SCALAR_COLUMNS[1:]]
+        + [(name, pa.list_(pa.string())) for name in LIST_COLUMNS]
+        + [('recommendations', pa.list_(recommendation)), ('approximate', pa.list_(pa.string())),
+           ('error', pa.string())]
+    )
+
+
+class ResultsWriter:
+    """Buffered, chunked writer for streams of analysis results."""
+
+    def __init__(self, filename: str, output_format: str = None, row_group_size: int = 65536,
+                 compression: str = 'zstd'):
+        """
+        Open an output file.
+
+        Args:
+            filename: Output path
+            output_format: One of FORMATS (default: inferred from the extension)
+            row_group_size: Results buffered before each write
+            compression: Parquet / Arrow compression codec (None to disable)
+        """
+        self.format = output_format or infer_format(filename)
+        if self.format not in FORMATS:
+            raise ValueError(f"Unknown output format {self.format!r}; choose one of {', '.join(FORMATS)}")
+        self.filename = filename
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.rows_written = 0
+        self._buffer: List[Dict] = []
+        self._file = None
+        self._writer = None
+
+        if self.format in ('parquet', 'arrow'):
+            self._pa = _optional_import('pyarrow')
+            if self._pa is None:
+                raise ImportError(f"pyarrow is required for {self.format} output")
+            self._schema = _arrow_schema(self._pa)
+            if self.format == 'parquet':
+                parquet = _optional_import('pyarrow.parquet')
+                self._writer = parquet.ParquetWriter(filename, self._schema, compression=compression)
+            else:
+                options = self._pa.ipc.IpcWriteOptions(compression=compression)
+                self._file = self._pa.OSFile(filename, 'wb')
+                self._writer = self._pa.ipc.new_file(self._file, self._schema, options=options)
+        else:
+            self._file = open(filename, 'w', encoding='utf-8', newline='', buffering=1024 * 1024)
+            if self.format == 'csv':
+                self._writer = csv.writer(self._file)
+                self._writer.writerow(COLUMNS)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, result: Dict, **keys):
+        """
+        Add one analysis result.
+
+        Args:
+            result: AnalysisResult from SkillGapAnalyzer.analyze (or a batch
+                record dictionary that already holds resume_id / job_id / error)
+            **keys: Identifiers such as resume_id and job_id
+        """
+        if keys:
+            result = {**result, **keys}
+        self._buffer.append(result)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def write_many(self, results: Iterable[Dict]):
+        """
+        Add a stream of analysis results.
+
+        Args:
+            results: Result dictionaries (identifiers included)
+        """
+        for result in results:
+            self._buffer.append(result)
+            if len(self._buffer) >= self.row_group_size:
+                self.flush()
+
+    def flush(self):
+        """Write the buffered results as one row group."""
+        if not self._buffer:
+            return
+        rows, self._buffer = self._buffer, []
+        if self.format == 'jsonl':
+            self._file.write(''.join((row.to_json() if isinstance(row, AnalysisResult) else json.dumps(row)) + '\n'
+                                     for row in rows))
+        elif self.format == 'csv':
+            self._writer.writerows(self._csv_row(row) for row in rows)
+        else:
+            # One call per buffer: a Parquet row group or an Arrow record batch
+            self._writer.write_table(self._arrow_table(rows))
+        self.rows_written += len(rows)
+
+    @staticmethod
+    def _csv_row(row: Dict) -> List:
+        """Flatten one result into CSV fields."""
+        fields = [row.get(name, '') for name in KEY_COLUMNS + SCALAR_COLUMNS]
+        fields.extend(LIST_SEPARATOR.join(row.get(name, ())) for name in LIST_COLUMNS)
+        # skill:category pairs; the resource text follows from the category
+        fields.append(LIST_SEPARATOR.join(f"{item['skill']}:{item['category']}"
+                                          for item in row.get('recommendations') or ()))
+        fields.append(LIST_SEPARATOR.join(row.get('approximate') or ()))
+        fields.append(row.get('error', ''))
+        return fields
+
+    def _arrow_table(self, rows: List[Dict]):
+        """Build a pyarrow Table from a row group, column by column."""
+        columns = {name: [row.get(name) for row in rows] for name in COLUMNS}
+        return self._pa.Table.from_pydict(columns, schema=self._schema)
+
+    def close(self):
+        """Flush remaining results and close the file."""
+        if self._writer is None and self._file is None:
+            return
+        self.flush()
+        if self.format in ('parquet', 'arrow'):
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+        self._writer = self._file = None
+
+
+def write_results(results: Iterable[Dict], filename: str, output_format: str = None,
+                  row_group_size: int = 65536) -> int:
+    """
+    Export a stream of analysis results.
+
+    Args:
+        results: Result dictionaries (with resume_id / job_id if wanted)
+        filename: Output path
+        output_format: One of FORMATS (default: inferred from the extension)
+        row_group_size: Results per row group
+
+    Returns:
+        Number of results written
+    """
+    with ResultsWriter(filename, output_format, row_group_size) as writer:
+        writer.write_many(results)
+    return writer.rows_written
@@ -4,28 +4,158 @@ A Python application that compares a candidate's resume with a job description
 and identifies skill gaps using NLP techniques.
 """
 
+import codecs
+import contextlib
+import functools
+import hashlib
+import importlib
+import math
+import mmap
+import os
 import re
 import string
-from collections import Counter
-from typing import List, Dict, Set, Tuple
+import struct
+import sys
+import time
+import zipfile
+import zlib
+from array import array
+from collections import Counter, OrderedDict, deque
+from collections.abc import Mapping
+from typing import List, Dict, Set, Tuple, Iterator, NamedTuple
 import json
+import pickle
+
+# Core NLP and ML libraries (NLTK, scikit-learn, NumPy) are optional and heavy,
+# so they are only imported on first use through _optional_import. Nothing is
+# downloaded implicitly; run with --provision-nltk once to fetch NLTK data.
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'stopwords': 'corpora/stopwords',
+}
+
+_imported_modules = {}
+_warnings_shown = set()
+
+
+def _warn_once(message: str):
+    """Print a warning the first time it occurs in this process."""
+    if message not in _warnings_shown:
+        _warnings_shown.add(message)
+        print(f"Warning: {message}", file=sys.stderr)
+
+
+def _optional_import(name: str):
+    """
+    Import a module on first use, remembering failures.
+    
+    Args:
+        name: Dotted module name
+        
+    Returns:
+        The module, or None if it is not installed
+    """
+    if name not in _imported_modules:
+        try:
+            _imported_modules[name] = importlib.import_module(name)
+        except ImportError:
+            _imported_modules[name] = None
+    return _imported_modules[name]
+
+
+def nltk_data_available(resource: str) -> bool:
+    """
+    Check whether an NLTK data package is installed locally (never downloads).
+    
+    Args:
+        resource: Package name from NLTK_RESOURCES
+        
+    Returns:
+        True if NLTK is installed and the package can be loaded
+    """
+    nltk = _optional_import('nltk')
+    if nltk is None:
+        return False
+    try:
+        nltk.data.find(NLTK_RESOURCES[resource])
+        return True
+    except LookupError:
+        return False
+
+
+def _nltk_data_dirs() -> List[str]:
+    """Directories NLTK searches for data (nltk.data.path), without importing NLTK."""
+    nltk = sys.modules.get('nltk')
+    if nltk is not None:
+        return list(nltk.data.path)
+    dirs = [path for path in os.environ.get('NLTK_DATA', '').split(os.pathsep) if path]
+    dirs.append(os.path.expanduser(os.path.join('~', 'nltk_data')))
+    dirs.extend(os.path.join(sys.prefix, *parts) for parts in (('nltk_data',), ('share', 'nltk_data'),
+                                                                ('lib', 'nltk_data')))
+    if sys.platform.startswith('win'):
+        dirs.extend([os.path.join(os.environ.get('APPDATA', 'C:\\'), 'nltk_data'),
+                     r'C:\nltk_data', r'D:\nltk_data', r'E:\nltk_data'])
+    else:
+        dirs.extend(['/usr/share/nltk_data', '/usr/local/share/nltk_data', '/usr/lib/nltk_data',
+                     '/usr/local/lib/nltk_data'])
+    return dirs
+
+
+def read_nltk_stopwords(language: str = 'english') -> List[str]:
+    """
+    Read an NLTK stopword list straight from the data directories.
+    
+    Importing NLTK pulls in SciPy and scikit-learn, which would dominate the
+    start-up of every analyzer for one word list, so the corpus file (plain
+    or zipped, as NLTK installs it) is read directly.
+    
+    Args:
+        language: Stopword list name
+        
+    Returns:
+        The stopwords, or an empty list if the corpus is not installed
+    """
+    for directory in _nltk_data_dirs():
+        corpora = os.path.join(directory, 'corpora')
+        try:
+            path = os.path.join(corpora, 'stopwords', language)
+            if os.path.isfile(path):
+                with open(path, encoding='utf-8') as f:
+                    text = f.read()
+            elif os.path.isfile(os.path.join(corpora, 'stopwords.zip')):
+                with zipfile.ZipFile(os.path.join(corpora, 'stopwords.zip')) as archive:
+                    text = archive.read(f'stopwords/{language}').decode('utf-8')
+            else:
+                continue
+        except (OSError, KeyError, zipfile.BadZipFile, UnicodeDecodeError):
+            continue
+        return [word.strip() for word in text.splitlines() if word.strip()]
+    return []
+
+
+def provision_nltk_data(download_dir: str = None) -> bool:
+    """
+    Download the NLTK data packages used by TextPreprocessor.
+    
+    This is an explicit one-time setup step; the analyzer never downloads
+    anything on its own.
+    
+    Args:
+        download_dir: Optional target directory (default: NLTK's choice)
+        
+    Returns:
+        True if every package is available afterwards
+    """
+    nltk = _optional_import('nltk')
+    if nltk is None:
+        print("❌ NLTK is not installed. Install it with: pip install nltk")
+        return False
+    for resource in NLTK_RESOURCES:
+        if not nltk_data_available(resource):
+            nltk.download(resource, download_dir=download_dir, quiet=True)
+    return all(nltk_data_available(resource) for resource in NLTK_RESOURCES)
 
-# Core NLP and ML libraries
-try:
-    import nltk
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('punkt_tab', quiet=True)
-except ImportError:
-    print("Warning: NLTK not available. Using basic text processing.")
-    
-try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-except ImportError:
-    print("Warning: scikit-learn not available. Match percentage will be basic.")
 
 # Comprehensive skill dictionary with technical and soft skills
 SKILL_DICTIONARY = {
@@ -33,241 +163,1901 @@ SKILL_DICTIONARY = {
     'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php', 
     'swift', 'kotlin', 'go', 'rust', 'scala', 'r', 'matlab', 'perl', 'sql',
     
-    # Web Technologies
-    'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 
-    'flask', 'spring', 'asp.net', 'jquery', 'bootstrap', 'tailwind',
+    # Web Technologies
+    'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 
+    'flask', 'spring', 'asp.net', 'jquery', 'bootstrap', 'tailwind',
+    
+    # Databases
+    'mysql', 'postgresql', 'mongodb', 'oracle', 'redis', 'cassandra', 
+    'dynamodb', 'sqlite', 'mariadb', 'elasticsearch', 'neo4j',
+    
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform', 
+    'ansible', 'ci/cd', 'git', 'github', 'gitlab', 'bitbucket',
+    
+    # Data Science & ML
+    'machine learning', 'deep learning', 'neural networks', 'tensorflow', 
+    'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 
+    'data analysis', 'data visualization', 'nlp', 'computer vision',
+    
+    # Soft Skills
+    'communication', 'leadership', 'teamwork', 'problem solving', 
+    'critical thinking', 'time management', 'adaptability', 'creativity',
+    'collaboration', 'presentation', 'analytical', 'organizational',
+    
+    # Methodologies & Practices
+    'agile', 'scrum', 'kanban', 'waterfall', 'devops', 'tdd', 'bdd',
+    'microservices', 'api', 'rest', 'graphql', 'oauth', 'jwt',
+    
+    # Tools & Frameworks
+    'jira', 'confluence', 'slack', 'vs code', 'intellij', 'eclipse',
+    'postman', 'swagger', 'figma', 'adobe', 'photoshop',
+}
+
+# Alternative names, abbreviations and spellings of dictionary skills. An alias
+# must not contain a dictionary skill as a separate word, or both would match.
+SKILL_ALIASES = {
+    'postgres': 'postgresql', 'psql': 'postgresql', 'mongo': 'mongodb',
+    'elastic search': 'elasticsearch', 'k8s': 'kubernetes', 'golang': 'go',
+    'reactjs': 'react', 'vuejs': 'vue', 'angularjs': 'angular', 'expressjs': 'express',
+    'node': 'node.js', 'tailwindcss': 'tailwind', 'html5': 'html', 'css3': 'css',
+    'cpp': 'c++', 'csharp': 'c#', 'c sharp': 'c#',
+    'sklearn': 'scikit-learn', 'scikit learn': 'scikit-learn', 'ml': 'machine learning',
+    'neural network': 'neural networks', 'natural language processing': 'nlp',
+    'data visualisation': 'data visualization',
+    'amazon web services': 'aws', 'google cloud': 'gcp', 'continuous integration': 'ci/cd',
+    'test driven development': 'tdd', 'test-driven development': 'tdd',
+    'behavior driven development': 'bdd', 'behaviour driven development': 'bdd',
+    'microservice': 'microservices', 'restful': 'rest', 'visual studio code': 'vs code',
+    'team work': 'teamwork',
+}
+
+# Learning resources by skill category (see SkillGapAnalyzer._recommendation)
+LEARNING_RESOURCES = {
+    'programming': 'Online courses: Coursera, Udemy, freeCodeCamp',
+    'web': 'MDN Web Docs, Frontend Masters, The Odin Project',
+    'database': 'SQL tutorials, MongoDB University, database documentation',
+    'cloud': 'AWS Training, Azure Learn, Google Cloud Skills Boost',
+    'data_science': 'Kaggle, DataCamp, fast.ai courses',
+    'soft_skill': 'LinkedIn Learning, soft skills workshops, practice projects',
+}
+DEFAULT_LEARNING_RESOURCE = 'Online tutorials and documentation'
+
+# Keyword rules for skills without an explicit category, checked in order
+_CATEGORY_RULES = (
+    ('programming', ('python', 'java', 'javascript', 'c++', 'ruby')),
+    ('web', ('html', 'css', 'react', 'angular', 'vue')),
+    ('database', ('sql', 'mysql', 'mongodb', 'database')),
+    ('cloud', ('aws', 'azure', 'gcp', 'cloud')),
+    ('data_science', ('machine learning', 'data', 'analysis', 'tensorflow')),
+    ('soft_skill', ('communication', 'leadership', 'teamwork')),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def categorize_skill(skill: str) -> str:
+    """
+    Categorize a skill by keyword rules (memoized, so repeated lookups are O(1)).
+    
+    Args:
+        skill: Skill name
+        
+    Returns:
+        Category name, 'general' if no rule applies
+    """
+    skill_lower = skill.lower()
+    for category, keywords in _CATEGORY_RULES:
+        if any(keyword in skill_lower for keyword in keywords):
+            return category
+    return 'general'
+
+# Returned by SkillGapAnalyzer._stage when no instrumentation is attached
+_NO_STAGE = contextlib.nullcontext()
+
+# Used by SkillMatcher so multi-word skills match across line breaks and tabs
+_WHITESPACE_TO_SPACE = str.maketrans({ch: ' ' for ch in '\t\n\r\x0b\x0c'})
+
+
+# Tokenizer engines selectable with TextPreprocessor(tokenizer=...)
+TOKENIZER_ENGINES = ('regex', 'nltk')
+
+# Resume tokens: letters and digits, joined by . + # / inside a token and
+# followed by + or # at its end, so "c++", "c#", "node.js" and "ci/cd" stay whole
+_TOKEN_PATTERN = re.compile(r"[^\W_]+(?:[.+#/][^\W_]+)*[+#]*")
+
+# ASCII punctuation stripped from the ends of a whitespace-separated word
+_TOKEN_EDGE = ''.join(c for c in string.punctuation if c not in '+#')
+
+
+def _regex_tokens(text: str, stop_words: frozenset = frozenset(), min_length: int = 1) -> List[str]:
+    """
+    Tokenize lowercase text with _TOKEN_PATTERN, dropping stop words and short tokens.
+    
+    Most words are plain letters and digits once edge punctuation is
+    stripped; only the rest go through the regular expression.
+    """
+    tokens = []
+    append = tokens.append
+    findall = _TOKEN_PATTERN.findall
+    for word in text.split():
+        if not word.isalnum():
+            word = word.strip(_TOKEN_EDGE)
+            if not word.isalnum():
+                for token in findall(word):
+                    if len(token) >= min_length and token not in stop_words:
+                        append(token)
+                continue
+        if len(word) >= min_length and word not in stop_words:
+            append(word)
+    return tokens
+
+
+class TextPreprocessor:
+    """Handles text preprocessing tasks including cleaning, tokenization, and normalization."""
+    
+    def __init__(self, minimal: bool = False, tokenizer: str = 'regex'):
+        """
+        Initialize the preprocessor with stopwords.
+        
+        Args:
+            minimal: Skip NLTK entirely and use the built-in stopwords and tokenizer
+            tokenizer: 'regex' (single-pass tokenizer for resume text) or 'nltk'
+                (clean_text, then NLTK word_tokenize when its data is installed)
+        """
+        if tokenizer not in TOKENIZER_ENGINES:
+            raise ValueError(f"Unknown tokenizer {tokenizer!r} (choose from {', '.join(TOKENIZER_ENGINES)})")
+        self.minimal = minimal
+        self.tokenizer = tokenizer
+        self._word_tokenize = None
+        if not minimal and tokenizer == 'nltk':
+            if nltk_data_available('punkt') or nltk_data_available('punkt_tab'):
+                self._word_tokenize = _optional_import('nltk.tokenize').word_tokenize
+            else:
+                _warn_once("NLTK tokenizer data not available. Using basic tokenization "
+                           "(run with --provision-nltk to install it).")
+        stop_words = () if minimal else read_nltk_stopwords('english')
+        if stop_words:
+            self.stop_words = frozenset(stop_words)
+        else:
+            # Fallback to basic English stop words if NLTK data is not installed
+            self.stop_words = frozenset({
+                'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', 
+                'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his', 'himself',
+                'she', 'her', 'hers', 'herself', 'it', 'its', 'itself', 'they', 'them',
+                'their', 'theirs', 'themselves', 'what', 'which', 'who', 'whom', 'this',
+                'that', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'been', 'being',
+                'have', 'has', 'had', 'having', 'do', 'does', 'did', 'doing', 'a', 'an',
+                'the', 'and', 'but', 'if', 'or', 'because', 'as', 'until', 'while', 'of',
+                'at', 'by', 'for', 'with', 'about', 'against', 'between', 'into', 'through',
+                'during', 'before', 'after', 'above', 'below', 'to', 'from', 'up', 'down',
+                'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then', 'once'
+            })
+    
+    def clean_text(self, text: str) -> str:
+        """
+        Clean text by removing special characters and normalizing whitespace.
+        
+        Args:
+            text: Raw input text
+            
+        Returns:
+            Cleaned text in lowercase
+        """
+        if not text or not isinstance(text, str):
+            return ""
+        
+        # Convert to lowercase
+        text = text.lower()
+        
+        # Keep alphanumeric, spaces, and some special chars like +, #, .
+        text = re.sub(r'[^a-z0-9\s+#./]', ' ', text)
+        
+        # Normalize whitespace
+        text = ' '.join(text.split())
+        
+        return text
+    
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Tokenize text into words.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            List of tokens
+        """
+        if self.tokenizer == 'regex':
+            return _regex_tokens(text)
+        if self._word_tokenize is None:
+            return text.split()
+        
+        try:
+            # Use NLTK tokenizer if available
+            tokens = self._word_tokenize(text)
+        except:
+            # Fallback to simple split
+            tokens = text.split()
+        
+        return tokens
+    
+    def remove_stopwords(self, tokens: List[str]) -> List[str]:
+        """
+        Remove stop words from token list.
+        
+        Args:
+            tokens: List of word tokens
+            
+        Returns:
+            Filtered list without stop words
+        """
+        return [token for token in tokens if token not in self.stop_words and len(token) > 2]
+    
+    def preprocess(self, text: str) -> List[str]:
+        """
+        Full preprocessing pipeline: clean, tokenize, and remove stop words.
+        
+        The regex engine does all three in one pass over the lowercased text.
+        
+        Args:
+            text: Raw input text
+            
+        Returns:
+            List of processed tokens
+        """
+        if self.tokenizer == 'regex':
+            if not text or not isinstance(text, str):
+                return []
+            return _regex_tokens(text.lower(), self.stop_words, 3)
+        cleaned = self.clean_text(text)
+        tokens = self.tokenize(cleaned)
+        filtered = self.remove_stopwords(tokens)
+        return filtered
+    
+    def iter_tokens(self, chunks: Iterator[str]) -> Iterator[str]:
+        """
+        Streaming version of preprocess for text arriving in chunks.
+        
+        Args:
+            chunks: Iterable of text chunks (e.g. from iter_file_chunks)
+            
+        Yields:
+            Processed tokens, identical to preprocess on the joined text
+        """
+        for segment in iter_complete_segments(chunks):
+            yield from self.preprocess(segment)
+
+
+class _LazyStates(dict):
+    """State-indexed table whose entries are built from flat arrays on first access."""
+    
+    def __init__(self, build):
+        super().__init__()
+        self._build = build
+    
+    def __missing__(self, state: int):
+        value = self[state] = self._build(state)
+        return value
+
+
+class SkillMatch(NamedTuple):
+    """A single skill occurrence found by SkillMatcher or FuzzySkillIndex."""
+    start: int
+    end: int
+    skill: str
+    confidence: float = 1.0
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over skill surface forms.
+    
+    The automaton is compiled once from a mapping of surface form to canonical
+    skill name and then finds every occurrence of every pattern in a single
+    left-to-right pass over the text, regardless of how many patterns it holds.
+    Matches are only reported on word boundaries, so short skills such as
+    "go" or "r" do not fire inside "google" or "docker".
+    """
+    
+    def __init__(self, patterns: Dict[str, str]):
+        """
+        Compile the automaton.
+        
+        Args:
+            patterns: Mapping of lowercase surface form to canonical skill name
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[Tuple[int, str], ...]] = [()]
+        self.max_pattern_length = 0
+        
+        for surface, skill in patterns.items():
+            if surface:
+                self._add_pattern(surface, skill)
+                self.max_pattern_length = max(self.max_pattern_length, len(surface))
+        self._build_failure_links()
+    
+    def _add_pattern(self, surface: str, skill: str):
+        """Insert one surface form into the trie."""
+        state = 0
+        for ch in surface:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        self._out[state] += ((len(surface), skill),)
+    
+    def _build_failure_links(self):
+        """Compute failure links breadth-first and merge output sets."""
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                link = goto[fallback].get(ch, 0)
+                fail[child] = link if link != child else 0
+                out[child] += out[fail[child]]
+    
+    @property
+    def state_count(self) -> int:
+        """Number of states in the compiled automaton."""
+        return len(self._fail)
+    
+    def patterns(self) -> Dict[str, str]:
+        """
+        Recover the surface forms the automaton was compiled from.
+        
+        Walks the whole trie, so a loaded matcher expands every state.
+        
+        Returns:
+            Mapping of surface form to canonical skill name
+        """
+        goto, out = self._goto, self._out
+        patterns = {}
+        stack = [(0, '')]
+        while stack:
+            state, prefix = stack.pop()
+            for length, skill in out[state]:
+                # Outputs merged through failure links belong to shorter suffixes
+                if length == len(prefix):
+                    patterns[prefix] = skill
+            stack.extend((target, prefix + ch) for ch, target in goto[state].items())
+        return patterns
+    
+    def export_tables(self) -> Tuple[List[str], Dict]:
+        """
+        Flatten the automaton into integer arrays (see from_tables).
+        
+        Returns:
+            (skills, tables): canonical skill names and a dictionary of
+            unsigned 32-bit arrays: edge_offsets, edge_chars, edge_targets,
+            fail, out_offsets, out_lengths and out_skills (indexes into skills)
+        """
+        skills = sorted({skill for outputs in self._out for _, skill in outputs})
+        skill_ids = {skill: i for i, skill in enumerate(skills)}
+        tables = {name: array('I') for name in (
+            'edge_offsets', 'edge_chars', 'edge_targets', 'fail', 'out_offsets', 'out_lengths', 'out_skills')}
+        for state in range(self.state_count):
+            tables['edge_offsets'].append(len(tables['edge_chars']))
+            for ch, target in sorted(self._goto[state].items()):
+                tables['edge_chars'].append(ord(ch))
+                tables['edge_targets'].append(target)
+            tables['out_offsets'].append(len(tables['out_lengths']))
+            for length, skill in self._out[state]:
+                tables['out_lengths'].append(length)
+                tables['out_skills'].append(skill_ids[skill])
+        tables['edge_offsets'].append(len(tables['edge_chars']))
+        tables['out_offsets'].append(len(tables['out_lengths']))
+        tables['fail'].extend(self._fail)
+        return skills, tables
+    
+    @classmethod
+    def from_tables(cls, skills: List[str], tables: Dict, max_pattern_length: int) -> 'SkillMatcher':
+        """
+        Rebuild a matcher from export_tables output without recompiling it.
+        
+        The arrays may be memory-mapped; transitions and outputs of a state
+        are only turned into dictionaries when a scan first reaches it, so
+        loading costs the same for ten patterns or a hundred thousand.
+        
+        Args:
+            skills: Canonical skill names
+            tables: Integer sequences as produced by export_tables
+            max_pattern_length: Length of the longest surface form
+            
+        Returns:
+            SkillMatcher
+        """
+        edge_offsets, edge_chars, edge_targets = tables['edge_offsets'], tables['edge_chars'], tables['edge_targets']
+        out_offsets, out_lengths, out_skills = tables['out_offsets'], tables['out_lengths'], tables['out_skills']
+        
+        def goto(state: int) -> Dict[str, int]:
+            start, end = edge_offsets[state], edge_offsets[state + 1]
+            return dict(zip(map(chr, edge_chars[start:end]), edge_targets[start:end]))
+        
+        def out(state: int) -> Tuple[Tuple[int, str], ...]:
+            start, end = out_offsets[state], out_offsets[state + 1]
+            return tuple((out_lengths[i], skills[out_skills[i]]) for i in range(start, end))
+        
+        matcher = cls.__new__(cls)
+        matcher._goto = _LazyStates(goto)
+        matcher._fail = tables['fail']
+        matcher._out = _LazyStates(out)
+        matcher.max_pattern_length = max_pattern_length
+        return matcher
+    
+    def iter_matches(self, text: str) -> Iterator[SkillMatch]:
+        """
+        Yield every word-bounded skill occurrence in text.
+        
+        Args:
+            text: Lowercase text to scan
+            
+        Yields:
+            SkillMatch tuples with offsets into text
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        text = text.translate(_WHITESPACE_TO_SPACE)
+        n = len(text)
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = i + 1
+                if end < n and text[end].isalnum():
+                    continue
+                for length, skill in out[state]:
+                    start = end - length
+                    if start == 0 or not text[start - 1].isalnum():
+                        yield SkillMatch(start, end, skill)
+    
+    def find_matches(self, text: str) -> List[SkillMatch]:
+        """Return all skill occurrences in text, ordered by end offset."""
+        return list(self.iter_matches(text))
+    
+    def count_skills(self, text: str) -> Counter:
+        """Count occurrences of each canonical skill in text."""
+        return count_matches(self.iter_matches(text))
+    
+    def iter_matches_stream(self, chunks: Iterator[str]) -> Iterator[SkillMatch]:
+        """
+        Yield every word-bounded skill occurrence in text arriving in chunks.
+        
+        Only the last max_pattern_length + 1 characters are carried between
+        chunks, so skills spanning a chunk boundary are found without ever
+        holding the whole text. A match ending at the end of a chunk is held
+        back until the next character is known.
+        
+        Args:
+            chunks: Iterable of lowercase text chunks
+            
+        Yields:
+            SkillMatch tuples with offsets into the concatenated text
+        """
+        keep = self.max_pattern_length + 1
+        buffer = ""
+        base = 0  # offset of buffer[0] in the whole text
+        reported = 0  # matches ending at or before this offset have been handled
+        for chunk in chunks:
+            buffer += chunk
+            limit = len(buffer) - 1
+            for match in self.iter_matches(buffer):
+                if match.end <= limit and base + match.end > reported:
+                    yield SkillMatch(base + match.start, base + match.end, match.skill)
+            reported = max(reported, base + limit)
+            cut = max(0, len(buffer) - keep)
+            base += cut
+            buffer = buffer[cut:]
+        for match in self.iter_matches(buffer):
+            if base + match.end > reported:
+                yield SkillMatch(base + match.start, base + match.end, match.skill)
+
+
+def count_matches(matches: Iterator[SkillMatch]) -> Counter:
+    """
+    Count skill occurrences, once per start offset and skill.
+    
+    Surface forms of the same skill that share a start ("node" and "node.js")
+    are one occurrence.
+    
+    Args:
+        matches: Skill matches
+        
+    Returns:
+        Counter mapping canonical skill names to occurrence counts
+    """
+    return Counter(skill for _, skill in {(match.start, match.skill) for match in matches})
+
+
+# Similarity used by --fuzzy without a value; catches single typos in 9+ letter skills
+DEFAULT_FUZZY_THRESHOLD = 0.75
+
+# Words considered for approximate skill lookup: a letter, then 3+ letters or digits
+_FUZZY_WORD_PATTERN = re.compile(r"[^\W\d_][^\W_]{3,}")
+
+
+class FuzzySkillIndex:
+    """
+    Character-trigram index for approximate single-word skill lookup.
+    
+    Similarity is the Dice coefficient of padded character trigrams. A lookup
+    only probes the postings of the query's rarest trigrams (prefix
+    filtering): any surface form reaching the threshold must share at least
+    one of them, so just a few candidates are verified per word. Results are
+    memoized per word.
+    """
+    
+    def __init__(self, surfaces: Dict[str, str], threshold: float = 0.8, min_length: int = 4,
+                 memo_size: int = 100000):
+        """
+        Build the index.
+        
+        Args:
+            surfaces: Mapping of lowercase surface form to canonical skill name
+                (multi-word and short forms are left to exact matching)
+            threshold: Minimum similarity (0-1) for a match
+            min_length: Shortest word (and surface form) considered
+            memo_size: Word lookups remembered before the memo is reset
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.min_length = min_length
+        self.memo_size = memo_size
+        self._exact = set(surfaces)
+        self._forms: List[Tuple[str, frozenset]] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._memo: Dict[str, Tuple[str, float]] = {}
+        for surface, skill in sorted(surfaces.items()):
+            if len(surface) < min_length or not surface.isalnum():
+                continue
+            grams = self.trigrams(surface)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(len(self._forms))
+            self._forms.append((skill, grams))
+    
+    @staticmethod
+    def trigrams(word: str) -> frozenset:
+        """Padded character trigrams of a word."""
+        padded = f"  {word} "
+        return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+    
+    def lookup(self, word: str) -> Tuple[str, float]:
+        """
+        Find the most similar skill for a word.
+        
+        Args:
+            word: Lowercase word
+            
+        Returns:
+            (skill, similarity), or (None, 0.0) below the threshold or for
+            words that are surface forms themselves (exact matching finds those)
+        """
+        found = self._memo.get(word)
+        if found is not None:
+            return found
+        found = (None, 0.0)
+        if len(word) >= self.min_length and word not in self._exact:
+            found = self._search(word)
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[word] = found
+        return found
+    
+    def _search(self, word: str) -> Tuple[str, float]:
+        """Probe the rarest trigrams and verify the candidates."""
+        postings = self._postings
+        grams = sorted(self.trigrams(word), key=lambda gram: len(postings.get(gram, ())))
+        size = len(grams)
+        threshold = self.threshold
+        # Dice >= t needs |shared| >= t * size / (2 - t) for any form size
+        min_shared = math.ceil(threshold * size / (2 - threshold) - 1e-9)
+        candidates = set()
+        for gram in grams[:size - min_shared + 1]:
+            candidates.update(postings.get(gram, ()))
+        
+        best_skill, best_score = None, 0.0
+        query = frozenset(grams)
+        for index in candidates:
+            skill, form = self._forms[index]
+            score = 2 * len(query & form) / (size + len(form))
+            if score > best_score or (score == best_score and best_skill is not None and skill < best_skill):
+                best_skill, best_score = skill, score
+        if best_score < threshold:
+            return (None, 0.0)
+        return (best_skill, round(best_score, 4))
+    
+    def iter_matches(self, text: str) -> Iterator[SkillMatch]:
+        """
+        Yield approximate skill matches for the words of a text.
+        
+        Args:
+            text: Lowercase text to scan
+            
+        Yields:
+            SkillMatch tuples with the similarity as confidence
+        """
+        for word in _FUZZY_WORD_PATTERN.finditer(text):
+            skill, score = self.lookup(word.group())
+            if skill is not None:
+                yield SkillMatch(word.start(), word.end(), skill, score)
+
+
+def surface_forms(name: str) -> List[str]:
+    """
+    Spellings under which a skill (or a synonym) is matched.
+    
+    Args:
+        name: Lowercase skill name or synonym
+        
+    Returns:
+        Normalized form (no spaces, dots or slashes), hyphenated form for
+        multi-word names, and the name itself
+    """
+    forms = [name.replace(' ', '').replace('.', '').replace('/', '')]
+    if ' ' in name:
+        # "problem-solving" for "problem solving"
+        forms.append(name.replace(' ', '-'))
+    forms.append(name)
+    return forms
+
+
+class SkillExtractor:
+    """Extracts technical and soft skills from text using a skill dictionary."""
+    
+    def __init__(self, skill_dict: Set[str], matcher: SkillMatcher = None, aliases: Dict[str, str] = None,
+                 fuzzy_threshold: float = None):
+        """
+        Initialize with a skill dictionary.
+        
+        Args:
+            skill_dict: Set of skills to look for
+            matcher: Precompiled matcher for skill_dict (e.g. from a SkillTaxonomy,
+                which carries its own synonyms); skill_variations is then left empty
+            aliases: Mapping of alias to skill (default: SKILL_ALIASES entries
+                whose skill is in skill_dict)
+            fuzzy_threshold: Also match words approximately (see FuzzySkillIndex)
+                with at least this similarity; None for exact matching only
+        """
+        self.skill_dict = skill_dict
+        if aliases is None:
+            aliases = SKILL_ALIASES
+        # Taxonomies pass their skills as a list; test membership against a set
+        known = skill_dict if isinstance(skill_dict, (set, frozenset)) else set(skill_dict)
+        self.aliases = {alias: skill for alias, skill in aliases.items() if skill in known}
+        self.fuzzy_threshold = fuzzy_threshold
+        self._fuzzy_index = None
+        if matcher is not None:
+            self.skill_variations = {}
+            self.matcher = matcher
+            return
+        # Create variations for better matching
+        self.skill_variations = self._create_skill_variations()
+        self.matcher = SkillMatcher(self.skill_variations)
+    
+    @property
+    def fuzzy_index(self) -> FuzzySkillIndex:
+        """Trigram index for approximate matching (built on first use), or None."""
+        if self.fuzzy_threshold is None:
+            return None
+        if self._fuzzy_index is None:
+            # Every exact surface form, synonyms and aliases included, mapped to its skill
+            surfaces = self.skill_variations or self.matcher.patterns()
+            self._fuzzy_index = FuzzySkillIndex(surfaces, self.fuzzy_threshold)
+        return self._fuzzy_index
+    
+    def _create_skill_variations(self) -> Dict[str, str]:
+        """
+        Create normalized versions of skills for better matching.
+        
+        Returns:
+            Dictionary mapping normalized skill names to canonical forms
+        """
+        variations = {}
+        # Aliases first so that a skill's own name always maps to itself
+        for alias, skill in self.aliases.items():
+            for surface in surface_forms(alias):
+                variations[surface] = skill
+        for skill in self.skill_dict:
+            for surface in surface_forms(skill):
+                variations[surface] = skill
+        return variations
+    
+    def extract_skill_counts(self, tokens: List[str], original_text: str = "") -> Counter:
+        """
+        Count skill occurrences in a document.
+        
+        Args:
+            tokens: Preprocessed tokens (scanned only when original_text is empty)
+            original_text: Original text (for multi-word skills)
+            
+        Returns:
+            Counter mapping canonical skill names to occurrence counts
+        """
+        text = original_text if original_text else ' '.join(tokens)
+        return count_matches(self.find_skills(text))
+    
+    def find_skills(self, text: str) -> List[SkillMatch]:
+        """
+        Find every skill occurrence in a text, exact and (if enabled) approximate.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            SkillMatch tuples; exact and alias matches have confidence 1.0,
+            approximate ones their similarity
+        """
+        text = text.lower()
+        matches = self.matcher.find_matches(text)
+        if self.fuzzy_threshold is not None:
+            matches.extend(self.fuzzy_index.iter_matches(text))
+        return matches
+    
+    def extract_skills(self, tokens: List[str], original_text: str = "") -> Set[str]:
+        """
+        Extract skills from tokenized text and original text.
+        
+        Args:
+            tokens: Preprocessed tokens
+            original_text: Original text (for multi-word skills)
+            
+        Returns:
+            Set of found skills
+        """
+        return set(self.extract_skill_counts(tokens, original_text))
+
+# Token pattern used by scikit-learn's TfidfVectorizer; document vectors are
+# term counts over these tokens so pairwise scores match the sklearn fit exactly
+_TERM_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+# Bump when DocumentProfile contents change so stale cache entries are ignored
+PROFILE_VERSION = 2
+
+
+class DocumentProfile(NamedTuple):
+    """Everything the analyzer derives from a single document."""
+    tokens: Tuple[str, ...]
+    skills: frozenset
+    skill_counts: Dict[str, int]
+    term_counts: Dict[str, int]
+
+
+def count_terms(text: str) -> Dict[str, int]:
+    """
+    Build the term-frequency vector of a document.
+    
+    Args:
+        text: Raw document text
+        
+    Returns:
+        Dictionary mapping terms to their counts
+    """
+    return dict(Counter(_TERM_PATTERN.findall(text.lower())))
+
+
+def tfidf_similarity(counts_a: Dict[str, int], counts_b: Dict[str, int],
+                     max_features: int = 500, use_numpy: bool = True) -> float:
+    """
+    Cosine similarity of two documents under a TF-IDF model fitted on just them.
+    
+    Reproduces TfidfVectorizer(max_features=max_features).fit_transform([a, b])
+    followed by cosine_similarity, but from precomputed term counts, so each
+    document only has to be vectorized once.
+    
+    Args:
+        counts_a: Term counts of the first document
+        counts_b: Term counts of the second document
+        max_features: Vocabulary size limit (most frequent terms are kept)
+        use_numpy: Break frequency ties exactly like sklearn (requires NumPy);
+            otherwise ties are broken alphabetically
+        
+    Returns:
+        Cosine similarity between 0 and 1
+    """
+    terms = sorted(counts_a.keys() | counts_b.keys())
+    if max_features and len(terms) > max_features:
+        totals = [counts_a.get(t, 0) + counts_b.get(t, 0) for t in terms]
+        np = _optional_import('numpy') if use_numpy else None
+        if np is not None:
+            # Same (unstable) ordering as sklearn's feature limiting
+            keep = (-np.array(totals, dtype=np.int64)).argsort()[:max_features]
+        else:
+            keep = sorted(range(len(terms)), key=lambda i: -totals[i])[:max_features]
+        terms = [terms[i] for i in keep]
+    
+    # Smoothed IDF over two documents: shared terms get 1, others ln(3/2) + 1
+    rare_idf = math.log(1.5) + 1
+    dot = norm_a = norm_b = 0.0
+    for term in terms:
+        count_a = counts_a.get(term, 0)
+        count_b = counts_b.get(term, 0)
+        idf = 1.0 if count_a and count_b else rare_idf
+        weight_a = count_a * idf
+        weight_b = count_b * idf
+        dot += weight_a * weight_b
+        norm_a += weight_a * weight_a
+        norm_b += weight_b * weight_b
+    
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / math.sqrt(norm_a * norm_b)
+
+
+def tfidf_similarity_batch(pairs: List[Tuple[Dict[str, int], Dict[str, int]]],
+                           max_features: int = 500, use_numpy: bool = True) -> List[float]:
+    """
+    tfidf_similarity for many document pairs at once.
+    
+    Pairs are laid out as rows of two dense count matrices over their joint
+    vocabulary and scored with one vectorized NumPy computation. Pairs whose
+    vocabulary exceeds max_features (and everything, without NumPy) go
+    through tfidf_similarity one by one.
+    
+    Args:
+        pairs: (counts_a, counts_b) term-count pairs
+        max_features: Vocabulary size limit per pair
+        use_numpy: Allow the vectorized path
+        
+    Returns:
+        Cosine similarities between 0 and 1, in the order of pairs
+    """
+    np = _optional_import('numpy') if use_numpy else None
+    if np is None:
+        return [tfidf_similarity(a, b, max_features, use_numpy) for a, b in pairs]
+    
+    similarities = [0.0] * len(pairs)
+    rows = []
+    for i, (counts_a, counts_b) in enumerate(pairs):
+        if max_features and len(counts_a.keys() | counts_b.keys()) > max_features:
+            similarities[i] = tfidf_similarity(counts_a, counts_b, max_features)
+        else:
+            rows.append(i)
+    if not rows:
+        return similarities
+    
+    vocabulary = {}
+    for i in rows:
+        for counts in pairs[i]:
+            for term in counts:
+                vocabulary.setdefault(term, len(vocabulary))
+    matrix_a = np.zeros((len(rows), len(vocabulary)))
+    matrix_b = np.zeros((len(rows), len(vocabulary)))
+    for row, i in enumerate(rows):
+        counts_a, counts_b = pairs[i]
+        matrix_a[row, [vocabulary[t] for t in counts_a]] = list(counts_a.values())
+        matrix_b[row, [vocabulary[t] for t in counts_b]] = list(counts_b.values())
+    
+    # Smoothed two-document IDF: 1 for shared terms, ln(3/2) + 1 otherwise
+    idf = np.where((matrix_a > 0) & (matrix_b > 0), 1.0, math.log(1.5) + 1)
+    matrix_a *= idf
+    matrix_b *= idf
+    norms = np.sqrt((matrix_a * matrix_a).sum(axis=1) * (matrix_b * matrix_b).sum(axis=1))
+    dots = (matrix_a * matrix_b).sum(axis=1)
+    scores = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+    for row, i in enumerate(rows):
+        similarities[i] = float(scores[row])
+    return similarities
+
+
+class HashingVectorizer:
+    """
+    Stateless TF-IDF vectorizer using feature hashing.
+    
+    Terms are hashed (CRC-32) into a fixed number of buckets, so a document's
+    vector depends only on the document itself (and, optionally, on IDF
+    weights loaded from precomputed corpus statistics). Vectors can therefore
+    be computed once per document, cached or stored, and compared later with
+    a sparse dot product. Vectors are plain {bucket: weight} dictionaries,
+    L2-normalized; transform_many builds a SciPy sparse matrix for bulk scoring.
+    """
+    
+    def __init__(self, n_features: int = 2 ** 20, document_frequency: Dict[int, int] = None,
+                 n_documents: int = 0):
+        """
+        Initialize the vectorizer.
+        
+        Args:
+            n_features: Number of hash buckets
+            document_frequency: Documents containing each bucket, from corpus
+                statistics (without it all IDF weights are 1)
+            n_documents: Number of documents the statistics were computed on
+        """
+        self.n_features = n_features
+        self.document_frequency = document_frequency or {}
+        self.n_documents = n_documents
+        # Smoothed IDF as in scikit-learn; buckets never seen get df = 0
+        self._unseen_idf = math.log(1 + n_documents) + 1 if n_documents else 1.0
+        self._idf = {bucket: math.log((1 + n_documents) / (1 + df)) + 1
+                     for bucket, df in self.document_frequency.items()}
+    
+    def bucket(self, term: str) -> int:
+        """Hash bucket of a term (stable across processes and machines)."""
+        return zlib.crc32(term.encode('utf-8')) % self.n_features
+    
+    def transform(self, term_counts: Dict[str, int]) -> Dict[int, float]:
+        """
+        Vectorize one document.
+        
+        Args:
+            term_counts: Term counts of the document (see count_terms)
+            
+        Returns:
+            L2-normalized sparse vector as {bucket: weight}
+        """
+        counts = {}
+        for term, count in term_counts.items():
+            bucket = self.bucket(term)
+            counts[bucket] = counts.get(bucket, 0) + count
+        idf, unseen_idf = self._idf, self._unseen_idf
+        vector = {bucket: count * idf.get(bucket, unseen_idf) for bucket, count in counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if not norm:
+            return {}
+        return {bucket: weight / norm for bucket, weight in vector.items()}
+    
+    def transform_many(self, term_counts_list: List[Dict[str, int]]):
+        """
+        Vectorize many documents into a SciPy CSR matrix (one row per document).
+        
+        Args:
+            term_counts_list: Term counts of each document
+            
+        Returns:
+            scipy.sparse.csr_matrix of shape (len(term_counts_list), n_features)
+        """
+        sparse = _optional_import('scipy.sparse')
+        np = _optional_import('numpy')
+        if sparse is None or np is None:
+            raise ImportError("SciPy and NumPy are required for sparse matrices")
+        indptr, indices, data = [0], [], []
+        for term_counts in term_counts_list:
+            vector = self.transform(term_counts)
+            indices.extend(vector.keys())
+            data.extend(vector.values())
+            indptr.append(len(indices))
+        return sparse.csr_matrix((np.array(data, dtype=np.float64), np.array(indices, dtype=np.int64),
+                                  np.array(indptr, dtype=np.int64)),
+                                 shape=(len(term_counts_list), self.n_features))
+    
+    @staticmethod
+    def similarity(vector_a: Dict[int, float], vector_b: Dict[int, float]) -> float:
+        """Cosine similarity of two vectors from transform (a sparse dot product)."""
+        if len(vector_a) > len(vector_b):
+            vector_a, vector_b = vector_b, vector_a
+        return sum(weight * vector_b.get(bucket, 0.0) for bucket, weight in vector_a.items())
+    
+    def fit_idf(self, term_counts_list: Iterator[Dict[str, int]]):
+        """
+        Compute corpus statistics (document frequency per bucket) for IDF weights.
+        
+        Args:
+            term_counts_list: Term counts of each corpus document (may be a generator)
+        """
+        document_frequency = Counter()
+        n_documents = 0
+        for term_counts in term_counts_list:
+            document_frequency.update({self.bucket(term) for term in term_counts})
+            n_documents += 1
+        self.__init__(self.n_features, dict(document_frequency), n_documents)
+    
+    def save(self, filename: str):
+        """
+        Save the corpus statistics to a JSON file.
+        
+        Args:
+            filename: Output path
+        """
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump({
+                'n_features': self.n_features,
+                'n_documents': self.n_documents,
+                'document_frequency': {str(bucket): df for bucket, df in sorted(self.document_frequency.items())},
+            }, f)
+    
+    @classmethod
+    def load(cls, filename: str) -> 'HashingVectorizer':
+        """
+        Create a vectorizer from corpus statistics written by save.
+        
+        Args:
+            filename: Path to the JSON statistics file
+            
+        Returns:
+            HashingVectorizer
+        """
+        with open(filename, 'r', encoding='utf-8') as f:
+            stats = json.load(f)
+        return cls(stats['n_features'],
+                   {int(bucket): df for bucket, df in stats['document_frequency'].items()},
+                   stats['n_documents'])
+
+
+# Match scoring engines selectable with SkillGapAnalyzer(scoring=...)
+SCORING_ENGINES = ('tfidf', 'hashing')
+
+
+def sample_text(text: str, max_chars: int, windows: int = 16) -> str:
+    """
+    Evenly spaced excerpts of a document, for estimates under a latency budget.
+    
+    Args:
+        text: Raw document text
+        max_chars: Approximate size of the sample
+        windows: Number of excerpts (spread over the whole document)
+        
+    Returns:
+        The text itself when short enough, otherwise its excerpts cut at
+        whitespace and joined by newlines
+    """
+    if len(text) <= max_chars:
+        return text
+    width = max(1, max_chars // windows)
+    step = len(text) / windows
+    excerpts = []
+    for i in range(windows):
+        start = int(i * step)
+        # Drop the (possibly cut) first and last words
+        words = text[start:start + width].split(None, 1)
+        if len(words) == 2:
+            excerpts.append(words[1].rsplit(None, 1)[0])
+    return '\n'.join(excerpts)
+
+
+def count_similarity(counts_a: Dict[str, int], counts_b: Dict[str, int]) -> float:
+    """Plain cosine similarity of two count vectors (the cheapest score estimate)."""
+    if len(counts_a) > len(counts_b):
+        counts_a, counts_b = counts_b, counts_a
+    dot = sum(count * counts_b.get(term, 0) for term, count in counts_a.items())
+    norm = math.sqrt(sum(c * c for c in counts_a.values()) * sum(c * c for c in counts_b.values()))
+    return dot / norm if norm else 0.0
+
+
+class StageCosts:
+    """
+    Running cost estimates of the analysis stages, for deadline-aware analysis.
+    
+    Costs are seconds per unit: characters for the text scans, distinct terms
+    (plus a fixed overhead) for scoring. Slower observations replace an
+    estimate at once and faster ones pull it down gradually, so a budget
+    errs towards approximating rather than overrunning.
+    """
+    
+    # Start at roughly twice the cost measured on a typical machine
+    PRIORS = {
+        'tokenize': 1.5e-7,
+        'skill_scan': 4e-7,
+        'vectorize': 1.5e-7,
+        'similarity': 2e-6,
+        'build': 2e-4,
+    }
+    # Fixed scoring overhead, in terms
+    SIMILARITY_OVERHEAD = 200
+    
+    def __init__(self):
+        self.rates = dict(self.PRIORS)
+    
+    def predict(self, stage: str, units: float = 1) -> float:
+        """Expected seconds for a stage over the given number of units."""
+        if stage == 'similarity':
+            units += self.SIMILARITY_OVERHEAD
+        return self.rates[stage] * units
+    
+    def observe(self, stage: str, seconds: float, units: float = 1):
+        """Update a stage estimate with one measured run."""
+        if stage == 'similarity':
+            units += self.SIMILARITY_OVERHEAD
+        if units <= 0:
+            return
+        rate = seconds / units
+        current = self.rates[stage]
+        self.rates[stage] = rate if rate > current else 0.9 * current + 0.1 * rate
+
+
+class DocumentCache:
+    """
+    Content-addressed cache of DocumentProfile objects.
+    
+    Profiles are kept in an in-process LRU bounded by their pickled size and,
+    optionally, in a directory on disk that survives restarts. Hit, miss and
+    eviction counters are available through stats().
+    """
+    
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, disk_dir: str = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_bytes: Size limit of the in-memory tier (pickled bytes)
+            disk_dir: Optional directory for the persistent tier
+        """
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self._entries = OrderedDict()  # key -> (profile, size)
+        self.current_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+    
+    @staticmethod
+    def make_key(text: str, salt: str = "") -> str:
+        """
+        Hash a document into a cache key.
+        
+        Args:
+            text: Document text
+            salt: Analyzer configuration fingerprint
+            
+        Returns:
+            Hex digest identifying the document under this configuration
+        """
+        digest = hashlib.sha256(salt.encode('utf-8'))
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+    
+    def get(self, key: str):
+        """
+        Look up a profile, checking memory first and then disk.
+        
+        Args:
+            key: Cache key from make_key
+            
+        Returns:
+            The cached DocumentProfile, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(key), 'rb') as f:
+                    data = f.read()
+                profile = DocumentProfile(*pickle.loads(data))
+            except Exception:
+                profile = None
+            if profile is not None:
+                self.disk_hits += 1
+                self._store(key, profile, len(data))
+                return profile
+        
+        self.misses += 1
+        return None
+    
+    def put(self, key: str, profile: DocumentProfile):
+        """
+        Store a profile in memory and, if configured, on disk.
+        
+        Args:
+            key: Cache key from make_key
+            profile: Profile to store
+        """
+        data = pickle.dumps(tuple(profile), pickle.HIGHEST_PROTOCOL)
+        self._store(key, profile, len(data))
+        if self.disk_dir:
+            path = self._disk_path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so readers never see partial entries
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+    
+    def _store(self, key: str, profile: DocumentProfile, size: int):
+        """Insert into the memory tier and evict least recently used entries."""
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.current_bytes -= old[1]
+        self._entries[key] = (profile, size)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+    
+    def _disk_path(self, key: str) -> str:
+        """Path of the on-disk entry for a key."""
+        return os.path.join(self.disk_dir, key[:2], key + '.pkl')
+    
+    def clear(self):
+        """Drop every entry from the memory tier."""
+        self._entries.clear()
+        self.current_bytes = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters and current memory usage."""
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+
+# Keys of an analysis result, in the order analyze() has always returned them
+RESULT_FIELDS = (
+    'matched_skills', 'missing_skills', 'extra_skills', 'match_percentage', 'top_relevant_skills',
+    'recommendations', 'total_resume_skills', 'total_job_skills', 'match_count',
+)
+_RESULT_FIELD_SET = frozenset(RESULT_FIELDS)
+
+# Fields a deadline-aware analysis may approximate (see SkillGapAnalyzer.analyze)
+SKILL_FIELDS = ('matched_skills', 'missing_skills', 'extra_skills', 'top_relevant_skills',
+                'recommendations', 'total_resume_skills', 'total_job_skills', 'match_count')
+
+# Binary result header: magic, skill table checksum, match percentage, resume and
+# job skill totals, then the lengths of the matched, missing, extra and top id lists.
+# Approximate results use the second magic and end with a bitmask of their
+# approximate fields (bit i = RESULT_FIELDS[i]).
+_RESULT_HEADER = struct.Struct('<4sIdIIIIII')
+_RESULT_MAGIC = b'SGR1'
+_RESULT_MAGIC_APPROXIMATE = b'SGR2'
+_RESULT_MASK = struct.Struct('<I')
+
+
+class SkillTable:
+    """
+    Interned skill names shared by the results of one analyzer.
+    
+    Skill ids follow sorted name order, so a sorted id tuple decodes to a
+    sorted name list. Learning recommendations and their JSON encoding are
+    built once per skill, on first use.
+    """
+    
+    __slots__ = ('names', 'ids', 'typecode', 'checksum', '_recommend', '_recommendations',
+                 '_json_names', '_json_recommendations')
+    
+    def __init__(self, skills, recommend):
+        """
+        Intern a skill set.
+        
+        Args:
+            skills: Canonical skill names
+            recommend: Function mapping a skill name to its recommendation dictionary
+        """
+        self.names = tuple(sorted(skills))
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.typecode = 'H' if len(self.names) <= 0xFFFF else 'I'
+        self.checksum = zlib.crc32('\n'.join(self.names).encode('utf-8'))
+        self._recommend = recommend
+        self._recommendations = [None] * len(self.names)
+        self._json_names = None
+        self._json_recommendations = {}
+    
+    def encode(self, skills) -> Tuple[int, ...]:
+        """Sorted ids of a set of skill names."""
+        ids = self.ids
+        return tuple(sorted(ids[skill] for skill in skills))
+    
+    def decode(self, skill_ids) -> List[str]:
+        """Skill names of a sequence of ids."""
+        names = self.names
+        return [names[i] for i in skill_ids]
+    
+    def recommendation(self, skill_id: int) -> Dict[str, str]:
+        """Learning recommendation for a skill (a new dictionary each call)."""
+        found = self._recommendations[skill_id]
+        if found is None:
+            found = self._recommendations[skill_id] = self._recommend(self.names[skill_id])
+        return dict(found)
+    
+    @property
+    def json_names(self) -> Tuple[str, ...]:
+        """JSON string literal of every skill name, by id."""
+        if self._json_names is None:
+            self._json_names = tuple(json.dumps(name) for name in self.names)
+        return self._json_names
+    
+    def json_recommendation(self, skill_id: int) -> str:
+        """JSON object of a skill's recommendation."""
+        found = self._json_recommendations.get(skill_id)
+        if found is None:
+            found = self._json_recommendations[skill_id] = json.dumps(self.recommendation(skill_id))
+        return found
+
+
+class AnalysisResult(Mapping):
+    """
+    Compact, read-only result of one resume / job description analysis.
+    
+    Skills are kept as tuples of SkillTable ids; name lists and
+    recommendations are only built when accessed. The Mapping interface
+    gives the same keys and values as the dictionary analyze() used to
+    return, so result['matched_skills'], dict(result) and {**result} keep
+    working; to_dict() returns a plain dictionary. Pickling (e.g. between
+    processes) also produces a plain dictionary, since the skill table
+    stays with its analyzer.
+    
+    A deadline-aware analysis that ran out of time names its estimated
+    fields in approximate; such results also carry an 'approximate' key
+    (exact results do not, so their output is unchanged).
+    """
+    
+    __slots__ = ('table', 'matched_ids', 'missing_ids', 'extra_ids', 'top_ids',
+                 'match_percentage', 'total_resume_skills', 'total_job_skills', 'approximate')
+    
+    # Recommendations cover the first missing skills in name order
+    MAX_RECOMMENDATIONS = 10
+    
+    def __init__(self, table: SkillTable, matched_ids: Tuple[int, ...], missing_ids: Tuple[int, ...],
+                 extra_ids: Tuple[int, ...], top_ids: Tuple[int, ...], match_percentage: float,
+                 total_resume_skills: int, total_job_skills: int, approximate: Tuple[str, ...] = ()):
+        """
+        Args:
+            table: Skill table the ids refer to
+            matched_ids: Sorted ids of skills in both documents
+            missing_ids: Sorted ids of job skills missing from the resume
+            extra_ids: Sorted ids of resume skills the job does not ask for
+            top_ids: Ids of the most relevant job skills, most relevant first
+            match_percentage: Document similarity (0-100)
+            total_resume_skills: Number of resume skills
+            total_job_skills: Number of job skills
+            approximate: Names of estimated fields (empty for an exact result)
+        """
+        self.table = table
+        self.matched_ids = matched_ids
+        self.missing_ids = missing_ids
+        self.extra_ids = extra_ids
+        self.top_ids = top_ids
+        self.match_percentage = match_percentage
+        self.total_resume_skills = total_resume_skills
+        self.total_job_skills = total_job_skills
+        self.approximate = approximate
+    
+    @property
+    def exact(self) -> bool:
+        """True unless some field was approximated to meet a latency budget."""
+        return not self.approximate
     
-    # Databases
-    'mysql', 'postgresql', 'mongodb', 'oracle', 'redis', 'cassandra', 
-    'dynamodb', 'sqlite', 'mariadb', 'elasticsearch', 'neo4j',
+    @property
+    def matched_skills(self) -> List[str]:
+        return self.table.decode(self.matched_ids)
     
-    # Cloud & DevOps
-    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform', 
-    'ansible', 'ci/cd', 'git', 'github', 'gitlab', 'bitbucket',
+    @property
+    def missing_skills(self) -> List[str]:
+        return self.table.decode(self.missing_ids)
     
-    # Data Science & ML
-    'machine learning', 'deep learning', 'neural networks', 'tensorflow', 
-    'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 
-    'data analysis', 'data visualization', 'nlp', 'computer vision',
+    @property
+    def extra_skills(self) -> List[str]:
+        return self.table.decode(self.extra_ids)
     
-    # Soft Skills
-    'communication', 'leadership', 'teamwork', 'problem solving', 
-    'critical thinking', 'time management', 'adaptability', 'creativity',
-    'collaboration', 'presentation', 'analytical', 'organizational',
+    @property
+    def top_relevant_skills(self) -> List[str]:
+        return self.table.decode(self.top_ids)
     
-    # Methodologies & Practices
-    'agile', 'scrum', 'kanban', 'waterfall', 'devops', 'tdd', 'bdd',
-    'microservices', 'api', 'rest', 'graphql', 'oauth', 'jwt',
+    @property
+    def recommendations(self) -> List[Dict[str, str]]:
+        return [self.table.recommendation(i) for i in self.missing_ids[:self.MAX_RECOMMENDATIONS]]
     
-    # Tools & Frameworks
-    'jira', 'confluence', 'slack', 'vs code', 'intellij', 'eclipse',
-    'postman', 'swagger', 'figma', 'adobe', 'photoshop',
-}
-
-
-class TextPreprocessor:
-    """Handles text preprocessing tasks including cleaning, tokenization, and normalization."""
+    @property
+    def match_count(self) -> int:
+        return len(self.matched_ids)
     
-    def __init__(self):
-        """Initialize the preprocessor with stopwords."""
-        try:
-            self.stop_words = set(stopwords.words('english'))
-        except:
-            # Fallback to basic English stop words if NLTK not available
-            self.stop_words = {
-                'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', 
-                'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his', 'himself',
-                'she', 'her', 'hers', 'herself', 'it', 'its', 'itself', 'they', 'them',
-                'their', 'theirs', 'themselves', 'what', 'which', 'who', 'whom', 'this',
-                'that', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'been', 'being',
-                'have', 'has', 'had', 'having', 'do', 'does', 'did', 'doing', 'a', 'an',
-                'the', 'and', 'but', 'if', 'or', 'because', 'as', 'until', 'while', 'of',
-                'at', 'by', 'for', 'with', 'about', 'against', 'between', 'into', 'through',
-                'during', 'before', 'after', 'above', 'below', 'to', 'from', 'up', 'down',
-                'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then', 'once'
-            }
+    def __getitem__(self, key: str):
+        if key in _RESULT_FIELD_SET:
+            return getattr(self, key)
+        if key == 'approximate' and self.approximate:
+            return list(self.approximate)
+        raise KeyError(key)
     
-    def clean_text(self, text: str) -> str:
+    def __iter__(self):
+        if self.approximate:
+            return iter(RESULT_FIELDS + ('approximate',))
+        return iter(RESULT_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(RESULT_FIELDS) + (1 if self.approximate else 0)
+    
+    def __contains__(self, key) -> bool:
+        return key in _RESULT_FIELD_SET or (key == 'approximate' and bool(self.approximate))
+    
+    def __repr__(self) -> str:
+        return f"AnalysisResult({self.to_dict()!r})"
+    
+    def __reduce__(self):
+        return (dict, (self.to_dict(),))
+    
+    def to_dict(self) -> Dict:
+        """The result as a plain dictionary."""
+        result = {key: getattr(self, key) for key in RESULT_FIELDS}
+        if self.approximate:
+            result['approximate'] = list(self.approximate)
+        return result
+    
+    def to_json(self) -> str:
         """
-        Clean text by removing special characters and normalizing whitespace.
+        Serialize to JSON, identical to json.dumps(result.to_dict()).
+        
+        Skill names and recommendations are encoded once per skill table,
+        so only the numbers and the joins are left per result.
+        """
+        table = self.table
+        name = table.json_names.__getitem__
+        matched = ', '.join(map(name, self.matched_ids))
+        missing = ', '.join(map(name, self.missing_ids))
+        extra = ', '.join(map(name, self.extra_ids))
+        top = ', '.join(map(name, self.top_ids))
+        recommendations = ', '.join(map(table.json_recommendation, self.missing_ids[:self.MAX_RECOMMENDATIONS]))
+        approximate = f', "approximate": {json.dumps(list(self.approximate))}' if self.approximate else ''
+        return (f'{{"matched_skills": [{matched}], "missing_skills": [{missing}], '
+                f'"extra_skills": [{extra}], "match_percentage": {json.dumps(self.match_percentage)}, '
+                f'"top_relevant_skills": [{top}], "recommendations": [{recommendations}], '
+                f'"total_resume_skills": {self.total_resume_skills}, '
+                f'"total_job_skills": {self.total_job_skills}, "match_count": {len(self.matched_ids)}{approximate}}}')
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to a compact binary record (see from_bytes).
+        
+        Returns:
+            Header followed by the skill ids as 2- or 4-byte integers
+        """
+        table = self.table
+        header = _RESULT_HEADER.pack(
+            _RESULT_MAGIC_APPROXIMATE if self.approximate else _RESULT_MAGIC, table.checksum, self.match_percentage, self.total_resume_skills,
+            self.total_job_skills, len(self.matched_ids), len(self.missing_ids),
+            len(self.extra_ids), len(self.top_ids))
+        ids = array(table.typecode, self.matched_ids + self.missing_ids + self.extra_ids + self.top_ids)
+        if sys.byteorder != 'little':
+            ids.byteswap()
+        if self.approximate:
+            mask = sum(1 << RESULT_FIELDS.index(name) for name in self.approximate)
+            return header + ids.tobytes() + _RESULT_MASK.pack(mask)
+        return header + ids.tobytes()
+    
+    @classmethod
+    def from_bytes(cls, data: bytes, table: SkillTable) -> 'AnalysisResult':
+        """
+        Restore a result written by to_bytes.
         
         Args:
-            text: Raw input text
+            data: Binary record
+            table: Skill table of the analyzer that wrote it (same skills)
             
         Returns:
-            Cleaned text in lowercase
+            AnalysisResult
         """
-        if not text or not isinstance(text, str):
-            return ""
+        (magic, checksum, match_percentage, total_resume, total_job,
+         matched, missing, extra, top) = _RESULT_HEADER.unpack_from(data)
+        if magic not in (_RESULT_MAGIC, _RESULT_MAGIC_APPROXIMATE):
+            raise ValueError("Not a serialized analysis result")
+        if checksum != table.checksum:
+            raise ValueError("Analysis result was written with a different skill table")
+        c = matched + missing + extra
+        end = _RESULT_HEADER.size + (c + top) * array(table.typecode).itemsize
+        ids = array(table.typecode)
+        ids.frombytes(data[_RESULT_HEADER.size:end])
+        if sys.byteorder != 'little':
+            ids.byteswap()
+        ids = tuple(ids)
+        approximate = ()
+        if magic == _RESULT_MAGIC_APPROXIMATE:
+            mask, = _RESULT_MASK.unpack_from(data, end)
+            approximate = tuple(name for i, name in enumerate(RESULT_FIELDS) if mask >> i & 1)
+        a, b = matched, matched + missing
+        return cls(table, ids[:a], ids[a:b], ids[b:c], ids[c:c + top],
+                   match_percentage, total_resume, total_job, approximate)
+
+
+class SkillGapAnalyzer:
+    """Main analyzer class that compares resume with job description."""
+    
+    def __init__(self, cache: DocumentCache = None, minimal: bool = False, instrumentation=None,
+                 taxonomy=None, scoring: str = 'tfidf', hasher: HashingVectorizer = None,
+                 fuzzy_threshold: float = None, tokenizer: str = 'regex'):
+        """
+        Initialize the analyzer with preprocessor and skill extractor.
         
-        # Convert to lowercase
-        text = text.lower()
+        Args:
+            cache: Optional DocumentCache for preprocessed document profiles
+            minimal: Run without NLTK, scikit-learn or NumPy (fast startup)
+            instrumentation: Optional object with stage(name) and request(name)
+                context managers (see instrumentation.Instrumentation)
+            taxonomy: Optional compiled skill taxonomy replacing SKILL_DICTIONARY
+                (see skill_taxonomy.SkillTaxonomy)
+            scoring: Match scoring engine: 'tfidf' (TF-IDF fitted on each pair)
+                or 'hashing' (stateless HashingVectorizer vectors)
+            hasher: HashingVectorizer for the 'hashing' engine, e.g. with
+                corpus IDF statistics (default: plain term frequencies)
+            fuzzy_threshold: Also match misspelled skills with at least this
+                trigram similarity (e.g. 0.75); None for exact and alias matching only
+            tokenizer: Preprocessing tokenizer engine, 'regex' or 'nltk'
+                (see TextPreprocessor); skills and scores do not depend on it
+        """
+        if scoring not in SCORING_ENGINES:
+            raise ValueError(f"Unknown scoring engine {scoring!r} (choose from {', '.join(SCORING_ENGINES)})")
+        self.minimal = minimal
+        self.scoring = scoring
+        self.hasher = hasher if hasher is not None or scoring != 'hashing' else HashingVectorizer()
+        self.instrumentation = instrumentation
+        self.taxonomy = taxonomy
+        self.preprocessor = TextPreprocessor(minimal=minimal, tokenizer=tokenizer)
+        self.cache = cache
+        # Shared TF-IDF model used by the batch API (see fit_vectorizer)
+        self.vectorizer = None
+        # Interned skill names of the results (see skill_table)
+        self._skill_table = None
+        # Stage cost estimates for analyze(budget=...)
+        self.stage_costs = StageCosts()
+        # Cache keys depend on the skill dictionary as well as the text
+        if taxonomy is not None:
+            self.skill_extractor = SkillExtractor(taxonomy.skills, matcher=taxonomy.matcher,
+                                                  fuzzy_threshold=fuzzy_threshold)
+            fingerprint = taxonomy.fingerprint
+        else:
+            self.skill_extractor = SkillExtractor(SKILL_DICTIONARY, fuzzy_threshold=fuzzy_threshold)
+            fingerprint = hashlib.sha256(repr(sorted(self.skill_extractor.skill_variations.items())).encode('utf-8')).hexdigest()
+        if fuzzy_threshold is not None:
+            fingerprint += f":fuzzy={fuzzy_threshold}"
+        if tokenizer != 'regex':
+            fingerprint += f":tokenizer={tokenizer}"
+        self._profile_salt = f"{PROFILE_VERSION}:{fingerprint}:"
+    
+    def profile(self, text: str) -> DocumentProfile:
+        """
+        Preprocess a document, extract its skills and vectorize it.
         
-        # Keep alphanumeric, spaces, and some special chars like +, #, .
-        text = re.sub(r'[^a-z0-9\s+#./]', ' ', text)
+        Results are looked up in and stored to the cache when one is configured.
         
-        # Normalize whitespace
-        text = ' '.join(text.split())
+        Args:
+            text: Raw document text
+            
+        Returns:
+            DocumentProfile for the text
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(text, self._profile_salt)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
         
-        return text
+        # Same steps as TextPreprocessor.preprocess, timed separately (the regex
+        # engine cleans and removes stop words in its single tokenize pass)
+        if self.preprocessor.tokenizer == 'regex':
+            with self._stage('tokenize'):
+                tokens = self.preprocessor.preprocess(text)
+        else:
+            with self._stage('clean'):
+                cleaned = self.preprocessor.clean_text(text)
+            with self._stage('tokenize'):
+                tokens = self.preprocessor.tokenize(cleaned)
+            with self._stage('remove_stopwords'):
+                tokens = self.preprocessor.remove_stopwords(tokens)
+        with self._stage('skill_scan'):
+            skill_counts = self.skill_extractor.extract_skill_counts(tokens, text)
+        with self._stage('vectorize'):
+            term_counts = count_terms(text)
+        profile = DocumentProfile(
+            tokens=tuple(tokens),
+            skills=frozenset(skill_counts),
+            skill_counts=dict(skill_counts),
+            term_counts=term_counts,
+        )
+        
+        if key is not None:
+            self.cache.put(key, profile)
+        return profile
     
-    def tokenize(self, text: str) -> List[str]:
+    def profile_stream(self, chunks: Iterator[str], keep_tokens: bool = False) -> DocumentProfile:
         """
-        Tokenize text into words.
+        Build a DocumentProfile from text arriving in chunks.
+        
+        Preprocessing, skill matching and term counting all consume the same
+        single pass over the chunks, so peak memory depends on the chunk size
+        rather than on the document size. Streamed profiles are not cached.
         
         Args:
-            text: Input text
+            chunks: Iterable of text chunks (e.g. from iter_file_chunks)
+            keep_tokens: Also keep the processed token list (grows with the input)
             
         Returns:
-            List of tokens
+            DocumentProfile for the concatenated text
         """
-        try:
-            # Use NLTK tokenizer if available
-            tokens = word_tokenize(text)
-        except:
-            # Fallback to simple split
-            tokens = text.split()
+        tokens = []
+        term_counts = Counter()
+        fuzzy_counts = Counter()
+        fuzzy_index = self.skill_extractor.fuzzy_index
         
-        return tokens
+        def segments():
+            for segment in iter_complete_segments(chunks):
+                segment = segment.lower()
+                processed = self.preprocessor.preprocess(segment)
+                if keep_tokens:
+                    tokens.extend(processed)
+                term_counts.update(_TERM_PATTERN.findall(segment))
+                # Segments end at whitespace, so no word is split between them
+                if fuzzy_index is not None:
+                    fuzzy_counts.update(match.skill for match in fuzzy_index.iter_matches(segment))
+                yield segment
+        
+        matches = self.skill_extractor.matcher.iter_matches_stream(segments())
+        skill_counts = count_matches(matches)
+        skill_counts.update(fuzzy_counts)
+        return DocumentProfile(
+            tokens=tuple(tokens),
+            skills=frozenset(skill_counts),
+            skill_counts=dict(skill_counts),
+            term_counts=dict(term_counts),
+        )
     
-    def remove_stopwords(self, tokens: List[str]) -> List[str]:
+    def analyze_files(self, resume_file: str, job_desc_file: str,
+                      chunk_size: int = 1024 * 1024) -> AnalysisResult:
         """
-        Remove stop words from token list.
+        Perform complete skill gap analysis on two files without loading them whole.
         
         Args:
-            tokens: List of word tokens
+            resume_file: Path to the resume
+            job_desc_file: Path to the job description
+            chunk_size: Bytes read per chunk
             
         Returns:
-            Filtered list without stop words
+            AnalysisResult, identical to analyze on the file contents
         """
-        return [token for token in tokens if token not in self.stop_words and len(token) > 2]
+        def profile_file(filename: str, label: str) -> DocumentProfile:
+            # Empty means nothing but whitespace, as in analyze
+            blank = True
+            
+            def chunks():
+                nonlocal blank
+                for chunk in iter_file_chunks(filename, chunk_size):
+                    blank = blank and chunk.isspace()
+                    yield chunk
+            
+            profile = self.profile_stream(chunks())
+            if blank:
+                raise ValueError(f"{label} cannot be empty")
+            return profile
+        
+        resume_profile = profile_file(resume_file, "Resume text")
+        job_profile = profile_file(job_desc_file, "Job description text")
+        
+        similarity = self._similarity(resume_profile.term_counts, job_profile.term_counts)
+        return self._build_result(resume_profile, job_profile, round(similarity * 100, 2))
     
-    def preprocess(self, text: str) -> List[str]:
+    def calculate_match_percentage(self, resume_text: str, job_desc_text: str) -> float:
         """
-        Full preprocessing pipeline: clean, tokenize, and remove stop words.
+        Calculate similarity between resume and job description using TF-IDF and cosine similarity.
         
         Args:
-            text: Raw input text
+            resume_text: Resume text
+            job_desc_text: Job description text
             
         Returns:
-            List of processed tokens
+            Match percentage (0-100)
         """
-        cleaned = self.clean_text(text)
-        tokens = self.tokenize(cleaned)
-        filtered = self.remove_stopwords(tokens)
-        return filtered
-
-
-class SkillExtractor:
-    """Extracts technical and soft skills from text using a skill dictionary."""
+        # TF-IDF vectorization of the pair and cosine similarity, from term counts
+        similarity = self._similarity(count_terms(resume_text), count_terms(job_desc_text))
+        
+        # Convert to percentage
+        return round(similarity * 100, 2)
+    
+    def _similarity(self, counts_a: Dict[str, int], counts_b: Dict[str, int]) -> float:
+        """Cosine similarity of two term-count vectors under the selected scoring engine."""
+        if self.scoring == 'hashing':
+            return self.hasher.similarity(self.hasher.transform(counts_a), self.hasher.transform(counts_b))
+        return tfidf_similarity(counts_a, counts_b, use_numpy=not self.minimal)
     
-    def __init__(self, skill_dict: Set[str]):
+    @staticmethod
+    def _overlap_percentage(resume_words: Set[str], job_words: Set[str]) -> float:
+        """Share of job words that also appear in the resume, as a percentage."""
+        if not job_words:
+            return 0.0
+        
+        overlap = len(resume_words & job_words)
+        percentage = (overlap / len(job_words)) * 100
+        return round(percentage, 2)
+    
+    def fit_vectorizer(self, corpus: List[str], max_features: int = None):
         """
-        Initialize with a skill dictionary.
+        Fit one TF-IDF model over a corpus for use by the batch API.
+        
+        The IDF weights then come from the whole corpus instead of a single
+        resume/job pair, so batch match percentages are comparable across pairs.
         
         Args:
-            skill_dict: Set of skills to look for
+            corpus: Documents to fit on (typically all resumes and jobs)
+            max_features: Optional vocabulary size limit
         """
-        self.skill_dict = skill_dict
-        # Create variations for better matching
-        self.skill_variations = self._create_skill_variations()
+        self.vectorizer = self._fit_tfidf(corpus, max_features)
     
-    def _create_skill_variations(self) -> Dict[str, str]:
+    @staticmethod
+    def _fit_tfidf(corpus: List[str], max_features: int = None):
+        """A TfidfVectorizer fitted on corpus (ImportError without scikit-learn)."""
+        text_features = _optional_import('sklearn.feature_extraction.text')
+        if text_features is None:
+            raise ImportError("scikit-learn is required for a shared TF-IDF model")
+        vectorizer = text_features.TfidfVectorizer(max_features=max_features)
+        vectorizer.fit(corpus)
+        return vectorizer
+    
+    def save_vectorizer(self, filename: str):
         """
-        Create normalized versions of skills for better matching.
+        Save the shared TF-IDF model to a file.
         
-        Returns:
-            Dictionary mapping normalized skill names to canonical forms
+        Args:
+            filename: Output path
         """
-        variations = {}
-        for skill in self.skill_dict:
-            # Normalize: remove spaces, dots, slashes
-            normalized = skill.replace(' ', '').replace('.', '').replace('/', '')
-            variations[normalized] = skill
-            variations[skill] = skill  # Also keep original
-        return variations
+        if self.vectorizer is None:
+            raise ValueError("No vectorizer has been fitted")
+        with open(filename, 'wb') as f:
+            pickle.dump(self.vectorizer, f)
     
-    def extract_skills(self, tokens: List[str], original_text: str = "") -> Set[str]:
+    def load_vectorizer(self, filename: str):
         """
-        Extract skills from tokenized text and original text.
+        Load a shared TF-IDF model previously written by save_vectorizer.
         
         Args:
-            tokens: Preprocessed tokens
-            original_text: Original text (for multi-word skills)
+            filename: Path to the pickled vectorizer
+        """
+        with open(filename, 'rb') as f:
+            self.vectorizer = pickle.load(f)
+    
+    def score_many(self, resumes: List[str], jobs: List[str]):
+        """
+        Calculate match percentages for every resume against every job.
+        
+        All documents are transformed once with the shared TF-IDF model, or,
+        unless one was fitted or loaded, with a model fitted on just this call's
+        resumes + jobs (and not kept), and the scores come from a single
+        sparse matrix product. The 'hashing' engine uses the analyzer's
+        HashingVectorizer instead; it is also the fallback without scikit-learn
+        (with IDF statistics computed over resumes + jobs).
+        
+        Args:
+            resumes: Resume texts
+            jobs: Job description texts
             
         Returns:
-            Set of found skills
+            len(resumes) x len(jobs) array of match percentages (0-100)
         """
-        found_skills = set()
+        if self.scoring == 'hashing':
+            return self._score_many_hashing(self.hasher, resumes, jobs)
         
-        # Search in tokens (single-word skills)
-        for token in tokens:
-            normalized = token.replace('.', '').replace('/', '')
-            if normalized in self.skill_variations:
-                found_skills.add(self.skill_variations[normalized])
+        vectorizer = self.vectorizer
+        if vectorizer is None and not self.minimal:
+            try:
+                vectorizer = self._fit_tfidf(list(resumes) + list(jobs))
+            except ImportError:
+                _warn_once("scikit-learn not available. Batch match percentages use the hashing vectorizer.")
         
-        # Search for multi-word skills in original text
-        original_lower = original_text.lower()
-        for skill in self.skill_dict:
-            if ' ' in skill or '.' in skill:
-                # Multi-word skill or skill with dots (e.g., "machine learning", "node.js")
-                if skill in original_lower:
-                    found_skills.add(skill)
+        if vectorizer is not None:
+            resume_matrix = vectorizer.transform(resumes)
+            job_matrix = vectorizer.transform(jobs)
+            # Rows are L2-normalized, so the dot product is the cosine similarity
+            similarity = (resume_matrix @ job_matrix.T).toarray()
+            return (similarity * 100).round(2)
         
-        return found_skills
-
-
-class SkillGapAnalyzer:
-    """Main analyzer class that compares resume with job description."""
+        # No shared model (minimal mode or no scikit-learn): hashed TF-IDF with batch IDF
+        hasher = HashingVectorizer()
+        hasher.fit_idf(count_terms(text) for text in list(resumes) + list(jobs))
+        return self._score_many_hashing(hasher, resumes, jobs)
     
-    def __init__(self):
-        """Initialize the analyzer with preprocessor and skill extractor."""
-        self.preprocessor = TextPreprocessor()
-        self.skill_extractor = SkillExtractor(SKILL_DICTIONARY)
+    def _score_many_hashing(self, hasher: HashingVectorizer, resumes: List[str], jobs: List[str]):
+        """score_many with hashed vectors: a sparse matrix product, or pairwise without SciPy."""
+        resume_counts = [count_terms(text) for text in resumes]
+        job_counts = [count_terms(text) for text in jobs]
+        if not self.minimal:
+            try:
+                similarity = (hasher.transform_many(resume_counts) @ hasher.transform_many(job_counts).T).toarray()
+                return (similarity * 100).round(2)
+            except ImportError:
+                pass
+        job_vectors = [hasher.transform(counts) for counts in job_counts]
+        scores = []
+        for counts in resume_counts:
+            resume_vector = hasher.transform(counts)
+            scores.append([round(hasher.similarity(resume_vector, job_vector) * 100, 2)
+                           for job_vector in job_vectors])
+        return scores
     
-    def calculate_match_percentage(self, resume_text: str, job_desc_text: str) -> float:
+    def analyze_pairs(self, pairs: List[Tuple[str, str]]) -> List[AnalysisResult]:
         """
-        Calculate similarity between resume and job description using TF-IDF and cosine similarity.
+        Perform complete skill gap analysis for a batch of (resume, job) pairs.
+        
+        Results are identical to calling analyze on each pair, but documents are
+        profiled once per batch (and through the cache) and, with the 'tfidf'
+        engine, all match percentages are computed together by
+        tfidf_similarity_batch.
         
         Args:
-            resume_text: Resume text
-            job_desc_text: Job description text
+            pairs: (resume_text, job_desc_text) tuples
             
         Returns:
-            Match percentage (0-100)
+            Analysis results, in the order of pairs
         """
-        try:
-            # Use TF-IDF vectorization
-            vectorizer = TfidfVectorizer(max_features=500)
-            tfidf_matrix = vectorizer.fit_transform([resume_text, job_desc_text])
-            
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+        for i, (resume_text, job_desc_text) in enumerate(pairs):
+            if not resume_text or not resume_text.strip():
+                raise ValueError(f"Resume text cannot be empty (pair {i})")
+            if not job_desc_text or not job_desc_text.strip():
+                raise ValueError(f"Job description text cannot be empty (pair {i})")
+        
+        with self._request('analyze_pairs'):
+            profiles = {}
+            for text in {text for pair in pairs for text in pair}:
+                profiles[text] = self.profile(text)
+            profile_pairs = [(profiles[resume], profiles[job]) for resume, job in pairs]
             
-            # Convert to percentage
-            return round(similarity * 100, 2)
-        except:
-            # Fallback: simple word overlap calculation
-            resume_words = set(resume_text.lower().split())
-            job_words = set(job_desc_text.lower().split())
+            with self._stage('similarity'):
+                if self.scoring == 'hashing':
+                    similarities = [self._similarity(resume.term_counts, job.term_counts)
+                                    for resume, job in profile_pairs]
+                else:
+                    similarities = tfidf_similarity_batch(
+                        [(resume.term_counts, job.term_counts) for resume, job in profile_pairs],
+                        use_numpy=not self.minimal)
             
-            if not job_words:
-                return 0.0
+            return [self._build_result(resume, job, round(similarity * 100, 2))
+                    for (resume, job), similarity in zip(profile_pairs, similarities)]
+    
+    def analyze_many(self, resumes: List[str], jobs: List[str]) -> Iterator[Tuple[int, int, AnalysisResult]]:
+        """
+        Perform skill gap analysis for every resume against every job.
+        
+        Each document is preprocessed and skill-extracted once, and match
+        percentages come from score_many, so the cost grows with the number of
+        documents rather than the number of pairs.
+        
+        Args:
+            resumes: Resume texts
+            jobs: Job description texts
             
-            overlap = len(resume_words & job_words)
-            percentage = (overlap / len(job_words)) * 100
-            return round(percentage, 2)
+        Yields:
+            (resume_index, job_index, analysis results) tuples
+        """
+        for i, resume_text in enumerate(resumes):
+            if not resume_text or not resume_text.strip():
+                raise ValueError(f"Resume text cannot be empty (resume {i})")
+        for j, job_desc_text in enumerate(jobs):
+            if not job_desc_text or not job_desc_text.strip():
+                raise ValueError(f"Job description text cannot be empty (job {j})")
+        
+        scores = self.score_many(resumes, jobs)
+        resume_profiles = [self.profile(text) for text in resumes]
+        job_profiles = [self.profile(text) for text in jobs]
+        
+        for i, resume_profile in enumerate(resume_profiles):
+            for j, job_profile in enumerate(job_profiles):
+                yield i, j, self._build_result(resume_profile, job_profile, float(scores[i][j]))
     
-    def analyze(self, resume_text: str, job_desc_text: str) -> Dict:
+    def analyze(self, resume_text: str, job_desc_text: str, budget: float = None) -> AnalysisResult:
         """
         Perform complete skill gap analysis.
         
+        With a latency budget the skill sets come first and stay exact while
+        their scan fits; the match percentage is computed exactly only if time
+        remains, otherwise estimated from excerpts of the documents or from
+        their skill counts. Fields that had to be estimated are listed in the
+        result's approximate attribute.
+        
         Args:
             resume_text: Candidate's resume text
             job_desc_text: Job description text
+            budget: Optional latency budget in seconds
             
         Returns:
-            Dictionary with analysis results
+            AnalysisResult: a read-only mapping with the matched, missing and
+            extra skills, match percentage, top skills and recommendations
         """
         # Validate inputs
         if not resume_text or not resume_text.strip():
@@ -275,109 +2065,271 @@ class SkillGapAnalyzer:
         if not job_desc_text or not job_desc_text.strip():
             raise ValueError("Job description text cannot be empty")
         
-        # Preprocess texts
-        resume_tokens = self.preprocessor.preprocess(resume_text)
-        job_tokens = self.preprocessor.preprocess(job_desc_text)
+        with self._request('analyze'):
+            if budget is not None:
+                return self._analyze_within(resume_text, job_desc_text, budget)
+            
+            # Preprocess, extract skills and vectorize (cached per document)
+            resume_profile = self.profile(resume_text)
+            job_profile = self.profile(job_desc_text)
+            
+            # Calculate match percentage
+            with self._stage('similarity'):
+                similarity = self._similarity(resume_profile.term_counts, job_profile.term_counts)
+            match_percentage = round(similarity * 100, 2)
+            
+            return self._build_result(resume_profile, job_profile, match_percentage)
+    
+    # Excerpts smaller than this estimate the match score worse than skill counts do
+    MIN_SAMPLE_CHARS = 200
+    # Share of a latency budget planned for; the rest absorbs timing jitter
+    BUDGET_HEADROOM = 0.8
+    # Characters scanned between deadline checks
+    SEGMENT_CHARS = 1024
+    
+    def _analyze_within(self, resume_text: str, job_desc_text: str, budget: float) -> AnalysisResult:
+        """
+        Deadline-aware analysis (see analyze).
         
-        # Extract skills
-        resume_skills = self.skill_extractor.extract_skills(resume_tokens, resume_text)
-        job_skills = self.skill_extractor.extract_skills(job_tokens, job_desc_text)
+        Each stage is predicted from the running stage_costs before it runs and
+        approximated when it would not fit; the measured times update the costs.
+        Text scans also check the clock between segments and stop at the
+        deadline, so a stage running slower than predicted cannot overrun it.
+        """
+        costs = self.stage_costs
+        clock = time.perf_counter
+        deadline = clock() + budget * self.BUDGET_HEADROOM
+        texts = (resume_text, job_desc_text)
+        approximate = set()
+        # Always leave time to assemble the result
+        reserve = costs.predict('build')
         
-        # Compare skills
-        matched_skills = resume_skills & job_skills
-        missing_skills = job_skills - resume_skills
-        extra_skills = resume_skills - job_skills
+        keys = profiles = (None, None)
+        if self.cache is not None:
+            keys = tuple(self.cache.make_key(text, self._profile_salt) for text in texts)
+            profiles = tuple(self.cache.get(key) for key in keys)
         
-        # Calculate match percentage
-        match_percentage = self.calculate_match_percentage(resume_text, job_desc_text)
+        # Skills: exact while the remaining scans fit, else from excerpts getting
+        # half the time left (replanned per document, as scans can run slow)
+        skill_counts = []
+        for i, (text, profile) in enumerate(zip(texts, profiles)):
+            if profile is not None:
+                skill_counts.append(profile.skill_counts)
+                continue
+            chars = sum(len(texts[k]) for k in range(i, 2) if profiles[k] is None)
+            remaining = deadline - clock() - reserve
+            predicted = costs.predict('skill_scan', chars)
+            if predicted > remaining:
+                text = sample_text(text, int(len(text) * max(remaining, 0.0) / 2 / predicted))
+                approximate.update(SKILL_FIELDS)
+            start = clock()
+            with self._stage('skill_scan'):
+                counts, scanned = self._skill_counts_until(text, deadline - reserve)
+            costs.observe('skill_scan', clock() - start, scanned)
+            if scanned < len(text):
+                approximate.update(SKILL_FIELDS)
+            skill_counts.append(counts)
         
-        # Get top 5 most relevant skills from job description
-        # Skills that appear more frequently or are matched get priority
-        top_skills = sorted(job_skills, key=lambda x: (
-            1 if x in matched_skills else 0,
-            job_desc_text.lower().count(x)
-        ), reverse=True)[:5]
+        # Match score: exact if vectorizing and scoring fit, else from excerpts
+        # or, with no time for those either, from the skill counts
+        term_counts = [profile.term_counts if profile is not None else None for profile in profiles]
+        for i, text in enumerate(texts):
+            if term_counts[i] is not None:
+                continue
+            chars = sum(len(texts[k]) for k in range(i, 2) if term_counts[k] is None)
+            # Distinct terms are not known before counting; documents have roughly 3 * sqrt(chars)
+            terms = sum(len(counts) if counts is not None else 3 * math.sqrt(len(t))
+                        for t, counts in zip(texts, term_counts))
+            remaining = deadline - clock() - reserve
+            predicted = costs.predict('vectorize', chars)
+            if predicted + costs.predict('similarity', terms) > remaining:
+                approximate.add('match_percentage')
+                size = int(len(text) * max(remaining, 0.0) / 2 / predicted)
+                if size < min(len(text), self.MIN_SAMPLE_CHARS):
+                    break
+                text = sample_text(text, size)
+            start = clock()
+            with self._stage('vectorize'):
+                counts, scanned = Counter(), 0
+                for segment in iter_segments_until(text, deadline - reserve - costs.predict('similarity', terms),
+                                                   self.SEGMENT_CHARS):
+                    counts.update(_TERM_PATTERN.findall(segment.lower()))
+                    scanned += len(segment)
+            costs.observe('vectorize', clock() - start, scanned)
+            if scanned < len(text):
+                approximate.add('match_percentage')
+                if scanned < min(len(text), self.MIN_SAMPLE_CHARS):
+                    break
+            term_counts[i] = dict(counts)
+        if all(counts is not None for counts in term_counts):
+            terms = len(term_counts[0]) + len(term_counts[1])
+            if costs.predict('similarity', terms) <= deadline - clock() - reserve:
+                start = clock()
+                with self._stage('similarity'):
+                    similarity = self._similarity(term_counts[0], term_counts[1])
+                costs.observe('similarity', clock() - start, terms)
+            else:
+                similarity = count_similarity(term_counts[0], term_counts[1])
+                approximate.add('match_percentage')
+        else:
+            similarity = count_similarity(skill_counts[0], skill_counts[1])
+        match_percentage = round(similarity * 100, 2)
         
-        # Generate learning recommendations for missing skills
-        recommendations = self._generate_recommendations(missing_skills)
+        start = clock()
+        result = self._build_result(
+            *(DocumentProfile((), frozenset(skills), skills, counts or {})
+              for skills, counts in zip(skill_counts, term_counts)),
+            match_percentage,
+            approximate=tuple(field for field in RESULT_FIELDS if field in approximate))
+        costs.observe('build', clock() - start)
         
-        return {
-            'matched_skills': sorted(matched_skills),
-            'missing_skills': sorted(missing_skills),
-            'extra_skills': sorted(extra_skills),
-            'match_percentage': match_percentage,
-            'top_relevant_skills': top_skills,
-            'recommendations': recommendations,
-            'total_resume_skills': len(resume_skills),
-            'total_job_skills': len(job_skills),
-            'match_count': len(matched_skills),
-        }
+        # Cache complete profiles of new documents while the budget allows
+        if not approximate:
+            for i, (text, key) in enumerate(zip(texts, keys)):
+                if key is None or profiles[i] is not None:
+                    continue
+                if costs.predict('tokenize', len(text)) > deadline - clock():
+                    break
+                start = clock()
+                with self._stage('tokenize'):
+                    tokens = self.preprocessor.preprocess(text)
+                costs.observe('tokenize', clock() - start, len(text))
+                self.cache.put(key, DocumentProfile(tuple(tokens), frozenset(skill_counts[i]),
+                                                    skill_counts[i], term_counts[i]))
+        return result
     
-    def _generate_recommendations(self, missing_skills: Set[str]) -> List[Dict[str, str]]:
+    def _skill_counts_until(self, text: str, deadline: float) -> Tuple[Dict[str, int], int]:
         """
-        Generate learning recommendations for missing skills.
+        Count skills like SkillExtractor.extract_skill_counts, stopping at a deadline.
         
         Args:
-            missing_skills: Set of skills not found in resume
+            text: Raw document text
+            deadline: time.perf_counter() value after which scanning stops
             
         Returns:
-            List of recommendation dictionaries
-        """
-        recommendations = []
-        
-        # Priority learning resources by skill category
-        learning_resources = {
-            'programming': 'Online courses: Coursera, Udemy, freeCodeCamp',
-            'web': 'MDN Web Docs, Frontend Masters, The Odin Project',
-            'database': 'SQL tutorials, MongoDB University, database documentation',
-            'cloud': 'AWS Training, Azure Learn, Google Cloud Skills Boost',
-            'data_science': 'Kaggle, DataCamp, fast.ai courses',
-            'soft_skill': 'LinkedIn Learning, soft skills workshops, practice projects',
-        }
+            Skill counts of the part scanned, and its length in characters
+        """
+        fuzzy_index = self.skill_extractor.fuzzy_index
+        fuzzy_counts = Counter()
+        scanned = 0
+        
+        def segments():
+            nonlocal scanned
+            for segment in iter_segments_until(text, deadline, self.SEGMENT_CHARS):
+                scanned += len(segment)
+                segment = segment.lower()
+                # Segments end at whitespace, so no word is split between them
+                if fuzzy_index is not None:
+                    fuzzy_counts.update(match.skill for match in fuzzy_index.iter_matches(segment))
+                yield segment
+        
+        skill_counts = count_matches(self.skill_extractor.matcher.iter_matches_stream(segments()))
+        skill_counts.update(fuzzy_counts)
+        return dict(skill_counts), scanned
+    
+    def _stage(self, name: str):
+        """Context manager timing one analysis stage (a no-op without instrumentation)."""
+        if self.instrumentation is None:
+            return _NO_STAGE
+        return self.instrumentation.stage(name)
+    
+    def _request(self, name: str):
+        """Context manager around a whole request (a no-op without instrumentation)."""
+        if self.instrumentation is None:
+            return _NO_STAGE
+        return self.instrumentation.request(name)
+    
+    @property
+    def skill_table(self) -> SkillTable:
+        """Interned skills of this analyzer's results (built on first use)."""
+        if self._skill_table is None:
+            self._skill_table = SkillTable(self.skill_extractor.skill_dict, self._recommendation)
+        return self._skill_table
+    
+    def _build_result(self, resume_profile: DocumentProfile, job_profile: DocumentProfile,
+                      match_percentage: float, approximate: Tuple[str, ...] = ()) -> AnalysisResult:
+        """
+        Compare two document profiles and assemble the analysis results.
         
-        for skill in sorted(missing_skills)[:10]:  # Top 10 priority
-            # Categorize skill
-            category = self._categorize_skill(skill)
-            resource = learning_resources.get(category, 'Online tutorials and documentation')
+        Args:
+            resume_profile: Profile of the resume
+            job_profile: Profile of the job description
+            match_percentage: Precomputed match percentage
+            approximate: Fields estimated under a latency budget
             
-            recommendations.append({
-                'skill': skill,
-                'category': category,
-                'resource': resource
-            })
+        Returns:
+            AnalysisResult (a read-only mapping with the analysis results)
+        """
+        resume_skills = resume_profile.skills
+        job_skills = job_profile.skills
+        job_skill_counts = job_profile.skill_counts
+        table = self.skill_table
+        
+        # Compare skills
+        with self._stage('compare'):
+            matched_skills = resume_skills & job_skills
+            missing_skills = job_skills - resume_skills
+            extra_skills = resume_skills - job_skills
+        
+        # Get top 5 most relevant skills from job description
+        # Skills that appear more frequently or are matched get priority
+        # (ties in name order, so equal inputs always give equal results)
+        with self._stage('top_skills'):
+            top_skills = sorted(job_skills, key=lambda x: (
+                0 if x in matched_skills else 1,
+                -job_skill_counts[x],
+                x
+            ))[:5]
+        
+        # Recommendations for missing skills are built when first read
+        with self._stage('recommendations'):
+            ids = table.ids
+            result = AnalysisResult(
+                table,
+                matched_ids=table.encode(matched_skills),
+                missing_ids=table.encode(missing_skills),
+                extra_ids=table.encode(extra_skills),
+                top_ids=tuple(ids[skill] for skill in top_skills),
+                match_percentage=match_percentage,
+                total_resume_skills=len(resume_skills),
+                total_job_skills=len(job_skills),
+                approximate=approximate,
+            )
+        return result
+    
+    def _recommendation(self, skill: str) -> Dict[str, str]:
+        """Learning recommendation for one skill."""
+        category = self._categorize_skill(skill)
+        if self.taxonomy is not None:
+            resource = self.taxonomy.resource_for(skill, category)
+        else:
+            resource = LEARNING_RESOURCES.get(category, DEFAULT_LEARNING_RESOURCE)
         
-        return recommendations
+        return {
+            'skill': skill,
+            'category': category,
+            'resource': resource
+        }
     
     def _categorize_skill(self, skill: str) -> str:
         """Categorize a skill into learning resource category."""
-        skill_lower = skill.lower()
-        
-        if any(lang in skill_lower for lang in ['python', 'java', 'javascript', 'c++', 'ruby']):
-            return 'programming'
-        elif any(tech in skill_lower for tech in ['html', 'css', 'react', 'angular', 'vue']):
-            return 'web'
-        elif any(db in skill_lower for db in ['sql', 'mysql', 'mongodb', 'database']):
-            return 'database'
-        elif any(cloud in skill_lower for cloud in ['aws', 'azure', 'gcp', 'cloud']):
-            return 'cloud'
-        elif any(ds in skill_lower for ds in ['machine learning', 'data', 'analysis', 'tensorflow']):
-            return 'data_science'
-        elif any(soft in skill_lower for soft in ['communication', 'leadership', 'teamwork']):
-            return 'soft_skill'
-        else:
-            return 'general'
+        if self.taxonomy is not None:
+            category = self.taxonomy.category_of(skill)
+            if category is not None:
+                return category
+        return categorize_skill(skill)
 
 
 class ReportGenerator:
     """Generates user-friendly analysis reports."""
     
     @staticmethod
-    def generate_console_report(analysis: Dict) -> str:
+    def generate_console_report(analysis: Mapping) -> str:
         """
         Generate a formatted console report.
         
         Args:
-            analysis: Analysis results dictionary
+            analysis: AnalysisResult or analysis results dictionary
             
         Returns:
             Formatted report string
@@ -391,11 +2343,15 @@ class ReportGenerator:
         # Summary statistics
         report.append("📊 SUMMARY STATISTICS")
         report.append("-" * 80)
-        report.append(f"Overall Match Score:          {analysis['match_percentage']}%")
-        report.append(f"Total Skills in Resume:       {analysis['total_resume_skills']}")
-        report.append(f"Total Skills Required:        {analysis['total_job_skills']}")
-        report.append(f"Skills Matched:               {analysis['match_count']}")
-        report.append(f"Skills Gap:                   {len(analysis['missing_skills'])}")
+        approximate = analysis.get('approximate', ())
+        estimated = lambda field: " (approximate)" if field in approximate else ""
+        report.append(f"Overall Match Score:          {analysis['match_percentage']}%{estimated('match_percentage')}")
+        report.append(f"Total Skills in Resume:       {analysis['total_resume_skills']}{estimated('total_resume_skills')}")
+        report.append(f"Total Skills Required:        {analysis['total_job_skills']}{estimated('total_job_skills')}")
+        report.append(f"Skills Matched:               {analysis['match_count']}{estimated('match_count')}")
+        report.append(f"Skills Gap:                   {len(analysis['missing_skills'])}{estimated('missing_skills')}")
+        if approximate:
+            report.append("⏱️  Estimated within the latency budget; rerun without one for exact results.")
         report.append("")
         
         # Matched skills
@@ -488,8 +2444,97 @@ def read_from_file(filename: str) -> str:
         raise Exception(f"Error reading file: {e}")
 
 
-def main():
-    """Main function to run the Resume Skill Gap Analyzer application."""
+def iter_file_chunks(filename: str, chunk_size: int = 1024 * 1024) -> Iterator[str]:
+    """
+    Read a UTF-8 text file through a memory map, one decoded chunk at a time.
+    
+    Args:
+        filename: Path to file
+        chunk_size: Bytes decoded per chunk
+        
+    Yields:
+        Text chunks; multi-byte characters split across chunks are decoded whole
+    """
+    try:
+        f = open(filename, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+    
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for offset in range(0, size, chunk_size):
+                text = decoder.decode(mapped[offset:offset + chunk_size])
+                if text:
+                    yield text
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+
+def iter_complete_segments(chunks: Iterator[str]) -> Iterator[str]:
+    """
+    Re-split a chunk stream so that no word is cut in two.
+    
+    Each yielded segment ends at whitespace (except the last one); the partial
+    word at the end of a chunk is carried over to the next segment.
+    
+    Args:
+        chunks: Iterable of text chunks
+        
+    Yields:
+        Text segments whose concatenation equals the input
+    """
+    carry = ""
+    for chunk in chunks:
+        text = carry + chunk
+        if not text or text[-1].isspace():
+            cut = len(text)
+        else:
+            cut = len(text) - len(text.rsplit(None, 1)[-1])
+        if cut:
+            yield text[:cut]
+        carry = text[cut:]
+    if carry:
+        yield carry
+
+
+def iter_segments_until(text: str, deadline: float, size: int = 8192) -> Iterator[str]:
+    """
+    Split a text into word-bounded segments until a deadline passes.
+    
+    Args:
+        text: Text to split
+        deadline: time.perf_counter() value after which no segment is started
+        size: Approximate segment size in characters
+        
+    Yields:
+        Segments whose concatenation is a prefix of text (all of it when in time)
+    """
+    chunks = (text[i:i + size] for i in range(0, len(text), size))
+    for segment in iter_complete_segments(chunks):
+        if time.perf_counter() > deadline:
+            return
+        yield segment
+
+
+def main(minimal: bool = False, taxonomy_file: str = None, scoring: str = 'tfidf', idf_file: str = None,
+         fuzzy_threshold: float = None, tokenizer: str = 'regex', budget_ms: float = None):
+    """
+    Main function to run the Resume Skill Gap Analyzer application.
+    
+    Args:
+        minimal: Analyze without NLTK or scikit-learn
+        taxonomy_file: Compiled skill taxonomy to use instead of SKILL_DICTIONARY
+        scoring: Match scoring engine ('tfidf' or 'hashing')
+        idf_file: Corpus statistics for the hashing engine (see HashingVectorizer.save)
+        fuzzy_threshold: Also match misspelled skills (see SkillExtractor)
+        tokenizer: Preprocessing tokenizer engine ('regex' or 'nltk')
+        budget_ms: Optional latency budget for the analysis (see SkillGapAnalyzer.analyze)
+    """
     
     print("=" * 80)
     print("RESUME SKILL GAP ANALYZER".center(80))
@@ -546,8 +2591,15 @@ def main():
         print()
         
         # Perform analysis
-        analyzer = SkillGapAnalyzer()
-        results = analyzer.analyze(resume_text, job_text)
+        taxonomy = None
+        if taxonomy_file:
+            from skill_taxonomy import SkillTaxonomy
+            taxonomy = SkillTaxonomy.load(taxonomy_file)
+        hasher = HashingVectorizer.load(idf_file) if idf_file else None
+        analyzer = SkillGapAnalyzer(minimal=minimal, taxonomy=taxonomy, scoring=scoring, hasher=hasher,
+                                    fuzzy_threshold=fuzzy_threshold, tokenizer=tokenizer)
+        results = analyzer.analyze(resume_text, job_text,
+                                   budget=None if budget_ms is None else budget_ms / 1000)
         
         # Generate and display report
         report_gen = ReportGenerator()
@@ -575,4 +2627,32 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Compare a resume with a job description.")
+    parser.add_argument('--provision-nltk', action='store_true',
+                        help="Download the NLTK data packages once and exit")
+    parser.add_argument('--minimal', action='store_true',
+                        help="Analyze without NLTK or scikit-learn (fastest startup)")
+    parser.add_argument('--taxonomy', default=None,
+                        help="Compiled skill taxonomy (see skill_taxonomy.py) to use instead of the built-in skills")
+    parser.add_argument('--scoring', choices=SCORING_ENGINES, default='tfidf',
+                        help="Match scoring engine (default: tfidf)")
+    parser.add_argument('--idf', default=None, help="Corpus IDF statistics for the hashing engine")
+    parser.add_argument('--fuzzy', type=float, nargs='?', const=DEFAULT_FUZZY_THRESHOLD, default=None,
+                        metavar='THRESHOLD',
+                        help=f"Also match misspelled skills (trigram similarity, default {DEFAULT_FUZZY_THRESHOLD})")
+    parser.add_argument('--tokenizer', choices=TOKENIZER_ENGINES, default='regex',
+                        help="Preprocessing tokenizer engine (default: regex)")
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help="Latency budget; fields that do not fit are estimated and marked approximate")
+    args = parser.parse_args()
+    
+    if args.provision_nltk:
+        if provision_nltk_data():
+            print("✅ NLTK data installed.")
+        else:
+            print("❌ Could not install NLTK data.")
+            sys.exit(1)
+    else:
+        main(minimal=args.minimal, taxonomy_file=args.taxonomy, scoring=args.scoring, idf_file=args.idf,
+             fuzzy_threshold=args.fuzzy, tokenizer=args.tokenizer, budget_ms=args.budget_ms)
@@ -0,0 +1,537 @@
+"""
+Sharded Batch Runs
+Resumable, multi-worker version of batch_analyze.py for workloads that take
+hours. The coordinator (init) splits the resumes into shards of shard_size
+documents, each analyzed against every job description, and records them in
+a SQLite work queue inside the run directory. Any number of workers (work),
+on one machine or on several machines sharing the run directory, lease
+shards from the queue, write each shard's results to a file of its own and
+mark the shard done.
+
+Shard outputs are written under a per-worker temporary name, synced and
+renamed into place, so a shard file in results/ is always complete. A worker renews its lease
+while it analyzes; if it dies the lease expires and another worker retries
+the shard, up to max_attempts attempts. Re-running work after a crash or an
+interruption picks up the remaining shards.
+
+Example:
+    python scripts/sharded_run.py init run/ --resumes resumes.jsonl --jobs jobs/ --shard-size 64
+    python scripts/sharded_run.py work run/ --workers 8      # on each machine
+    python scripts/sharded_run.py status run/
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import batch_analyze
+from batch_analyze import iter_documents, parse_record
+from resume_skill_gap_analyzer import DEFAULT_FUZZY_THRESHOLD, SCORING_ENGINES, TOKENIZER_ENGINES, read_from_file
+from results_writer import FORMATS, ResultsWriter
+
+QUEUE_FILE = 'queue.sqlite'
+RESULTS_DIR = 'results'
+
+# Analyzer settings recorded at init and passed to batch_analyze._init_worker
+ANALYZER_OPTIONS = ('minimal', 'taxonomy_file', 'scoring', 'idf_file', 'fuzzy_threshold', 'tokenizer')
+
+
+class LeaseLost(RuntimeError):
+    """Raised when another worker has taken over a shard."""
+
+
+def _source_stamp(path: str) -> Optional[List[int]]:
+    """Size and modification time of a JSONL source (None for a directory)."""
+    if os.path.isdir(path):
+        return None
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def plan_shards(path: str, shard_size: int) -> Iterator[Tuple[Dict, int]]:
+    """
+    Split a document source into shards without keeping the documents.
+
+    Args:
+        path: Directory of text files, or a JSONL file
+        shard_size: Documents per shard
+
+    Yields:
+        (spec, document count) per shard; spec is {"files": [...]} for a
+        directory or {"offset", "end", "line"} byte and line positions in a
+        JSONL file
+    """
+    if os.path.isdir(path):
+        names = [name for name in sorted(os.listdir(path))
+                 if os.path.isfile(os.path.join(path, name)) and not name.startswith('.')]
+        for start in range(0, len(names), shard_size):
+            files = names[start:start + shard_size]
+            yield {'files': files}, len(files)
+    elif os.path.isfile(path):
+        with open(path, 'rb') as f:
+            offset = position = 0
+            line = line_no = 1
+            count = 0
+            for raw in f:
+                if raw.strip():
+                    count += 1
+                position += len(raw)
+                line_no += 1
+                if count == shard_size:
+                    yield {'offset': offset, 'end': position, 'line': line}, count
+                    offset, line, count = position, line_no, 0
+            if count:
+                yield {'offset': offset, 'end': position, 'line': line}, count
+    else:
+        raise FileNotFoundError(f"File not found: {path}")
+
+
+def read_shard(path: str, spec: Dict) -> Iterator[Tuple[str, str]]:
+    """
+    Read the documents of one shard.
+
+    Args:
+        path: Document source the shard was planned from
+        spec: Shard spec from plan_shards
+
+    Yields:
+        (document_id, text) tuples, with the ids iter_documents would give
+    """
+    if 'files' in spec:
+        for name in spec['files']:
+            yield name, read_from_file(os.path.join(path, name))
+        return
+    with open(path, 'rb') as f:
+        f.seek(spec['offset'])
+        position, line_no = spec['offset'], spec['line']
+        while position < spec['end']:
+            raw = f.readline()
+            position += len(raw)
+            line = raw.decode('utf-8').strip()
+            if line:
+                yield parse_record(path, line_no, line)
+            line_no += 1
+
+
+class ShardQueue:
+    """Durable shard queue of a run, kept in SQLite."""
+
+    def __init__(self, run_dir: str):
+        """
+        Open the queue of an existing run.
+
+        Args:
+            run_dir: Run directory created by ShardQueue.create
+        """
+        path = os.path.join(run_dir, QUEUE_FILE)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"No run found in {run_dir} (create it with `init`)")
+        self.run_dir = run_dir
+        # Autocommit; claims take the write lock explicitly with BEGIN IMMEDIATE.
+        # The default rollback journal (not WAL) keeps locking safe on shared filesystems.
+        self.conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.settings = json.loads(self.conn.execute("SELECT value FROM meta WHERE key = 'settings'").fetchone()[0])
+
+    @classmethod
+    def create(cls, run_dir: str, resumes: str, jobs: str, shard_size: int = 64, output_format: str = 'jsonl',
+               lease_seconds: float = 600.0, max_attempts: int = 3, **options) -> 'ShardQueue':
+        """
+        Plan a run: split the resumes into shards and record the settings.
+
+        Args:
+            run_dir: Directory for the queue and the results (created if missing)
+            resumes: Directory or JSONL file of resumes
+            jobs: Directory or JSONL file of job descriptions
+            shard_size: Resumes per shard
+            output_format: Format of the shard result files (one of FORMATS)
+            lease_seconds: Time a worker may hold a shard without renewing it
+            max_attempts: Attempts per shard before it is given up
+            **options: Analyzer settings (see ANALYZER_OPTIONS)
+
+        Returns:
+            The new ShardQueue
+        """
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown output format {output_format!r}; choose one of {', '.join(FORMATS)}")
+        unknown = set(options) - set(ANALYZER_OPTIONS)
+        if unknown:
+            raise ValueError(f"Unknown analyzer options: {', '.join(sorted(unknown))}")
+        path = os.path.join(run_dir, QUEUE_FILE)
+        if os.path.exists(path):
+            raise ValueError(f"{run_dir} already holds a run; use `work` to resume it")
+
+        resumes, jobs = os.path.abspath(resumes), os.path.abspath(jobs)
+        job_count = sum(1 for _ in iter_documents(jobs))
+        for key in ('taxonomy_file', 'idf_file'):
+            if options.get(key):
+                options[key] = os.path.abspath(options[key])
+        settings = {
+            'resumes': resumes, 'jobs': jobs, 'resumes_stamp': _source_stamp(resumes),
+            'jobs_stamp': _source_stamp(jobs), 'job_count': job_count, 'shard_size': shard_size,
+            'output_format': output_format, 'lease_seconds': lease_seconds, 'max_attempts': max_attempts,
+            'options': options,
+        }
+
+        os.makedirs(os.path.join(run_dir, RESULTS_DIR), exist_ok=True)
+        # Build under a temporary name so a crash during planning leaves no half-planned run
+        building = path + '.planning'
+        if os.path.exists(building):
+            os.remove(building)
+        conn = sqlite3.connect(building)
+        conn.executescript("""
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE shards (
+                shard_id INTEGER PRIMARY KEY, spec TEXT NOT NULL, resumes INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0,
+                worker TEXT, lease_expires REAL, started REAL, finished REAL,
+                pairs INTEGER, errors INTEGER, error TEXT
+            );
+            CREATE INDEX shards_by_status ON shards (status, shard_id);
+        """)
+        conn.execute("INSERT INTO meta VALUES ('settings', ?)", (json.dumps(settings),))
+        conn.executemany("INSERT INTO shards (shard_id, spec, resumes) VALUES (?, ?, ?)",
+                         ((shard_id, json.dumps(spec), count)
+                          for shard_id, (spec, count) in enumerate(plan_shards(resumes, shard_size))))
+        conn.commit()
+        conn.close()
+        os.replace(building, path)
+        return cls(run_dir)
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def claim(self, worker: str, max_attempts: int = None) -> Optional[Tuple[int, Dict]]:
+        """
+        Lease the next shard that is pending, failed or abandoned.
+
+        Args:
+            worker: Worker identifier
+            max_attempts: Attempts per shard (default: the run's setting)
+
+        Returns:
+            (shard_id, spec), or None if no shard can be claimed now
+        """
+        max_attempts = max_attempts or self.settings['max_attempts']
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # A lease that expired on the last attempt is given up, so it stops counting as live
+            self.conn.execute(
+                "UPDATE shards SET status = 'failed', lease_expires = NULL, "
+                "error = 'Lease of ' || worker || ' expired on the last attempt' "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?", (now, max_attempts))
+            row = self.conn.execute(
+                "SELECT shard_id, spec FROM shards WHERE status = 'pending' "
+                "OR (status = 'failed' AND attempts < ?) "
+                "OR (status = 'leased' AND lease_expires < ? AND attempts < ?) "
+                "ORDER BY shard_id LIMIT 1", (max_attempts, now, max_attempts)).fetchone()
+            if row is not None:
+                self.conn.execute(
+                    "UPDATE shards SET status = 'leased', worker = ?, lease_expires = ?, started = ?, "
+                    "attempts = attempts + 1 WHERE shard_id = ?",
+                    (worker, now + self.settings['lease_seconds'], now, row[0]))
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return None if row is None else (row[0], json.loads(row[1]))
+
+    def renew(self, shard_id: int, worker: str):
+        """
+        Extend a lease; raises LeaseLost if the shard now belongs to another worker.
+
+        Args:
+            shard_id: Leased shard
+            worker: Worker holding the lease
+        """
+        cursor = self.conn.execute(
+            "UPDATE shards SET lease_expires = ? WHERE shard_id = ? AND worker = ? AND status = 'leased'",
+            (time.time() + self.settings['lease_seconds'], shard_id, worker))
+        if cursor.rowcount == 0:
+            raise LeaseLost(f"Lost the lease on shard {shard_id}")
+
+    def complete(self, shard_id: int, worker: str, pairs: int, errors: int) -> bool:
+        """
+        Mark a shard done.
+
+        Args:
+            shard_id: Leased shard
+            worker: Worker holding the lease
+            pairs: Resume/job pairs written
+            errors: Pairs that failed analysis
+
+        Returns:
+            False if the lease had been lost (another worker finishes the shard)
+        """
+        cursor = self.conn.execute(
+            "UPDATE shards SET status = 'done', finished = ?, pairs = ?, errors = ?, error = NULL "
+            "WHERE shard_id = ? AND worker = ? AND status = 'leased'",
+            (time.time(), pairs, errors, shard_id, worker))
+        return cursor.rowcount == 1
+
+    def fail(self, shard_id: int, worker: str, error: str):
+        """
+        Record a failed attempt; the shard is retried until max_attempts.
+
+        Args:
+            shard_id: Leased shard
+            worker: Worker holding the lease
+            error: Error message
+        """
+        self.conn.execute(
+            "UPDATE shards SET status = 'failed', lease_expires = NULL, error = ? "
+            "WHERE shard_id = ? AND worker = ? AND status = 'leased'", (error, shard_id, worker))
+
+    def next_expiry(self) -> Optional[float]:
+        """Earliest expiry among live leases, or None if no shard is leased."""
+        return self.conn.execute("SELECT MIN(lease_expires) FROM shards WHERE status = 'leased'").fetchone()[0]
+
+    def progress(self, max_attempts: int = None) -> Dict:
+        """
+        Summarize the run.
+
+        Args:
+            max_attempts: Attempts per shard (default: the run's setting)
+
+        Returns:
+            Dictionary with shard counts per state, pairs done, throughput and ETA
+        """
+        max_attempts = max_attempts or self.settings['max_attempts']
+        now = time.time()
+        shards, resumes, done, pairs, errors, leased, stalled, given_up, first, last = self.conn.execute(
+            "SELECT COUNT(*), SUM(resumes), "
+            "SUM(status = 'done'), SUM(CASE WHEN status = 'done' THEN pairs ELSE 0 END), "
+            "SUM(CASE WHEN status = 'done' THEN errors ELSE 0 END), "
+            "SUM(status = 'leased' AND lease_expires >= ?), "
+            "SUM(status = 'leased' AND lease_expires < ?), "
+            "SUM(status IN ('failed', 'leased') AND attempts >= ? AND (status = 'failed' OR lease_expires < ?)), "
+            "MIN(started), MAX(finished) FROM shards", (now, now, max_attempts, now)).fetchone()
+        total_pairs = (resumes or 0) * self.settings['job_count']
+        elapsed = (last - first) if first is not None and last is not None and last > first else 0.0
+        rate = pairs / elapsed if pairs and elapsed else 0.0
+        return {
+            'shards': shards,
+            'done': done or 0,
+            'leased': leased or 0,
+            'stalled': stalled or 0,
+            'given_up': given_up or 0,
+            'pairs': pairs or 0,
+            'total_pairs': total_pairs,
+            'errors': errors or 0,
+            'pairs_per_second': round(rate, 2),
+            'eta_seconds': round((total_pairs - pairs) / rate, 1) if rate else None,
+        }
+
+    def failures(self) -> List[Tuple[int, int, str]]:
+        """(shard_id, attempts, error) of shards whose last attempt failed."""
+        return self.conn.execute(
+            "SELECT shard_id, attempts, error FROM shards WHERE status = 'failed' ORDER BY shard_id").fetchall()
+
+
+def shard_path(run_dir: str, shard_id: int, output_format: str) -> str:
+    """Result file of a shard."""
+    return os.path.join(run_dir, RESULTS_DIR, f"shard-{shard_id:06d}.{output_format}")
+
+
+def _write_shard(queue: ShardQueue, shard_id: int, spec: Dict, worker: str) -> Tuple[int, int]:
+    """Analyze one leased shard and move its complete result file into place."""
+    settings = queue.settings
+    target = shard_path(queue.run_dir, shard_id, settings['output_format'])
+    temporary = f"{target}.{worker.replace(':', '-')}.tmp"
+    # Partial file left by an earlier attempt of this worker; other workers' files are theirs to clean up
+    if os.path.exists(temporary):
+        os.remove(temporary)
+    renew_every = settings['lease_seconds'] / 3
+    renewed = time.monotonic()
+    pairs = errors = 0
+    try:
+        with ResultsWriter(temporary, settings['output_format']) as writer:
+            for resume in read_shard(settings['resumes'], spec):
+                records = batch_analyze._analyze_chunk([resume])
+                writer.write_many(records)
+                pairs += len(records)
+                errors += sum('error' in record for record in records)
+                if time.monotonic() - renewed > renew_every:
+                    queue.renew(shard_id, worker)
+                    renewed = time.monotonic()
+        with open(temporary, 'rb+') as f:
+            os.fsync(f.fileno())
+        os.replace(temporary, target)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    return pairs, errors
+
+
+def run_worker(run_dir: str, worker: str = None, max_attempts: int = None, poll_seconds: float = 5.0,
+               verbose: bool = True) -> Dict:
+    """
+    Process shards until none are left to claim.
+
+    While other workers still hold leases the worker waits, so it can take
+    over the shards of workers that die.
+
+    Args:
+        run_dir: Run directory
+        worker: Worker identifier (default: host:pid)
+        max_attempts: Attempts per shard (default: the run's setting)
+        poll_seconds: Longest wait between claims while other shards are leased
+        verbose: Print a progress line per shard to stderr
+
+    Returns:
+        Dictionary with the shards, pairs and errors this worker completed
+    """
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    queue = ShardQueue(run_dir)
+    settings = queue.settings
+    for key in ('resumes', 'jobs'):
+        if _source_stamp(settings[key]) != settings[key + '_stamp']:
+            raise ValueError(f"{settings[key]} changed since the run was planned")
+    jobs = list(iter_documents(settings['jobs']))
+    batch_analyze._init_worker(jobs, **settings['options'])
+
+    summary = {'shards': 0, 'pairs': 0, 'errors': 0, 'failed': 0}
+    try:
+        while True:
+            claimed = queue.claim(worker, max_attempts)
+            if claimed is None:
+                expiry = queue.next_expiry()
+                if expiry is None:
+                    break
+                time.sleep(min(max(expiry - time.time(), 0.1), poll_seconds))
+                continue
+            shard_id, spec = claimed
+            start = time.perf_counter()
+            try:
+                pairs, errors = _write_shard(queue, shard_id, spec, worker)
+            except LeaseLost:
+                continue
+            except Exception as e:
+                # Any failure is recorded against the shard, which is retried up to max_attempts
+                queue.fail(shard_id, worker, f"{type(e).__name__}: {e}")
+                summary['failed'] += 1
+                if verbose:
+                    print(f"❌ [{worker}] shard {shard_id}: {e}", file=sys.stderr)
+                continue
+            if not queue.complete(shard_id, worker, pairs, errors):
+                continue
+            summary['shards'] += 1
+            summary['pairs'] += pairs
+            summary['errors'] += errors
+            if verbose:
+                elapsed = time.perf_counter() - start
+                progress = queue.progress(max_attempts)
+                print(f"✅ [{worker}] shard {shard_id}: {pairs} pairs in {elapsed:.1f}s "
+                      f"({pairs / elapsed if elapsed else 0:.0f} pairs/s) — "
+                      f"{progress['done']}/{progress['shards']} shards done", file=sys.stderr)
+    finally:
+        queue.close()
+    return summary
+
+
+def _worker_process(run_dir: str, index: int, max_attempts: int):
+    """Entry point of a local worker process."""
+    try:
+        run_worker(run_dir, f"{socket.gethostname()}:{os.getpid()}:{index}", max_attempts)
+    except (ValueError, FileNotFoundError, ImportError, sqlite3.Error) as e:
+        print(f"❌ {e}", file=sys.stderr)
+    except KeyboardInterrupt:
+        pass
+
+
+def _print_progress(progress: Dict):
+    """Print a run summary to stderr."""
+    eta = progress['eta_seconds']
+    print(f"✅ {progress['done']}/{progress['shards']} shards done, {progress['leased']} in progress, "
+          f"{progress['stalled']} with expired leases, {progress['given_up']} given up", file=sys.stderr)
+    print(f"   {progress['pairs']}/{progress['total_pairs']} pairs ({progress['errors']} errors), "
+          f"{progress['pairs_per_second']} pairs/s" + (f", ~{eta:.0f}s remaining" if eta else ''), file=sys.stderr)
+
+
+def main(argv: List[str] = None):
+    """Plan, work on or inspect a sharded batch run."""
+    parser = argparse.ArgumentParser(description="Resumable sharded batch analysis.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    init_parser = subparsers.add_parser('init', help="Plan a run: split the resumes into shards")
+    init_parser.add_argument('run_dir', help="Run directory (queue and results)")
+    init_parser.add_argument('--resumes', required=True, help="Directory or JSONL file of resumes")
+    init_parser.add_argument('--jobs', required=True, help="Directory or JSONL file of job descriptions")
+    init_parser.add_argument('--shard-size', type=int, default=64, help="Resumes per shard (default: 64)")
+    init_parser.add_argument('--output-format', choices=FORMATS, default='jsonl',
+                             help="Format of the shard result files (default: jsonl)")
+    init_parser.add_argument('--lease', type=float, default=600.0,
+                             help="Seconds a worker may hold a shard without renewing it (default: 600)")
+    init_parser.add_argument('--max-attempts', type=int, default=3, help="Attempts per shard (default: 3)")
+    init_parser.add_argument('--minimal', action='store_true', help="Analyze without NLTK or scikit-learn")
+    init_parser.add_argument('--taxonomy', default=None,
+                             help="Compiled skill taxonomy (see skill_taxonomy.py) to use instead of the built-in skills")
+    init_parser.add_argument('--scoring', choices=SCORING_ENGINES, default='tfidf',
+                             help="Match scoring engine (default: tfidf)")
+    init_parser.add_argument('--idf', default=None, help="Corpus IDF statistics for the hashing engine")
+    init_parser.add_argument('--fuzzy', type=float, nargs='?', const=DEFAULT_FUZZY_THRESHOLD, default=None,
+                             metavar='THRESHOLD',
+                             help=f"Also match misspelled skills (trigram similarity, default {DEFAULT_FUZZY_THRESHOLD})")
+    init_parser.add_argument('--tokenizer', choices=TOKENIZER_ENGINES, default='regex',
+                             help="Preprocessing tokenizer engine (default: regex)")
+
+    work_parser = subparsers.add_parser('work', help="Process shards until the run is complete")
+    work_parser.add_argument('run_dir', help="Run directory")
+    work_parser.add_argument('--workers', '-w', type=int, default=1, help="Worker processes (default: 1)")
+    work_parser.add_argument('--max-attempts', type=int, default=None,
+                             help="Attempts per shard (default: the run's setting); raise it to retry given-up shards")
+
+    status_parser = subparsers.add_parser('status', help="Show the progress of a run")
+    status_parser.add_argument('run_dir', help="Run directory")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'init':
+            queue = ShardQueue.create(
+                args.run_dir, args.resumes, args.jobs, shard_size=args.shard_size,
+                output_format=args.output_format, lease_seconds=args.lease, max_attempts=args.max_attempts,
+                minimal=args.minimal, taxonomy_file=args.taxonomy, scoring=args.scoring, idf_file=args.idf,
+                fuzzy_threshold=args.fuzzy, tokenizer=args.tokenizer)
+            progress = queue.progress()
+            queue.close()
+            print(f"✅ Planned {progress['shards']} shards ({progress['total_pairs']} pairs) in {args.run_dir}",
+                  file=sys.stderr)
+            return 0
+
+        if args.command == 'work':
+            if args.workers > 1:
+                processes = [multiprocessing.Process(target=_worker_process,
+                                                     args=(args.run_dir, index, args.max_attempts))
+                             for index in range(args.workers)]
+                for process in processes:
+                    process.start()
+                for process in processes:
+                    process.join()
+            else:
+                run_worker(args.run_dir, max_attempts=args.max_attempts)
+
+        queue = ShardQueue(args.run_dir)
+        progress = queue.progress(args.max_attempts if args.command == 'work' else None)
+        failures = queue.failures()
+        queue.close()
+    except (ValueError, FileNotFoundError, ImportError, sqlite3.Error) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    _print_progress(progress)
+    for shard_id, attempts, error in failures:
+        print(f"❌ shard {shard_id} ({attempts} attempts): {error}", file=sys.stderr)
+    return 0 if progress['done'] == progress['shards'] or args.command == 'status' else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
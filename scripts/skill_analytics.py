@@ -0,0 +1,750 @@
+"""
+Skill Demand Analytics
+Market-wide skill statistics over streams of job descriptions, resumes and
+analysis results, in fixed memory: which skills are most demanded, which are
+most often missing, and which are demanded together.
+
+Every statistic is a SkillSketch: a Count-Min sketch, which estimates the count
+of any item, next to a Space-Saving summary of the heaviest items. Counts
+are upper bounds, with reported error bounds. Sketches built by parallel
+workers over separate parts of a feed merge into the sketch of the whole feed.
+
+Missing-skill frequency comes in two forms:
+- From analysis results (pairs that were actually analyzed).
+- Over all resumes against all jobs, without analyzing any pair. A skill is
+  missing from jobs_with(skill) * resumes_without(skill) pairs.
+
+Example:
+    analytics = SkillDemandAnalytics()
+    for text in job_texts:
+        analytics.add_job(text)
+    for text in resume_texts:
+        analytics.add_resume(text)
+    report = analytics.report(k=20)
+"""
+
+import argparse
+import base64
+import hashlib
+import heapq
+import json
+import math
+import os
+import sys
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import combinations, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from resume_skill_gap_analyzer import SkillExtractor, SkillGapAnalyzer
+
+# Co-occurring skill pairs are counted under "skill_a + skill_b" (names in sorted order)
+PAIR_SEPARATOR = ' + '
+
+# Count-Min hash positions cached per item (skill names and pairs repeat constantly)
+_POSITION_CACHE_SIZE = 100000
+
+
+class CountMinSketch:
+    """
+    Count-Min sketch with conservative update.
+
+    estimate(item) is never below the true count and, with probability at
+    least 1 - delta, at most epsilon * total above it, where
+    epsilon = e / width and delta = exp(-depth).
+    """
+
+    def __init__(self, width: int = 4096, depth: int = 5, seed: int = 0):
+        """
+        Args:
+            width: Counters per row
+            depth: Rows (independent hash functions)
+            seed: Hash seed; only sketches with equal seeds can be merged
+        """
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.total = 0
+        self.rows = [array('Q', bytes(8 * width)) for _ in range(depth)]
+        self._key = seed.to_bytes(8, 'little')
+        self._positions: Dict[str, List[int]] = {}
+
+    @classmethod
+    def for_error(cls, epsilon: float, delta: float, seed: int = 0) -> 'CountMinSketch':
+        """Smallest sketch with the given relative error and failure probability."""
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)), seed)
+
+    @property
+    def epsilon(self) -> float:
+        """Relative error: overestimates stay below epsilon * total."""
+        return math.e / self.width
+
+    @property
+    def delta(self) -> float:
+        """Probability that an estimate exceeds the error bound."""
+        return math.exp(-self.depth)
+
+    def error_bound(self) -> int:
+        """Largest overestimate (absolute count) at confidence 1 - delta."""
+        return math.ceil(self.epsilon * self.total)
+
+    def _item_positions(self, item: str) -> List[int]:
+        """Counter index of an item in each row (double hashing)."""
+        found = self._positions.get(item)
+        if found is None:
+            digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16, key=self._key).digest()
+            h1 = int.from_bytes(digest[:8], 'little')
+            h2 = int.from_bytes(digest[8:], 'little') | 1
+            found = [(h1 + i * h2) % self.width for i in range(self.depth)]
+            if len(self._positions) >= _POSITION_CACHE_SIZE:
+                self._positions.clear()
+            self._positions[item] = found
+        return found
+
+    def add(self, item: str, count: int = 1) -> int:
+        """
+        Count an item.
+
+        Args:
+            item: Item key
+            count: Occurrences to add
+
+        Returns:
+            The item's new estimate
+        """
+        self.total += count
+        cells = list(zip(self.rows, self._item_positions(item)))
+        # Conservative update: raise only the counters that are below the new estimate
+        estimate = min(row[index] for row, index in cells) + count
+        for row, index in cells:
+            if row[index] < estimate:
+                row[index] = estimate
+        return estimate
+
+    def estimate(self, item: str) -> int:
+        """Upper bound on an item's count."""
+        return min(row[index] for row, index in zip(self.rows, self._item_positions(item)))
+
+    def merge(self, other: 'CountMinSketch'):
+        """
+        Add another sketch's counts (same width, depth and seed) into this one.
+
+        Args:
+            other: Sketch of another part of the stream
+        """
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError("Count-Min sketches differ in width, depth or seed")
+        for i, (row, other_row) in enumerate(zip(self.rows, other.rows)):
+            self.rows[i] = array('Q', map(int.__add__, row, other_row))
+        self.total += other.total
+
+    def to_dict(self) -> Dict:
+        """JSON-compatible state (counters as base64 little-endian uint64)."""
+        rows = []
+        for row in self.rows:
+            if sys.byteorder != 'little':
+                row = array('Q', row)
+                row.byteswap()
+            rows.append(base64.b64encode(row.tobytes()).decode('ascii'))
+        return {'width': self.width, 'depth': self.depth, 'seed': self.seed, 'total': self.total, 'rows': rows}
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'CountMinSketch':
+        """Restore a sketch from to_dict output."""
+        sketch = cls(state['width'], state['depth'], state['seed'])
+        sketch.total = state['total']
+        for i, encoded in enumerate(state['rows']):
+            row = array('Q')
+            row.frombytes(base64.b64decode(encoded))
+            if sys.byteorder != 'little':
+                row.byteswap()
+            if len(row) != sketch.width:
+                raise ValueError("Count-Min row does not match the sketch width")
+            sketch.rows[i] = row
+        return sketch
+
+
+class SpaceSaving:
+    """
+    Space-Saving summary of the most frequent items in a stream.
+
+    At most capacity items are tracked. A tracked item's count overestimates
+    its true count by at most its recorded error, and every item whose true
+    count exceeds total / capacity is tracked.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """
+        Args:
+            capacity: Items tracked
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        # Min-heap of (count, item); entries whose count is outdated are skipped
+        self._heap: List[Tuple[int, str]] = []
+
+    @property
+    def min_count(self) -> int:
+        """Count of the least frequent tracked item (0 while not full)."""
+        if len(self.counts) < self.capacity:
+            return 0
+        heap, counts = self._heap, self.counts
+        while counts.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0]
+
+    def add(self, item: str, count: int = 1):
+        """
+        Count an item.
+
+        Args:
+            item: Item key
+            count: Occurrences to add
+        """
+        self.total += count
+        counts = self.counts
+        if item in counts:
+            counts[item] += count
+        elif len(counts) < self.capacity:
+            counts[item] = count
+            self.errors[item] = 0
+        else:
+            # Replace the least frequent item; the newcomer inherits its count as error
+            floor = self.min_count
+            evicted = heapq.heappop(self._heap)[1]
+            del counts[evicted], self.errors[evicted]
+            counts[item] = floor + count
+            self.errors[item] = floor
+        heapq.heappush(self._heap, (counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        """Drop outdated heap entries."""
+        self._heap = [(count, item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def error_bound(self) -> int:
+        """Largest overestimate of any tracked item (at most total / capacity)."""
+        return self.min_count
+
+    def bounds(self, item: str) -> Tuple[int, int]:
+        """
+        Guaranteed (lower, upper) bounds on an item's count.
+
+        Args:
+            item: Item key
+
+        Returns:
+            (lower, upper); (0, min_count) for an untracked item
+        """
+        if item in self.counts:
+            return self.counts[item] - self.errors[item], self.counts[item]
+        return 0, self.min_count
+
+    def top(self, k: int = None) -> List[Tuple[str, int, int]]:
+        """
+        Most frequent tracked items.
+
+        Args:
+            k: Number of items (default: all tracked)
+
+        Returns:
+            (item, count, error) tuples by descending count
+        """
+        ranked = sorted(self.counts.items(), key=lambda entry: (-entry[1], entry[0]))
+        return [(item, count, self.errors[item]) for item, count in ranked[:k]]
+
+    def merge(self, other: 'SpaceSaving'):
+        """
+        Merge another summary into this one, keeping capacity items.
+
+        An item missing from a full summary is counted with that summary's
+        minimum count, so counts remain upper bounds and the error bound
+        remains (total of both) / capacity.
+
+        Args:
+            other: Summary of another part of the stream
+        """
+        own_floor, other_floor = self.min_count, other.min_count
+        merged = []
+        for item in self.counts.keys() | other.counts.keys():
+            count = self.counts.get(item, own_floor) + other.counts.get(item, other_floor)
+            error = self.errors.get(item, own_floor) + other.errors.get(item, other_floor)
+            merged.append((count, error, item))
+        merged.sort(key=lambda entry: (-entry[0], entry[2]))
+        merged = merged[:self.capacity]
+        self.counts = {item: count for count, _, item in merged}
+        self.errors = {item: error for _, error, item in merged}
+        self.total += other.total
+        self._rebuild_heap()
+
+    def to_dict(self) -> Dict:
+        """JSON-compatible state."""
+        return {'capacity': self.capacity, 'total': self.total,
+                'items': [[item, count, self.errors[item]] for item, count in self.counts.items()]}
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'SpaceSaving':
+        """Restore a summary from to_dict output."""
+        summary = cls(state['capacity'])
+        summary.total = state['total']
+        for item, count, error in state['items']:
+            summary.counts[item] = count
+            summary.errors[item] = error
+        summary._rebuild_heap()
+        return summary
+
+
+class SkillSketch:
+    """
+    Frequency sketch of one stream: Count-Min estimates plus Space-Saving heavy hitters.
+
+    Updates are pre-aggregated in a buffer of at most buffer_size distinct
+    items and applied as weighted updates, so repeated skills and skill pairs
+    cost one sketch update per flush; both sketches keep their guarantees.
+    """
+
+    def __init__(self, width: int = 4096, depth: int = 5, capacity: int = 1000, seed: int = 0,
+                 buffer_size: int = 10000):
+        """
+        Args:
+            width: Count-Min counters per row
+            depth: Count-Min rows
+            capacity: Heavy hitters tracked
+            seed: Count-Min hash seed
+            buffer_size: Distinct items aggregated before the sketches are updated
+        """
+        self.counts = CountMinSketch(width, depth, seed)
+        self.heavy = SpaceSaving(capacity)
+        self.buffer_size = buffer_size
+        self._pending = Counter()
+
+    @property
+    def total(self) -> int:
+        """Number of counted occurrences."""
+        return self.counts.total + sum(self._pending.values())
+
+    def add(self, item: str, count: int = 1):
+        """Count an item."""
+        self._pending[item] += count
+        if len(self._pending) >= self.buffer_size:
+            self.flush()
+
+    def add_many(self, items: Iterable[str]):
+        """Count each of a sequence of items once."""
+        self._pending.update(items)
+        if len(self._pending) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Apply the buffered counts to the sketches."""
+        counts, heavy = self.counts, self.heavy
+        # Heaviest first, so light items compete for the last summary slots among themselves
+        for item, count in self._pending.most_common():
+            counts.add(item, count)
+            heavy.add(item, count)
+        self._pending.clear()
+
+    def bounds(self, item: str) -> Tuple[int, int]:
+        """
+        (lower, upper) bounds on an item's count.
+
+        The upper bound always holds. The lower bound is exact for tracked
+        heavy hitters; for other items it holds with probability 1 - delta
+        of the Count-Min sketch.
+        """
+        self.flush()
+        lower, upper = self.heavy.bounds(item)
+        estimate = self.counts.estimate(item)
+        if item not in self.heavy.counts:
+            lower = max(0, estimate - self.counts.error_bound())
+        return lower, min(upper, estimate)
+
+    def top(self, k: int = 10) -> List[Dict]:
+        """
+        Heaviest items with their bounds.
+
+        Args:
+            k: Number of items
+
+        Returns:
+            Dictionaries with item, count (upper bound), lower and error, by
+            descending count; guaranteed is True when the item's lower bound
+            beats the upper bound of every item outside the list
+        """
+        self.flush()
+        ranked = []
+        for item, count, error in self.heavy.top():
+            count = min(count, self.counts.estimate(item))
+            ranked.append((count, item, max(0, self.heavy.counts[item] - error)))
+        ranked.sort(key=lambda entry: (-entry[0], entry[1]))
+        # Upper bound of anything ranked below k: the next tracked count or the untracked floor
+        cutoff = ranked[k][0] if len(ranked) > k else 0
+        cutoff = max(cutoff, self.heavy.min_count)
+        return [{'item': item, 'count': count, 'lower': lower, 'error': count - lower,
+                 'guaranteed': lower >= cutoff}
+                for count, item, lower in ranked[:k]]
+
+    def merge(self, other: 'SkillSketch'):
+        """Merge the sketch of another part of the stream."""
+        self.flush()
+        other.flush()
+        self.counts.merge(other.counts)
+        self.heavy.merge(other.heavy)
+
+    def error_bounds(self) -> Dict[str, float]:
+        """Error guarantees of the current estimates."""
+        self.flush()
+        return {
+            'count_min_error': self.counts.error_bound(),
+            'count_min_confidence': round(1 - self.counts.delta, 6),
+            'heavy_hitter_error': self.heavy.error_bound(),
+        }
+
+    def memory_bytes(self) -> int:
+        """Approximate fixed memory: counters plus tracked and buffered items."""
+        return self.counts.width * self.counts.depth * 8 + (self.heavy.capacity + self.buffer_size) * 200
+
+    def to_dict(self) -> Dict:
+        """JSON-compatible state."""
+        self.flush()
+        return {'counts': self.counts.to_dict(), 'heavy': self.heavy.to_dict(), 'buffer_size': self.buffer_size}
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'SkillSketch':
+        """Restore a sketch from to_dict output."""
+        sketch = cls.__new__(cls)
+        sketch.counts = CountMinSketch.from_dict(state['counts'])
+        sketch.heavy = SpaceSaving.from_dict(state['heavy'])
+        sketch.buffer_size = state['buffer_size']
+        sketch._pending = Counter()
+        return sketch
+
+
+class SkillDemandAnalytics:
+    """
+    Streaming, mergeable skill statistics over jobs, resumes and results.
+
+    Sketches:
+        demand: jobs requiring each skill
+        supply: resumes with each skill
+        missing: analyzed pairs in which each skill was missing
+        cooccurrence: jobs requiring each pair of skills together
+    """
+
+    SKETCHES = ('demand', 'supply', 'missing', 'cooccurrence')
+
+    def __init__(self, extractor: SkillExtractor = None, width: int = 4096, depth: int = 5,
+                 capacity: int = 1000, seed: int = 0):
+        """
+        Args:
+            extractor: Skill extractor for document texts (default: the
+                built-in skills with aliases)
+            width: Count-Min counters per row
+            depth: Count-Min rows
+            capacity: Heavy hitters tracked per sketch
+            seed: Count-Min hash seed (equal across workers that will be merged)
+        """
+        self._extractor = extractor
+        self.settings = {'width': width, 'depth': depth, 'capacity': capacity, 'seed': seed}
+        self.sketches = {name: SkillSketch(width, depth, capacity, seed) for name in self.SKETCHES}
+        self.jobs = 0
+        self.resumes = 0
+        self.pairs = 0
+
+    @property
+    def extractor(self) -> SkillExtractor:
+        """Skill extractor (built on first use)."""
+        if self._extractor is None:
+            self._extractor = SkillGapAnalyzer(minimal=True).skill_extractor
+        return self._extractor
+
+    def add_job(self, text: str = None, skills: Iterable[str] = None):
+        """
+        Count a job description's skills and skill pairs.
+
+        Args:
+            text: Job description text
+            skills: Its skills, if already extracted (text is then not needed)
+        """
+        skills = sorted(set(skills) if skills is not None else self.extractor.extract_skills((), text))
+        self.sketches['demand'].add_many(skills)
+        self.sketches['cooccurrence'].add_many(first + PAIR_SEPARATOR + second
+                                               for first, second in combinations(skills, 2))
+        self.jobs += 1
+
+    def add_resume(self, text: str = None, skills: Iterable[str] = None):
+        """
+        Count a resume's skills.
+
+        Args:
+            text: Resume text
+            skills: Its skills, if already extracted (text is then not needed)
+        """
+        skills = set(skills) if skills is not None else self.extractor.extract_skills((), text)
+        self.sketches['supply'].add_many(skills)
+        self.resumes += 1
+
+    def add_result(self, result):
+        """
+        Count the missing skills of an analyzed pair.
+
+        Args:
+            result: AnalysisResult or exported result record (records with an
+                error are skipped)
+        """
+        if result.get('error'):
+            return
+        self.sketches['missing'].add_many(result['missing_skills'])
+        self.pairs += 1
+
+    def merge(self, other: 'SkillDemandAnalytics'):
+        """
+        Merge the analytics of another part of the feeds (e.g. another worker).
+
+        Args:
+            other: Analytics built with the same settings
+        """
+        if other.settings != self.settings:
+            raise ValueError("Analytics were built with different sketch settings")
+        for name in self.SKETCHES:
+            self.sketches[name].merge(other.sketches[name])
+        self.jobs += other.jobs
+        self.resumes += other.resumes
+        self.pairs += other.pairs
+
+    def all_pairs_missing(self, k: int = 10) -> List[Dict]:
+        """
+        Skills most often missing over all resumes against all jobs.
+
+        A skill is missing from demand(skill) * (resumes - supply(skill))
+        pairs, so no pair needs analyzing; bounds combine the demand and
+        supply bounds. The candidates come from the demand summary, which
+        tracks every skill demanded more than demand.total / capacity times
+        (total counts skill occurrences over all jobs), so no skill missing
+        from more than resumes * demand.total / capacity pairs is left out.
+
+        Args:
+            k: Number of skills
+
+        Returns:
+            Dictionaries with item, count (upper bound) and lower, by
+            descending count
+        """
+        demand, supply = self.sketches['demand'], self.sketches['supply']
+        demand.flush()
+        supply.flush()
+        ranked = []
+        for item in demand.heavy.counts:
+            demand_lower, demand_upper = demand.bounds(item)
+            supply_lower, supply_upper = supply.bounds(item)
+            upper = demand_upper * max(0, self.resumes - supply_lower)
+            lower = demand_lower * max(0, self.resumes - supply_upper)
+            ranked.append((upper, item, lower))
+        ranked.sort(key=lambda entry: (-entry[0], entry[1]))
+        return [{'item': item, 'count': upper, 'lower': lower, 'error': upper - lower}
+                for upper, item, lower in ranked[:k]]
+
+    def report(self, k: int = 10) -> Dict:
+        """
+        Top skills of every sketch with their error bounds.
+
+        Args:
+            k: Items per list
+
+        Returns:
+            Dictionary with document counts, top lists and error bounds
+        """
+        report = {'jobs': self.jobs, 'resumes': self.resumes, 'pairs': self.pairs}
+        for name in self.SKETCHES:
+            report[name] = self.sketches[name].top(k)
+        report['all_pairs_missing'] = self.all_pairs_missing(k)
+        report['error_bounds'] = {name: self.sketches[name].error_bounds() for name in self.SKETCHES}
+        report['memory_bytes'] = sum(sketch.memory_bytes() for sketch in self.sketches.values())
+        return report
+
+    def to_dict(self) -> Dict:
+        """JSON-compatible state."""
+        return {'settings': self.settings, 'jobs': self.jobs, 'resumes': self.resumes, 'pairs': self.pairs,
+                'sketches': {name: sketch.to_dict() for name, sketch in self.sketches.items()}}
+
+    @classmethod
+    def from_dict(cls, state: Dict, extractor: SkillExtractor = None) -> 'SkillDemandAnalytics':
+        """Restore analytics from to_dict output."""
+        analytics = cls(extractor, **state['settings'])
+        analytics.sketches = {name: SkillSketch.from_dict(state['sketches'][name]) for name in cls.SKETCHES}
+        analytics.jobs, analytics.resumes, analytics.pairs = state['jobs'], state['resumes'], state['pairs']
+        return analytics
+
+    def save(self, filename: str):
+        """
+        Save the sketches to a JSON file.
+
+        Args:
+            filename: Output path
+        """
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, filename: str, extractor: SkillExtractor = None) -> 'SkillDemandAnalytics':
+        """
+        Load sketches written by save.
+
+        Args:
+            filename: Path to the JSON file
+            extractor: Skill extractor for further documents
+
+        Returns:
+            SkillDemandAnalytics
+        """
+        with open(filename, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f), extractor)
+
+
+# Per-process analytics settings, set up once by _init_worker
+_worker_settings: Dict = {}
+_worker_extractor: Optional[SkillExtractor] = None
+
+
+def _init_worker(settings: Dict, taxonomy_file: str = None):
+    """Build the per-process skill extractor."""
+    global _worker_settings, _worker_extractor
+    taxonomy = None
+    if taxonomy_file:
+        from skill_taxonomy import SkillTaxonomy
+        taxonomy = SkillTaxonomy.load(taxonomy_file)
+    _worker_settings = settings
+    _worker_extractor = SkillGapAnalyzer(minimal=True, taxonomy=taxonomy).skill_extractor
+
+
+def _sketch_chunk(kind: str, texts: List[str]) -> Dict:
+    """Partial analytics of a chunk of job or resume texts."""
+    analytics = SkillDemandAnalytics(_worker_extractor, **_worker_settings)
+    add = analytics.add_job if kind == 'job' else analytics.add_resume
+    for text in texts:
+        add(text)
+    return analytics.to_dict()
+
+
+def _text_chunks(documents: Iterator[Tuple[str, str]], size: int) -> Iterator[List[str]]:
+    """Split a document stream into lists of at most size texts."""
+    texts = (text for _, text in documents)
+    while True:
+        chunk = list(islice(texts, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def main(argv: List[str] = None):
+    """Build, merge or report skill demand sketches."""
+    from batch_analyze import iter_documents
+    from result_store import iter_result_records
+
+    parser = argparse.ArgumentParser(description="Streaming skill demand and gap statistics.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    scan_parser = subparsers.add_parser('scan', help="Sketch job feeds, resumes and analysis results")
+    scan_parser.add_argument('--jobs', action='append', default=[], help="Directory or JSONL file of jobs")
+    scan_parser.add_argument('--resumes', action='append', default=[], help="Directory or JSONL file of resumes")
+    scan_parser.add_argument('--results', action='append', default=[],
+                             help="Exported analysis results (JSONL / Parquet file or directory)")
+    scan_parser.add_argument('--output', '-o', required=True, help="Sketch file to write")
+    scan_parser.add_argument('--width', type=int, default=4096, help="Count-Min counters per row (default: 4096)")
+    scan_parser.add_argument('--depth', type=int, default=5, help="Count-Min rows (default: 5)")
+    scan_parser.add_argument('--capacity', type=int, default=1000,
+                             help="Heavy hitters tracked per statistic (default: 1000)")
+    scan_parser.add_argument('--workers', '-w', type=int, default=None, help="Worker processes (default: CPU count)")
+    scan_parser.add_argument('--chunk-size', type=int, default=256, help="Documents per task (default: 256)")
+    scan_parser.add_argument('--max-pending', type=int, default=None,
+                             help="Maximum tasks in flight (default: 2 x workers)")
+    scan_parser.add_argument('--taxonomy', default=None, help="Compiled skill taxonomy to extract skills with")
+
+    merge_parser = subparsers.add_parser('merge', help="Merge sketch files from separate runs")
+    merge_parser.add_argument('sketches', nargs='+', help="Sketch files")
+    merge_parser.add_argument('--output', '-o', required=True, help="Merged sketch file")
+
+    report_parser = subparsers.add_parser('report', help="Print the top skills of a sketch file")
+    report_parser.add_argument('sketch', help="Sketch file")
+    report_parser.add_argument('--top', '-k', type=int, default=10, help="Skills per list (default: 10)")
+    report_parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'scan':
+            settings = {'width': args.width, 'depth': args.depth, 'capacity': args.capacity, 'seed': 0}
+            analytics = SkillDemandAnalytics(**settings)
+            workers = args.workers or os.cpu_count() or 1
+            max_pending = args.max_pending or 2 * workers
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(settings, args.taxonomy)) as pool:
+                pending = set()
+                for kind, paths in (('job', args.jobs), ('resume', args.resumes)):
+                    for path in paths:
+                        for chunk in _text_chunks(iter_documents(path), args.chunk_size):
+                            if len(pending) >= max_pending:
+                                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                                for future in done:
+                                    analytics.merge(SkillDemandAnalytics.from_dict(future.result()))
+                            pending.add(pool.submit(_sketch_chunk, kind, chunk))
+                # Results need no extraction; count them here while the workers finish
+                for path in args.results:
+                    for record in iter_result_records(path):
+                        analytics.add_result(record)
+                for future in wait(pending).done:
+                    analytics.merge(SkillDemandAnalytics.from_dict(future.result()))
+            analytics.save(args.output)
+            print(f"✅ Sketched {analytics.jobs} jobs, {analytics.resumes} resumes and {analytics.pairs} results "
+                  f"into {args.output}", file=sys.stderr)
+        elif args.command == 'merge':
+            analytics = SkillDemandAnalytics.load(args.sketches[0])
+            for path in args.sketches[1:]:
+                analytics.merge(SkillDemandAnalytics.load(path))
+            analytics.save(args.output)
+            print(f"✅ Merged {len(args.sketches)} sketches into {args.output}", file=sys.stderr)
+        else:
+            report = SkillDemandAnalytics.load(args.sketch).report(args.top)
+            if args.json:
+                print(json.dumps(report, indent=2))
+            else:
+                _print_report(report)
+    except (ValueError, KeyError, FileNotFoundError, ImportError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _print_report(report: Dict):
+    """Print a sketch report as text."""
+    titles = {
+        'demand': f"Most demanded skills (of {report['jobs']} jobs)",
+        'supply': f"Most common resume skills (of {report['resumes']} resumes)",
+        'missing': f"Most often missing in analyzed pairs (of {report['pairs']} pairs)",
+        'all_pairs_missing': f"Most often missing over all {report['jobs'] * report['resumes']} resume/job pairs",
+        'cooccurrence': "Skills most often demanded together",
+    }
+    for name, title in titles.items():
+        if not report[name]:
+            continue
+        print(f"\n📊 {title}")
+        for rank, entry in enumerate(report[name], 1):
+            bound = f"±{entry['error']}" if entry['error'] else "exact"
+            print(f"  {rank:>3}. {entry['item']:<40} {entry['count']:>12} ({bound})")
+    print("\nError bounds (absolute counts):")
+    for name, bounds in report['error_bounds'].items():
+        print(f"  {name:<13} Count-Min ≤ {bounds['count_min_error']} at {bounds['count_min_confidence']:.1%}"
+              f" confidence, heavy hitters ≤ {bounds['heavy_hitter_error']}")
+    print(f"Sketch memory: ~{report['memory_bytes'] / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
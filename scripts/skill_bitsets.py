@@ -0,0 +1,211 @@
+"""
+Skill Bitsets
+Packed bitset representation of skill sets for screening whole candidate pools.
+
+Skills are interned to integer ids (in alphabetical order, so decoding a
+bitset yields an already sorted list) and every document becomes a row of
+NumPy uint64 words. Matched, missing and extra skill counts for an entire
+pool against one job then take a few vectorized AND / AND-NOT / popcount
+operations, and skill names are decoded only for the rows that get reported.
+
+Example:
+    pool = CandidatePool()
+    for resume_id, text in resumes:
+        pool.add(resume_id, text)
+    for resume_id, gaps in pool.screen(job_text, k=20):
+        print(resume_id, gaps['match_count'], gaps['missing_skills'])
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from resume_skill_gap_analyzer import SkillGapAnalyzer, _optional_import
+
+
+def _require_numpy():
+    """Import NumPy, which bitsets cannot work without."""
+    np = _optional_import('numpy')
+    if np is None:
+        raise ImportError("NumPy is required for skill bitsets")
+    return np
+
+
+def popcount(words):
+    """
+    Count set bits per row of a uint64 array.
+
+    Args:
+        words: Array of shape (rows, words) or (words,)
+
+    Returns:
+        Bit counts summed over the last axis
+    """
+    np = _require_numpy()
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    # NumPy < 2.0: count bits per byte through a lookup table
+    table = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+    as_bytes = np.ascontiguousarray(words).view(np.uint8)
+    return table[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+class SkillVocabulary:
+    """Interns canonical skill names to bit positions."""
+
+    def __init__(self, skills: Iterable[str]):
+        """
+        Initialize the vocabulary.
+
+        Args:
+            skills: Canonical skill names
+        """
+        np = _require_numpy()
+        self.skills: List[str] = sorted(set(skills))
+        self.ids: Dict[str, int] = {skill: i for i, skill in enumerate(self.skills)}
+        self.words = max(1, (len(self.skills) + 63) // 64)
+        self._np = np
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def encode(self, skills: Iterable[str]):
+        """
+        Pack a set of skills into a bitset.
+
+        Args:
+            skills: Canonical skill names (all must be in the vocabulary)
+
+        Returns:
+            uint64 array of length self.words
+        """
+        np = self._np
+        bits = np.zeros(self.words, dtype=np.uint64)
+        for skill in skills:
+            try:
+                i = self.ids[skill]
+            except KeyError:
+                raise ValueError(f"Unknown skill: {skill!r}") from None
+            bits[i >> 6] |= np.uint64(1 << (i & 63))
+        return bits
+
+    def decode(self, bits) -> List[str]:
+        """
+        Unpack a bitset into skill names.
+
+        Args:
+            bits: uint64 array produced by encode() or a bitwise combination
+
+        Returns:
+            Skill names in alphabetical order
+        """
+        np = self._np
+        # Little-endian bit order within each word, words in id order
+        flags = np.unpackbits(np.asarray(bits, dtype='<u8').view(np.uint8), bitorder='little')
+        return [self.skills[i] for i in np.flatnonzero(flags[:len(self.skills)])]
+
+
+class CandidatePool:
+    """Skill bitsets for a pool of resumes, screened against one job at a time."""
+
+    def __init__(self, analyzer: SkillGapAnalyzer = None, vocabulary: SkillVocabulary = None):
+        """
+        Initialize an empty pool.
+
+        Args:
+            analyzer: Analyzer used to profile documents (default: a new one)
+            vocabulary: Skill vocabulary (default: the analyzer's skill dictionary)
+        """
+        np = _require_numpy()
+        self.analyzer = analyzer or SkillGapAnalyzer()
+        self.vocabulary = vocabulary or SkillVocabulary(self.analyzer.skill_extractor.skill_dict)
+        self.ids: List[str] = []
+        self._np = np
+        self._rows = np.zeros((16, self.vocabulary.words), dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def rows(self):
+        """Bitset matrix with one row per resume, in insertion order."""
+        return self._rows[:len(self.ids)]
+
+    def add(self, resume_id: str, resume_text: str):
+        """
+        Profile a resume and add its skills to the pool.
+
+        Args:
+            resume_id: Identifier reported by screen()
+            resume_text: Resume text
+        """
+        if not resume_text or not resume_text.strip():
+            raise ValueError("Resume text cannot be empty")
+        self.add_skills(resume_id, self.analyzer.profile(resume_text).skills)
+
+    def add_skills(self, resume_id: str, skills: Iterable[str]):
+        """
+        Add an already extracted skill set to the pool.
+
+        Args:
+            resume_id: Identifier reported by screen()
+            skills: Canonical skill names
+        """
+        row = len(self.ids)
+        if row == len(self._rows):
+            grown = self._np.zeros((2 * len(self._rows), self.vocabulary.words), dtype=self._np.uint64)
+            grown[:row] = self._rows
+            self._rows = grown
+        self._rows[row] = self.vocabulary.encode(skills)
+        self.ids.append(resume_id)
+
+    def gap_counts(self, job_skills: Iterable[str]):
+        """
+        Count matched, missing and extra skills for every resume at once.
+
+        Args:
+            job_skills: Skills required by the job
+
+        Returns:
+            Tuple of int64 arrays (matched, missing, extra), one entry per resume
+        """
+        job_bits = self.vocabulary.encode(job_skills)
+        rows = self.rows
+        matched = popcount(rows & job_bits)
+        missing = int(popcount(job_bits)) - matched
+        extra = popcount(rows) - matched
+        return matched, missing, extra
+
+    def screen(self, job_desc_text: str, k: int = 10) -> List[Tuple[str, Dict]]:
+        """
+        Rank the pool by skills matched for a job and report the best resumes.
+
+        Args:
+            job_desc_text: Job description text
+            k: Number of resumes to report
+
+        Returns:
+            Up to k (resume_id, skill gaps) pairs, most matched skills first
+            (ties: fewest extra skills, then insertion order). Skill names are
+            decoded only for these rows.
+        """
+        if not job_desc_text or not job_desc_text.strip():
+            raise ValueError("Job description text cannot be empty")
+        np = self._np
+        job_skills = self.analyzer.profile(job_desc_text).skills
+        matched, missing, extra = self.gap_counts(job_skills)
+        if not len(self.ids):
+            return []
+
+        order = np.lexsort((extra, -matched))
+        job_bits = self.vocabulary.encode(job_skills)
+        results = []
+        for row in order[:k]:
+            bits = self._rows[row]
+            results.append((self.ids[row], {
+                'matched_skills': self.vocabulary.decode(bits & job_bits),
+                'missing_skills': self.vocabulary.decode(job_bits & ~bits),
+                'extra_skills': self.vocabulary.decode(bits & ~job_bits),
+                'total_resume_skills': int(matched[row] + extra[row]),
+                'total_job_skills': len(job_skills),
+                'match_count': int(matched[row]),
+            }))
+        return results
@@ -0,0 +1,359 @@
+"""
+Skill Taxonomy
+Large, loadable skill taxonomies (skills, synonyms, categories and learning
+resources) compiled into a binary artifact that loads in milliseconds.
+
+A taxonomy source is a CSV file (columns: skill, category, synonyms separated
+by "|", optional resource) or a JSON file:
+
+    {"categories": {"cloud": "AWS Training, ..."},
+     "skills": [{"skill": "aws", "category": "cloud",
+                 "synonyms": ["amazon web services"], "resource": "..."}]}
+
+Compiling precomputes every surface form, the category of every skill and the
+skill matcher's automaton as flat 32-bit arrays. Loading memory-maps those
+arrays; automaton states are only expanded when a scan reaches them, so the
+load cost does not grow with the number of skills.
+
+Examples:
+    python scripts/skill_taxonomy.py export-default -o taxonomy.csv
+    python scripts/skill_taxonomy.py compile taxonomy.csv -o taxonomy.bin
+    python scripts/skill_taxonomy.py info taxonomy.bin
+
+    analyzer = SkillGapAnalyzer(taxonomy=SkillTaxonomy.load('taxonomy.bin'))
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from resume_skill_gap_analyzer import (
+    SKILL_DICTIONARY, SKILL_ALIASES, LEARNING_RESOURCES, DEFAULT_LEARNING_RESOURCE, SkillMatcher, categorize_skill,
+    surface_forms,
+)
+
+# Artifact layout: magic, header length (uint32 little-endian), JSON header,
+# then the arrays listed in the header, each aligned to 8 bytes
+FORMAT_MAGIC = b'SKTAX\x00\x01\x00'
+_HEADER_LENGTH = struct.Struct('<I')
+_NO_CATEGORY = 0xFFFFFFFF
+
+
+class TaxonomyEntry(NamedTuple):
+    """One skill of a taxonomy source."""
+    skill: str
+    category: str
+    synonyms: Tuple[str, ...] = ()
+    resource: str = ''
+
+
+class SkillTaxonomy:
+    """Skills with synonyms, categories and learning resources, plus a compiled matcher."""
+
+    def __init__(self, skills: List[str], categories: List[str], skill_categories,
+                 category_resources: Dict[str, str], skill_resources: Dict[str, str],
+                 matcher: SkillMatcher, fingerprint: str):
+        """
+        Initialize from compiled parts (use compile, load or default instead).
+
+        Args:
+            skills: Canonical skill names, sorted
+            categories: Category names
+            skill_categories: Category index per skill (_NO_CATEGORY if none)
+            category_resources: Learning resource per category
+            skill_resources: Learning resources overriding the category's, per skill
+            matcher: Skill matcher over all surface forms
+            fingerprint: Content hash, used in DocumentCache keys
+        """
+        self.skills = skills
+        self.categories = categories
+        self.category_resources = category_resources
+        self.skill_resources = skill_resources
+        self.matcher = matcher
+        self.fingerprint = fingerprint
+        self._skill_categories = skill_categories
+        self._category_by_skill = None
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def category_of(self, skill: str) -> Optional[str]:
+        """
+        Look up the category of a skill.
+
+        Args:
+            skill: Canonical skill name
+
+        Returns:
+            Category name, or None for skills without one
+        """
+        if self._category_by_skill is None:
+            # Built on first use so that loading stays independent of taxonomy size
+            categories = self.categories
+            self._category_by_skill = {
+                skill: categories[index] for skill, index in zip(self.skills, self._skill_categories)
+                if index != _NO_CATEGORY}
+        return self._category_by_skill.get(skill)
+
+    def resource_for(self, skill: str, category: str) -> str:
+        """
+        Look up the learning resource for a skill.
+
+        Args:
+            skill: Canonical skill name
+            category: The skill's category
+
+        Returns:
+            The skill's own resource, else its category's, else a generic one
+        """
+        resource = self.skill_resources.get(skill)
+        if resource:
+            return resource
+        return self.category_resources.get(category, DEFAULT_LEARNING_RESOURCE)
+
+    @classmethod
+    def compile(cls, entries: Iterable[TaxonomyEntry], category_resources: Dict[str, str] = None) -> 'SkillTaxonomy':
+        """
+        Build a taxonomy, compiling its skill matcher.
+
+        Args:
+            entries: Taxonomy entries
+            category_resources: Learning resource per category (default: LEARNING_RESOURCES)
+
+        Returns:
+            SkillTaxonomy
+        """
+        entries = {entry.skill.strip().lower(): entry for entry in entries if entry.skill.strip()}
+        if not entries:
+            raise ValueError("Taxonomy has no skills")
+        category_resources = dict(LEARNING_RESOURCES if category_resources is None else category_resources)
+
+        variations = {}
+        # Synonyms first so that a canonical name always maps to itself
+        for skill, entry in entries.items():
+            for synonym in entry.synonyms:
+                synonym = synonym.strip().lower()
+                if synonym:
+                    for surface in surface_forms(synonym):
+                        variations[surface] = skill
+        for skill in entries:
+            for surface in surface_forms(skill):
+                variations[surface] = skill
+        matcher = SkillMatcher(variations)
+
+        skills = sorted(entries)
+        categories = sorted({entry.category for entry in entries.values() if entry.category})
+        category_ids = {category: i for i, category in enumerate(categories)}
+        skill_categories = array('I', (category_ids.get(entries[skill].category, _NO_CATEGORY) for skill in skills))
+        skill_resources = {skill: entry.resource for skill, entry in entries.items() if entry.resource}
+
+        fingerprint = hashlib.sha256(json.dumps(
+            [sorted(variations.items()), skills, categories, list(skill_categories),
+             sorted(category_resources.items()), sorted(skill_resources.items())]).encode('utf-8')).hexdigest()
+        return cls(skills, categories, skill_categories, category_resources, skill_resources, matcher, fingerprint)
+
+    @classmethod
+    def default(cls) -> 'SkillTaxonomy':
+        """Taxonomy equivalent to the built-in SKILL_DICTIONARY, aliases and category rules."""
+        synonyms = _default_synonyms()
+        return cls.compile(TaxonomyEntry(skill, categorize_skill(skill), synonyms.get(skill, ()))
+                           for skill in SKILL_DICTIONARY)
+
+    @classmethod
+    def from_source(cls, filename: str) -> 'SkillTaxonomy':
+        """
+        Compile a taxonomy from a CSV or JSON source file.
+
+        Args:
+            filename: Path ending in .csv or .json
+
+        Returns:
+            SkillTaxonomy
+        """
+        entries, category_resources = read_source(filename)
+        return cls.compile(entries, category_resources)
+
+    def save(self, filename: str):
+        """
+        Write the compiled taxonomy as a binary artifact.
+
+        Args:
+            filename: Output path
+        """
+        matcher_skills, tables = self.matcher.export_tables()
+        if matcher_skills != self.skills:
+            raise ValueError("Matcher does not cover exactly the taxonomy's skills")
+        tables['skill_categories'] = array('I', self._skill_categories)
+
+        layout = {}
+        offset = 0
+        for name, values in tables.items():
+            layout[name] = [offset, len(values)]
+            offset += _aligned(len(values) * values.itemsize)
+        header = json.dumps({
+            'typecode': 'I',
+            'itemsize': array('I').itemsize,
+            'byteorder': sys.byteorder,
+            'max_pattern_length': self.matcher.max_pattern_length,
+            'skills': self.skills,
+            'categories': self.categories,
+            'category_resources': self.category_resources,
+            'skill_resources': self.skill_resources,
+            'fingerprint': self.fingerprint,
+            'arrays': layout,
+        }).encode('utf-8')
+
+        data_start = _aligned(len(FORMAT_MAGIC) + _HEADER_LENGTH.size + len(header))
+        tmp_path = f"{filename}.tmp{os.getpid()}"
+        with open(tmp_path, 'wb') as f:
+            f.write(FORMAT_MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
+            for name, values in tables.items():
+                f.seek(data_start + layout[name][0])
+                values.tofile(f)
+            f.truncate(data_start + offset)
+        os.replace(tmp_path, filename)
+
+    @classmethod
+    def load(cls, filename: str) -> 'SkillTaxonomy':
+        """
+        Load a taxonomy written by save(); the arrays are memory-mapped.
+
+        Args:
+            filename: Path to the artifact
+
+        Returns:
+            SkillTaxonomy
+        """
+        with open(filename, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if data[:len(FORMAT_MAGIC)] != FORMAT_MAGIC:
+            raise ValueError(f"{filename} is not a compiled skill taxonomy")
+        header_start = len(FORMAT_MAGIC) + _HEADER_LENGTH.size
+        (header_length,) = _HEADER_LENGTH.unpack_from(data, len(FORMAT_MAGIC))
+        header = json.loads(data[header_start:header_start + header_length])
+        if header['itemsize'] != array('I').itemsize or header['byteorder'] != sys.byteorder:
+            raise ValueError(f"{filename} was compiled on an incompatible platform; recompile it")
+
+        data_start = _aligned(header_start + header_length)
+        view = memoryview(data)
+        tables = {name: view[data_start + offset:data_start + offset + length * header['itemsize']].cast('I')
+                  for name, (offset, length) in header['arrays'].items()}
+        skills = header['skills']
+        matcher = SkillMatcher.from_tables(skills, tables, header['max_pattern_length'])
+        return cls(skills, header['categories'], tables['skill_categories'], header['category_resources'],
+                   header['skill_resources'], matcher, header['fingerprint'])
+
+
+def _aligned(size: int) -> int:
+    """Round a byte count up to a multiple of 8."""
+    return (size + 7) & ~7
+
+
+def read_source(filename: str) -> Tuple[List[TaxonomyEntry], Optional[Dict[str, str]]]:
+    """
+    Read a taxonomy source file.
+
+    Args:
+        filename: CSV (skill, category, synonyms, resource) or JSON file
+
+    Returns:
+        (entries, category_resources); category_resources is None for CSV
+        sources, which use the built-in LEARNING_RESOURCES
+    """
+    if filename.endswith('.json'):
+        with open(filename, 'r', encoding='utf-8') as f:
+            source = json.load(f)
+        entries = [TaxonomyEntry(item['skill'], item.get('category', ''), tuple(item.get('synonyms', ())),
+                                 item.get('resource', ''))
+                   for item in source['skills']]
+        return entries, source.get('categories')
+
+    if filename.endswith('.csv'):
+        with open(filename, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.DictReader(f)
+            if 'skill' not in (reader.fieldnames or ()):
+                raise ValueError(f"{filename} has no 'skill' column")
+            entries = [TaxonomyEntry(row['skill'], row.get('category') or '',
+                                     tuple(s for s in (row.get('synonyms') or '').split('|') if s),
+                                     row.get('resource') or '')
+                       for row in reader]
+        return entries, None
+
+    raise ValueError(f"Unsupported taxonomy source {filename!r} (expected .csv or .json)")
+
+
+def _default_synonyms() -> Dict[str, Tuple[str, ...]]:
+    """Built-in SKILL_ALIASES grouped by skill."""
+    synonyms = {}
+    for alias, skill in sorted(SKILL_ALIASES.items()):
+        synonyms[skill] = synonyms.get(skill, ()) + (alias,)
+    return synonyms
+
+
+def write_default_source(filename: str):
+    """
+    Write the built-in skill dictionary as a CSV taxonomy source to extend.
+
+    Args:
+        filename: Output path
+    """
+    with open(filename, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['skill', 'category', 'synonyms', 'resource'])
+        synonyms = _default_synonyms()
+        for skill in sorted(SKILL_DICTIONARY):
+            writer.writerow([skill, categorize_skill(skill), '|'.join(synonyms.get(skill, ())), ''])
+
+
+def main(argv: List[str] = None):
+    """Compile, inspect or export skill taxonomies."""
+    parser = argparse.ArgumentParser(description="Compile skill taxonomies into fast-loading artifacts.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    compile_parser = subparsers.add_parser('compile', help="Compile a CSV or JSON source")
+    compile_parser.add_argument('source', help="Taxonomy source (.csv or .json)")
+    compile_parser.add_argument('--output', '-o', required=True, help="Artifact path")
+
+    info_parser = subparsers.add_parser('info', help="Describe a compiled artifact")
+    info_parser.add_argument('artifact', help="Artifact path")
+
+    export_parser = subparsers.add_parser('export-default', help="Write the built-in skills as a CSV source")
+    export_parser.add_argument('--output', '-o', required=True, help="CSV path")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'compile':
+            taxonomy = SkillTaxonomy.from_source(args.source)
+            taxonomy.save(args.output)
+            print(f"✅ Compiled {len(taxonomy)} skills ({taxonomy.matcher.state_count} matcher states) "
+                  f"to {args.output}", file=sys.stderr)
+        elif args.command == 'info':
+            start = time.perf_counter()
+            taxonomy = SkillTaxonomy.load(args.artifact)
+            load_ms = (time.perf_counter() - start) * 1000
+            print(json.dumps({
+                'skills': len(taxonomy),
+                'categories': len(taxonomy.categories),
+                'matcher_states': taxonomy.matcher.state_count,
+                'fingerprint': taxonomy.fingerprint,
+                'load_ms': round(load_ms, 3),
+            }, indent=2))
+        else:
+            write_default_source(args.output)
+            print(f"✅ Wrote {len(SKILL_DICTIONARY)} skills to {args.output}", file=sys.stderr)
+    except (ValueError, KeyError, FileNotFoundError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""AnalysisResult serialization and Mapping behaviour against dict(result)."""
+
+import json
+import os
+import pickle
+
+import pytest
+
+from resume_skill_gap_analyzer import RESULT_FIELDS, AnalysisResult, SkillGapAnalyzer, SkillTable
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(SCRIPTS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return SkillGapAnalyzer(minimal=True)
+
+
+@pytest.fixture(scope='module')
+def results(analyzer):
+    resume, job = _read('sample_resume.txt'), _read('sample_job_description.txt')
+    exact = analyzer.analyze(resume, job)
+    # More than MAX_RECOMMENDATIONS missing skills, and a resume without any skills
+    many_missing = analyzer.analyze("Office administrator.", job + " rust, scala, kotlin, swift, php, ruby, go")
+    no_skills = analyzer.analyze("Office administrator.", "Front desk and filing duties.")
+    approximate = AnalysisResult(exact.table, exact.matched_ids, exact.missing_ids, exact.extra_ids, exact.top_ids,
+                                 exact.match_percentage, exact.total_resume_skills, exact.total_job_skills,
+                                 approximate=('match_percentage', 'recommendations'))
+    return [exact, many_missing, no_skills, approximate]
+
+
+def test_mapping_matches_dict(results):
+    exact, many_missing, _, approximate = results
+    assert len(many_missing['missing_skills']) > AnalysisResult.MAX_RECOMMENDATIONS
+    assert len(many_missing['recommendations']) == AnalysisResult.MAX_RECOMMENDATIONS
+    for result in results:
+        plain = dict(result)
+        assert result.to_dict() == plain == {**result}
+        assert list(result) == list(plain) and len(result) == len(plain)
+        assert all(result[key] == value and key in result for key, value in plain.items())
+        assert plain['match_count'] == len(plain['matched_skills'])
+    assert list(exact) == list(RESULT_FIELDS) and 'approximate' not in exact
+    assert list(approximate) == list(RESULT_FIELDS) + ['approximate']
+    assert approximate['approximate'] == ['match_percentage', 'recommendations']
+    with pytest.raises(KeyError):
+        exact['approximate']
+
+
+def test_json_round_trip(results):
+    for result in results:
+        text = result.to_json()
+        assert json.loads(text) == dict(result)
+        assert text == json.dumps(result.to_dict())
+
+
+def test_bytes_round_trip(analyzer, results):
+    for result in results:
+        data = result.to_bytes()
+        restored = AnalysisResult.from_bytes(data, analyzer.skill_table)
+        assert dict(restored) == dict(result)
+        assert restored.approximate == result.approximate
+        assert restored.to_bytes() == data
+
+
+def test_bytes_with_wide_skill_ids(analyzer):
+    table = SkillTable([f"skill-{i:05d}" for i in range(70000)], analyzer._recommendation)
+    assert table.typecode == 'I'
+    result = AnalysisResult(table, (1, 69999), (65536,), (), (65536, 1), 12.5, 2, 3)
+    restored = AnalysisResult.from_bytes(result.to_bytes(), table)
+    assert dict(restored) == dict(result)
+    assert restored['missing_skills'] == ['skill-65536']
+
+
+def test_bytes_are_checked(analyzer, results):
+    data = results[0].to_bytes()
+    other = SkillGapAnalyzer(minimal=True).skill_table
+    assert AnalysisResult.from_bytes(data, other) == results[0]
+    with pytest.raises(ValueError):
+        AnalysisResult.from_bytes(b'XXXX' + data[4:], analyzer.skill_table)
+    with pytest.raises(ValueError):
+        AnalysisResult.from_bytes(data, SkillTable(['python'], analyzer._recommendation))
+
+
+def test_pickles_as_a_plain_dictionary(results):
+    for result in results:
+        restored = pickle.loads(pickle.dumps(result))
+        assert type(restored) is dict and restored == dict(result)
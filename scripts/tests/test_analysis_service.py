@@ -0,0 +1,41 @@
+"""HTTP handling of the analysis service (no worker pool needed)."""
+
+import asyncio
+import json
+
+from analysis_service import AnalysisService
+
+
+async def _exchange(request: bytes) -> bytes:
+    service = AnalysisService(workers=1)
+    server = await asyncio.start_server(service.handle_connection, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(request)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout=5)
+        writer.close()
+        return response
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def _status_and_body(response: bytes):
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(body)
+
+
+def test_malformed_content_length_gets_400():
+    for value in (b'abc', b'-5'):
+        response = asyncio.run(_exchange(
+            b'POST /analyze HTTP/1.1\r\nContent-Length: ' + value + b'\r\n\r\n{}'))
+        status, body = _status_and_body(response)
+        assert status == 400
+        assert 'Content-Length' in body['error']
+
+
+def test_health_still_served():
+    status, body = _status_and_body(asyncio.run(_exchange(b'GET /health HTTP/1.0\r\n\r\n')))
+    assert (status, body) == (200, {'status': 'ok'})
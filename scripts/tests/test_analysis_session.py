@@ -0,0 +1,100 @@
+"""Incremental session results must equal a full analyze() of the same texts."""
+
+import os
+import random
+
+import pytest
+
+from analysis_session import AnalysisSession
+from resume_skill_gap_analyzer import SkillGapAnalyzer
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(SCRIPTS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_skills_spanning_line_breaks():
+    analyzer = SkillGapAnalyzer(minimal=True)
+    job = "Looking for python, machine learning and problem solving skills."
+    resume = "python developer\nmachine\nlearning projects\nproblem\nsolving"
+    session = AnalysisSession(resume, job, analyzer)
+    expected = analyzer.analyze(resume, job)
+    assert expected['matched_skills'] == ['machine learning', 'problem solving', 'python']
+    assert session.result() == expected
+
+    # Split a skill by an edit on one side of the break, then join it again
+    edited = resume.replace("learning projects", "teaching projects")
+    assert session.update_resume(edited) == analyzer.analyze(edited, job)
+    assert session.update_resume(resume) == expected
+
+
+def test_random_edits_match_full_analysis():
+    analyzer = SkillGapAnalyzer(minimal=True)
+    resume, job = _read('sample_resume.txt'), _read('sample_job_description.txt')
+    session = AnalysisSession(resume, job, analyzer)
+    # Mostly halves of multi-word skills and line breaks between them
+    vocabulary = ["machine", "learning", "problem", "solving", "time", "management", "node.js",
+                  "\n", "\n"] + resume.split()[:20]
+    rng = random.Random(0)
+    for _ in range(200):
+        lines = resume.split('\n')
+        start = rng.randrange(len(lines) + 1)
+        stop = min(len(lines), start + rng.randrange(3))
+        new_lines = ' '.join(rng.choice(vocabulary) for _ in range(rng.randrange(8))).split('\n')
+        lines[start:stop] = new_lines
+        if not '\n'.join(lines).strip():
+            continue
+        resume = '\n'.join(lines)
+        assert session.update_resume(resume) == analyzer.analyze(resume, job)
+
+
+def test_hashing_scoring_matches_full_analysis():
+    analyzer = SkillGapAnalyzer(minimal=True, scoring='hashing')
+    resume, job = _read('sample_resume.txt'), _read('sample_job_description.txt')
+    session = AnalysisSession(resume, job, analyzer)
+    assert session.result() == analyzer.analyze(resume, job)
+
+    lines = resume.split('\n')
+    rng = random.Random(1)
+    for _ in range(50):
+        start = rng.randrange(len(lines))
+        lines[start:start + 1] = [' '.join(rng.sample(resume.split(), 5))]
+        edited = '\n'.join(lines)
+        assert session.update_resume(edited) == analyzer.analyze(edited, job)
+
+
+def test_invalid_arguments_are_rejected_before_any_update():
+    analyzer = SkillGapAnalyzer(minimal=True)
+    resume, job = "python developer\n\ndocker and sql", "python, docker, kubernetes"
+    session = AnalysisSession(resume, job, analyzer)
+    expected = session.result()
+    bad_calls = [
+        lambda: session.edit_resume(-1, 1, ["go"]),
+        lambda: session.edit_resume(2, 1, ["go"]),
+        lambda: session.edit_resume(0, 4, ["go"]),
+        lambda: session.edit_resume(0.0, 1, ["go"]),
+        lambda: session.edit_resume(0, True, ["go"]),
+        lambda: session.edit_resume(0, 1, "go"),
+        lambda: session.edit_resume(0, 1, None),
+        lambda: session.edit_resume(0, 1, [b"go"]),
+        lambda: session.edit_resume(0, 1, ["go\nrust"]),
+        lambda: session.edit_resume(0, 3, ["  ", ""]),
+        lambda: session.update_resume(b"python developer"),
+        lambda: session.update_resume(["python developer"]),
+        lambda: session.update_resume(" \n "),
+        lambda: session.update_job(None),
+        lambda: session.update_job(42),
+        lambda: AnalysisSession(resume, b"python", analyzer),
+    ]
+    for call in bad_calls:
+        with pytest.raises(ValueError):
+            call()
+        assert session.result() == expected and session.resume.text == resume
+
+    # Valid edits at the boundaries still apply
+    edited = "python developer\n\ndocker and sql\nkubernetes"
+    assert session.edit_resume(3, 3, ["kubernetes"]) == analyzer.analyze(edited, job)
+    assert session.edit_resume(0, 1, ()) == analyzer.analyze(edited.split('\n', 1)[1], job)
@@ -0,0 +1,27 @@
+"""Batch scoring with the shared TF-IDF model."""
+
+import pytest
+
+from resume_skill_gap_analyzer import SkillGapAnalyzer
+
+pytest.importorskip('sklearn')
+
+FIRST = (["python django rest apis", "java spring microservices"],
+         ["python developer with django", "java backend engineer"])
+SECOND = (["kubernetes docker terraform", "react typescript frontend"],
+          ["devops engineer kubernetes", "frontend react developer"])
+
+
+def test_score_many_fits_each_call_on_its_own_corpus():
+    analyzer = SkillGapAnalyzer()
+    analyzer.score_many(*FIRST)
+    assert analyzer.vectorizer is None
+    assert (analyzer.score_many(*SECOND) == SkillGapAnalyzer().score_many(*SECOND)).all()
+
+
+def test_score_many_reuses_an_explicitly_fitted_model():
+    analyzer = SkillGapAnalyzer()
+    analyzer.fit_vectorizer(FIRST[0] + FIRST[1])
+    model = analyzer.vectorizer
+    analyzer.score_many(*SECOND)
+    assert analyzer.vectorizer is model
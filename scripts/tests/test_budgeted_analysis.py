@@ -0,0 +1,53 @@
+"""Deadline-aware analysis: exact within a generous budget, labelled estimates past it."""
+
+import os
+import time
+
+from resume_skill_gap_analyzer import RESULT_FIELDS, SKILL_FIELDS, SkillGapAnalyzer
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(SCRIPTS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_generous_budget_gives_the_unbudgeted_result():
+    analyzer = SkillGapAnalyzer(minimal=True)
+    resume, job = _read('sample_resume.txt'), _read('sample_job_description.txt')
+    result = analyzer.analyze(resume, job, budget=30.0)
+    assert result.exact
+    assert 'approximate' not in result
+    assert result.to_dict() == analyzer.analyze(resume, job).to_dict()
+    assert result.to_json() == analyzer.analyze(resume, job).to_json()
+
+
+def test_slow_scoring_estimate_is_labelled_and_skills_stay_exact():
+    analyzer = SkillGapAnalyzer(minimal=True)
+    resume, job = _read('sample_resume.txt'), _read('sample_job_description.txt')
+    expected = analyzer.analyze(resume, job)
+    # Vectorizing would take far longer than the budget; scanning skills fits
+    analyzer.stage_costs.rates['vectorize'] = 1.0
+    result = analyzer.analyze(resume, job, budget=1.0)
+    assert result.approximate == ('match_percentage',)
+    assert result['approximate'] == ['match_percentage']
+    assert {field: result[field] for field in SKILL_FIELDS} == {field: expected[field] for field in SKILL_FIELDS}
+
+
+def test_exhausted_budget_returns_labelled_estimates_within_the_deadline():
+    analyzer = SkillGapAnalyzer(minimal=True)
+    resume = _read('sample_resume.txt') * 300
+    job = _read('sample_job_description.txt') * 300
+    budget = 0.02
+    start = time.perf_counter()
+    result = analyzer.analyze(resume, job, budget=budget)
+    elapsed = time.perf_counter() - start
+
+    assert not result.exact
+    assert 'match_percentage' in result.approximate
+    assert set(result.approximate) <= set(RESULT_FIELDS)
+    assert result['approximate'] == list(result.approximate)
+    assert 0 <= result['match_percentage'] <= 100
+    # The deadline is checked every SEGMENT_CHARS characters; allow for scheduling jitter
+    assert elapsed < budget + 0.05
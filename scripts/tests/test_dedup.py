@@ -0,0 +1,65 @@
+"""Near-duplicate resolution and reuse of stored analyses."""
+
+import os
+
+from dedup import DedupAnalyzer, DedupIndex
+from resume_skill_gap_analyzer import SkillGapAnalyzer
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(SCRIPTS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_rewritten_document_under_the_same_id_is_analyzed_again():
+    resume, job = _read('sample_resume.txt'), _read('sample_job_description.txt')
+    rewritten = "Kubernetes and Terraform platform engineer with Go and AWS experience.\n" * 5
+    analyzer = SkillGapAnalyzer(minimal=True)
+    with DedupIndex() as index:
+        dedup = DedupAnalyzer(index, analyzer)
+        dedup.analyze(resume, job, resume_id='c42', job_id='j1')
+        assert dedup.analyze(resume, job, resume_id='c42', job_id='j1') == analyzer.analyze(resume, job)
+        assert dedup.reused == 1
+
+        result = dedup.analyze(rewritten, job, resume_id='c42', job_id='j1')
+        assert dedup.reused == 1
+        assert result == analyzer.analyze(rewritten, job)
+        assert index.resolve('c42', rewritten) == ('c42', 1.0)
+
+
+def test_duplicates_of_a_changed_canonical_document_are_resolved_again():
+    resume = _read('sample_resume.txt')
+    with DedupIndex() as index:
+        assert index.resolve('a', resume) == ('a', 1.0)
+        assert index.resolve('b', resume + " ")[0] == 'a'
+        index.resolve('a', "Entirely different text about gardening and cooking " * 10)
+        # 'b' no longer points at the rewritten 'a' and becomes canonical itself
+        assert index.resolve('b', resume + " ") == ('b', 1.0)
+
+
+def test_chunked_and_whole_text_resolution_agree():
+    resume = _read('sample_resume.txt')
+    with DedupIndex() as index:
+        index.resolve('r1', chunks=iter([resume[:100], resume[100:]]))
+        assert index.resolve('r1', resume) == ('r1', 1.0)
+        assert len(index) == 1
+
+
+def test_resume_and_job_ids_do_not_collide():
+    resume, job = _read('sample_resume.txt'), _read('sample_job_description.txt')
+    analyzer = SkillGapAnalyzer(minimal=True)
+    with DedupIndex() as index:
+        dedup = DedupAnalyzer(index, analyzer)
+        assert dedup.analyze(resume, job, resume_id='1', job_id='1') == analyzer.analyze(resume, job)
+        assert index.digest('1', 'resume') != index.digest('1', 'job')
+        assert len(index) == 2
+
+
+def test_kinds_do_not_match_each_other():
+    resume = _read('sample_resume.txt')
+    with DedupIndex() as index:
+        assert index.resolve('r', resume, kind='resume') == ('r', 1.0)
+        assert index.resolve('j', resume, kind='job') == ('j', 1.0)
+        assert index.resolve('r2', resume, kind='resume')[0] == 'r'
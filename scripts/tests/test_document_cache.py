@@ -0,0 +1,88 @@
+"""Byte-bounded LRU and persistent tier of DocumentCache."""
+
+import json
+import os
+import pickle
+import subprocess
+import sys
+
+from resume_skill_gap_analyzer import DocumentCache, DocumentProfile, SkillGapAnalyzer
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_ANALYZE = """
+import json, sys
+from resume_skill_gap_analyzer import DocumentCache, SkillGapAnalyzer
+cache = DocumentCache(disk_dir=sys.argv[1])
+result = SkillGapAnalyzer(cache=cache, minimal=True).analyze(open('sample_resume.txt').read(),
+                                                             open('sample_job_description.txt').read())
+print(json.dumps({'stats': cache.stats(), 'result': result.to_dict()}))
+"""
+
+
+def _profile(word: str) -> DocumentProfile:
+    return DocumentProfile((word,) * 50, frozenset({word}), {word: 1}, {word: 50})
+
+
+def _size(profile: DocumentProfile) -> int:
+    return len(pickle.dumps(tuple(profile), pickle.HIGHEST_PROTOCOL))
+
+
+def test_memory_tier_evicts_least_recently_used_at_the_byte_limit():
+    profiles = {word: _profile(word) for word in ('alpha', 'bravo', 'delta')}
+    size = _size(profiles['alpha'])
+    assert all(_size(profile) == size for profile in profiles.values())
+    cache = DocumentCache(max_bytes=2 * size)
+    cache.put('a', profiles['alpha'])
+    cache.put('b', profiles['bravo'])
+    assert cache.stats()['bytes'] == 2 * size
+
+    assert cache.get('a') == profiles['alpha']  # now most recently used
+    cache.put('d', profiles['delta'])
+    assert cache.get('b') is None
+    assert cache.get('a') == profiles['alpha'] and cache.get('d') == profiles['delta']
+    stats = cache.stats()
+    assert (stats['entries'], stats['bytes'], stats['evictions']) == (2, 2 * size, 1)
+
+    # Entries larger than the whole tier are not kept (and evict nothing)
+    small = DocumentCache(max_bytes=size - 1)
+    small.put('a', profiles['alpha'])
+    assert small.get('a') is None
+    assert small.stats()['evictions'] == 0
+
+
+def test_disk_tier_reloads_evicted_and_restarted_entries(tmp_path):
+    profile = _profile('alpha')
+    cache = DocumentCache(max_bytes=_size(profile), disk_dir=str(tmp_path))
+    cache.put('k' * 64, profile)
+    cache.put('j' * 64, _profile('bravo'))  # evicts the first from memory
+    assert cache.get('k' * 64) == profile
+    assert cache.stats()['disk_hits'] == 1
+
+    restarted = DocumentCache(disk_dir=str(tmp_path))
+    assert restarted.get('j' * 64) == _profile('bravo')
+    assert restarted.get('k' * 64) == profile
+    assert restarted.get('x' * 64) is None
+    assert restarted.stats()['disk_hits'] == 2 and restarted.stats()['misses'] == 1
+    # A repeated lookup is served from memory
+    assert restarted.get('k' * 64) == profile and restarted.stats()['hits'] == 1
+
+
+def test_keys_are_stable_across_processes(tmp_path):
+    runs = []
+    for seed in ('1', '2'):
+        output = subprocess.run([sys.executable, '-c', _ANALYZE, str(tmp_path)], cwd=SCRIPTS_DIR, check=True,
+                                env=dict(os.environ, PYTHONHASHSEED=seed), capture_output=True, text=True).stdout
+        runs.append(json.loads(output))
+    assert runs[0]['stats']['misses'] == 2
+    # The second process, with another hash seed, finds both profiles on disk
+    assert runs[1]['stats']['disk_hits'] == 2 and runs[1]['stats']['misses'] == 0
+    assert runs[0]['result'] == runs[1]['result']
+
+    key = DocumentCache.make_key("text", "salt")
+    assert key == DocumentCache.make_key("text", "salt") != DocumentCache.make_key("text", "other")
+    cache = DocumentCache(disk_dir=str(tmp_path))
+    analyzer = SkillGapAnalyzer(cache=cache, minimal=True)
+    with open(os.path.join(SCRIPTS_DIR, 'sample_resume.txt'), encoding='utf-8') as f:
+        analyzer.profile(f.read())
+    assert cache.stats()['disk_hits'] == 1
@@ -0,0 +1,61 @@
+"""Approximate skill matching: the similarity threshold and misspelled aliases."""
+
+import os
+
+import pytest
+
+from resume_skill_gap_analyzer import FuzzySkillIndex, SkillExtractor, SkillGapAnalyzer
+from skill_taxonomy import SkillTaxonomy, TaxonomyEntry
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Misspelled skill names and misspelled aliases (golang -> go, postgres -> postgresql, ...)
+MISSPELLED = "Gollang services on postgress, tailwindcs and expresjs; microservis. Docker too."
+
+
+def _dice(a: str, b: str) -> float:
+    x, y = FuzzySkillIndex.trigrams(a), FuzzySkillIndex.trigrams(b)
+    return 2 * len(x & y) / (len(x) + len(y))
+
+
+def test_threshold_is_inclusive_and_exact_words_are_left_to_the_matcher():
+    score = _dice('kubernetis', 'kubernetes')
+    assert FuzzySkillIndex({'kubernetes': 'kubernetes'}, score).lookup('kubernetis') == \
+        ('kubernetes', round(score, 4))
+    assert FuzzySkillIndex({'kubernetes': 'kubernetes'}, score + 0.01).lookup('kubernetis') == (None, 0.0)
+    assert FuzzySkillIndex({'kubernetes': 'kubernetes'}, 0.5).lookup('kubernetes') == (None, 0.0)
+    # Short words and multi-word forms are exact-match only
+    index = FuzzySkillIndex({'go': 'go', 'machine learning': 'machine learning'}, 0.1)
+    assert index.lookup('goo') == (None, 0.0) and index.lookup('machinelearning') == (None, 0.0)
+    with pytest.raises(ValueError):
+        FuzzySkillIndex({}, 0)
+
+
+def test_fuzzy_matches_are_only_added_with_a_threshold():
+    exact = SkillExtractor({'kubernetes', 'docker'})
+    fuzzy = SkillExtractor({'kubernetes', 'docker'}, fuzzy_threshold=0.5)
+    assert exact.extract_skills([], "kubernetis and docker") == {'docker'}
+    assert fuzzy.extract_skills([], "kubernetis and docker") == {'docker', 'kubernetes'}
+    assert [(match.skill, match.confidence < 1) for match in fuzzy.find_skills("kubernetis docker")] == \
+        [('docker', False), ('kubernetes', True)]
+
+
+def test_misspelled_aliases_are_matched_with_and_without_a_taxonomy(tmp_path):
+    path = str(tmp_path / 'taxonomy.bin')
+    SkillTaxonomy.default().save(path)
+    built_in = SkillGapAnalyzer(minimal=True, fuzzy_threshold=0.75)
+    compiled = SkillGapAnalyzer(minimal=True, fuzzy_threshold=0.75, taxonomy=SkillTaxonomy.load(path))
+    expected = {'go': 1, 'postgresql': 1, 'tailwind': 1, 'express': 1, 'microservices': 1, 'docker': 1}
+    for analyzer in (built_in, compiled):
+        assert analyzer.skill_extractor.extract_skill_counts([], MISSPELLED) == expected
+    with open(os.path.join(SCRIPTS_DIR, 'sample_job_description.txt'), encoding='utf-8') as f:
+        job = f.read()
+    assert compiled.analyze(MISSPELLED, job) == built_in.analyze(MISSPELLED, job)
+
+
+def test_taxonomy_synonyms_are_fuzzy_matched():
+    taxonomy = SkillTaxonomy.compile([TaxonomyEntry('javascript', 'languages', ('ecmascript',)),
+                                      TaxonomyEntry('terraform', 'cloud')])
+    extractor = SkillExtractor(taxonomy.skills, matcher=taxonomy.matcher, fuzzy_threshold=0.7)
+    assert extractor.extract_skill_counts([], "ECMAScript, ecmascrpt and teraform") == \
+        {'javascript': 2, 'terraform': 1}
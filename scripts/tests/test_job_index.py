@@ -0,0 +1,109 @@
+"""Top-k retrieval of JobIndex against brute-force ranking of every job."""
+
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from job_index import JobIndex
+from resume_skill_gap_analyzer import SKILL_DICTIONARY, SkillGapAnalyzer, count_terms
+
+SKILLS = sorted(skill for skill in SKILL_DICTIONARY if skill.isalpha())
+FILLER = "team role experience building systems customers product remote senior growth".split()
+
+
+def _document(rng: random.Random, skills: int) -> str:
+    words = rng.sample(SKILLS, skills) + [rng.choice(FILLER) for _ in range(rng.randint(5, 30))]
+    rng.shuffle(words)
+    return ' '.join(words)
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    rng = random.Random(7)
+    jobs = {f"job-{i}": _document(rng, rng.randint(2, 12)) for i in range(150)}
+    resumes = [_document(rng, rng.randint(3, 15)) for _ in range(10)]
+    return jobs, resumes
+
+
+def _index(jobs, minimal: bool, shortlist_size: int) -> JobIndex:
+    index = JobIndex(SkillGapAnalyzer(minimal=minimal), shortlist_size=shortlist_size)
+    for job_id, text in jobs.items():
+        index.add(job_id, text)
+    return index
+
+
+def _brute_force(jobs, resume: str, k: int):
+    """Cosine with corpus-wide smoothed IDF over every job sharing a skill, best first."""
+    analyzer = SkillGapAnalyzer(minimal=True)
+    counts = {job_id: count_terms(text) for job_id, text in jobs.items()}
+    frequency = Counter(term for job_counts in counts.values() for term in job_counts)
+
+    def vector(term_counts):
+        weights = {term: count * (math.log((1 + len(jobs)) / (1 + frequency[term])) + 1)
+                   for term, count in term_counts.items() if term in frequency}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        return {term: weight / norm for term, weight in weights.items()}
+
+    resume_vector = vector(count_terms(resume))
+    resume_skills = analyzer.profile(resume).skills
+    scored = []
+    for job_id, job_counts in counts.items():
+        if resume_skills & analyzer.profile(jobs[job_id]).skills:
+            job_vector = vector(job_counts)
+            scored.append((sum(w * job_vector.get(term, 0.0) for term, w in resume_vector.items()), job_id))
+    return sorted(scored, reverse=True)[:k]
+
+
+@pytest.mark.parametrize('minimal', [False, True], ids=['numpy', 'pure-python'])
+def test_top_k_matches_brute_force_ranking(corpus, minimal):
+    jobs, resumes = corpus
+    index = _index(jobs, minimal, shortlist_size=len(jobs))
+    analyzer = SkillGapAnalyzer(minimal=True)
+    for resume in resumes:
+        results = index.top_k(resume, k=10)
+        expected = _brute_force(jobs, resume, 10)
+        assert [job_id for job_id, _ in results] == [job_id for _, job_id in expected]
+        for (job_id, result), (similarity, _) in zip(results, expected):
+            assert result['match_percentage'] == round(similarity * 100, 2)
+            full = analyzer.analyze(resume, jobs[job_id])
+            for field in ('matched_skills', 'missing_skills', 'extra_skills', 'recommendations'):
+                assert result[field] == full[field]
+
+
+def test_pruning_paths_keep_the_best_skill_coverage(corpus):
+    jobs, resumes = corpus
+    indexes = [_index(jobs, minimal, shortlist_size=20) for minimal in (False, True)]
+    analyzer = SkillGapAnalyzer(minimal=True)
+    profiles = {job_id: analyzer.profile(text).skills for job_id, text in jobs.items()}
+    for resume in resumes:
+        skills = analyzer.profile(resume).skills
+
+        def key(job_id):
+            shared = len(skills & profiles[job_id])
+            return shared, shared / len(profiles[job_id])
+
+        best = sorted((key(job_id) for job_id in jobs if key(job_id)[0]), reverse=True)[:20]
+        for index in indexes:
+            shortlist = index.candidates(skills)
+            # Ties may be broken either way, but the kept keys are the best ones, best first
+            assert [key(job_id) for job_id in shortlist] == best
+
+
+def test_save_and_load_round_trip(tmp_path, corpus):
+    jobs, resumes = corpus
+    index = _index(jobs, False, shortlist_size=50)
+    index.remove('job-3')
+    path = str(tmp_path / 'jobs.index')
+    index.save(path)
+
+    loaded = JobIndex(SkillGapAnalyzer(), shortlist_size=50)
+    loaded.load(path)
+    assert len(loaded) == len(index) and 'job-3' not in loaded
+    for resume in resumes:
+        assert loaded.top_k(resume, k=5) == index.top_k(resume, k=5)
+    # A loaded index keeps accepting updates
+    loaded.add('job-3', jobs['job-3'])
+    index.add('job-3', jobs['job-3'])
+    assert loaded.top_k(resumes[0], k=5) == index.top_k(resumes[0], k=5)
@@ -0,0 +1,46 @@
+"""A default analyzer starts without importing the heavy optional libraries."""
+
+import json
+import os
+import subprocess
+import sys
+import zipfile
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import json, sys
+from resume_skill_gap_analyzer import SkillGapAnalyzer
+analyzer = SkillGapAnalyzer()
+print(json.dumps({'modules': sorted(name for name in ('nltk', 'scipy', 'sklearn') if name in sys.modules),
+                  'stop_words': sorted(analyzer.preprocessor.stop_words)}))
+"""
+
+
+def _probe(nltk_data: str = None) -> dict:
+    env = dict(os.environ, HOME=nltk_data or os.environ.get('HOME', ''))
+    env.pop('NLTK_DATA', None)
+    if nltk_data:
+        env['NLTK_DATA'] = nltk_data
+    output = subprocess.run([sys.executable, '-c', _PROBE], cwd=SCRIPTS_DIR, env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def test_default_analyzer_imports_no_heavy_modules():
+    assert _probe()['modules'] == []
+
+
+def test_nltk_stopwords_are_read_without_importing_nltk(tmp_path):
+    corpus = tmp_path / 'plain' / 'corpora' / 'stopwords'
+    corpus.mkdir(parents=True)
+    (corpus / 'english').write_text("alpha\nbeta\n\ngamma\n", encoding='utf-8')
+    probe = _probe(str(tmp_path / 'plain'))
+    assert probe == {'modules': [], 'stop_words': ['alpha', 'beta', 'gamma']}
+
+    # Only the zip archive nltk.download fetches, not unpacked
+    zipped = tmp_path / 'zipped' / 'corpora'
+    zipped.mkdir(parents=True)
+    with zipfile.ZipFile(zipped / 'stopwords.zip', 'w') as archive:
+        archive.writestr('stopwords/english', "delta\nepsilon\n")
+    assert _probe(str(tmp_path / 'zipped'))['stop_words'] == ['delta', 'epsilon']
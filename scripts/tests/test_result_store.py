@@ -0,0 +1,109 @@
+"""ResultStore queries against brute-force filtering of the stored results."""
+
+import random
+
+import pytest
+
+from result_store import ResultStore
+from resume_skill_gap_analyzer import SKILL_DICTIONARY, SkillGapAnalyzer
+
+SKILLS = sorted(SKILL_DICTIONARY)
+
+
+def _document(rng: random.Random, skills: int) -> str:
+    return ', '.join(rng.sample(SKILLS, skills)) + ' and years of product delivery'
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return SkillGapAnalyzer(minimal=True)
+
+
+@pytest.fixture(scope='module')
+def pool(analyzer):
+    rng = random.Random(11)
+    jobs = {f"job-{j}": _document(rng, 8) for j in range(3)}
+    # Resumes drawn mostly from the job skills, so the postings are well populated
+    job_skills = sorted({skill for text in jobs.values() for skill in analyzer.profile(text).skills})
+    records = {}
+    for i in range(40):
+        resume = ', '.join(rng.sample(job_skills, rng.randint(1, 12)) + rng.sample(SKILLS, 3))
+        for job_id, text in jobs.items():
+            records[(f"r{i}", job_id)] = analyzer.analyze(resume, text)
+    return records
+
+
+def _brute_force(records, job_id=None, matched=(), missing=(), max_missing=None, min_match=None, max_match=None):
+    order = list(records)
+    hits = [pair for pair in order
+            if (job_id is None or pair[1] == job_id)
+            and all(skill in records[pair]['matched_skills'] for skill in matched)
+            and all(skill in records[pair]['missing_skills'] for skill in missing)
+            and (max_missing is None or len(records[pair]['missing_skills']) <= max_missing)
+            and (min_match is None or records[pair]['match_percentage'] >= min_match)
+            and (max_match is None or records[pair]['match_percentage'] <= max_match)]
+    return sorted(hits, key=lambda pair: (-records[pair]['match_percentage'], order.index(pair)))
+
+
+def _load(analyzer, records, batch_size=16) -> ResultStore:
+    store = ResultStore(analyzer=analyzer)
+    assert store.add_many(((resume_id, job_id, result) for (resume_id, job_id), result in records.items()),
+                          batch_size=batch_size) == len(records)
+    return store
+
+
+def test_skill_and_score_queries_match_brute_force(analyzer, pool):
+    store = _load(analyzer, pool)
+    assert len(store) == len(pool)
+    rng = random.Random(5)
+    skills = sorted({skill for result in pool.values() for skill in result['matched_skills']})
+    queries = [{}, {'job_id': 'job-1'}, {'min_match': 20, 'max_match': 60}]
+    for _ in range(60):
+        query = {'job_id': rng.choice([None, 'job-0', 'job-1', 'job-2']),
+                 'matched': rng.sample(skills, rng.randint(0, 1)),
+                 'missing': rng.sample(skills, rng.randint(0, 1)),
+                 'max_missing': rng.choice([None, None, 2, 5]),
+                 'min_match': rng.choice([None, 10.0, 30.0]),
+                 'max_match': rng.choice([None, 50.0, 80.0])}
+        queries.append(query)
+    nonempty = 0
+    for query in queries:
+        expected = _brute_force(pool, **query)
+        hits = store.search(limit=None, **query)
+        assert [(resume_id, job_id) for resume_id, job_id, _ in hits] == expected, query
+        assert all(result == pool[(resume_id, job_id)] for resume_id, job_id, result in hits)
+        assert store.count(**query) == len(expected)
+        assert [hit[:2] for hit in store.search(limit=3, **query)] == expected[:3]
+        nonempty += bool(expected)
+    assert nonempty > len(queries) // 3
+
+
+def test_queries_accept_aliases_and_reject_unknown_skills(analyzer):
+    store = ResultStore(analyzer=analyzer)
+    store.add('r1', 'j1', analyzer.analyze("Kubernetes and Go services", "k8s, golang and terraform"))
+    assert [hit[:2] for hit in store.search(matched=['k8s', 'golang'], missing=['Terraform'])] == [('r1', 'j1')]
+    assert store.search(job_id='unknown') == [] and store.count(job_id='unknown') == 0
+    with pytest.raises(ValueError):
+        store.search(matched=['not-a-skill'])
+
+
+def test_re_adding_a_pair_replaces_its_analysis_and_postings(analyzer, pool, tmp_path):
+    job = "python, docker, kubernetes, terraform"
+    before = analyzer.analyze("python and docker developer", job)
+    after = analyzer.analyze("kubernetes and terraform operator", job)
+    store = ResultStore(str(tmp_path / 'results.sqlite'), analyzer)
+    store.add_many([('r1', 'j1', before), ('r2', 'j1', before)])
+    # In one batch: replace a pair stored earlier and one added in the same batch
+    store.add_many([('r3', 'j1', before), ('r1', 'j1', after), ('r3', 'j1', after),
+                    {'resume_id': 'r4', 'job_id': 'j1', 'error': 'ValueError: empty'}], batch_size=10)
+    assert len(store) == 3
+    assert store.get('r1', 'j1') == after and store.get('r3', 'j1') == after and store.get('r2', 'j1') == before
+    assert [hit[0] for hit in store.search(matched=['python'])] == ['r2']
+    assert sorted(hit[0] for hit in store.search(matched=['kubernetes'], missing=['python'])) == ['r1', 'r3']
+    assert store.count(missing=['kubernetes']) == 1
+    store.close()
+
+    reopened = ResultStore(str(tmp_path / 'results.sqlite'), analyzer)
+    reopened.add('r2', 'j1', after)
+    assert reopened.count(matched=['terraform']) == 3 and len(reopened) == 3
+    reopened.close()
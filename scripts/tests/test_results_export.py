@@ -0,0 +1,70 @@
+"""The approximate label of budgeted results in exports and the result store."""
+
+import csv
+import json
+import os
+
+import pytest
+
+from result_store import ResultStore, iter_result_records
+from results_writer import COLUMNS, LIST_SEPARATOR, ResultsWriter
+from resume_skill_gap_analyzer import AnalysisResult, SkillGapAnalyzer
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(SCRIPTS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture(scope='module')
+def results():
+    analyzer = SkillGapAnalyzer(minimal=True)
+    exact = analyzer.analyze(_read('sample_resume.txt'), _read('sample_job_description.txt'))
+    approximate = AnalysisResult(exact.table, exact.matched_ids, exact.missing_ids, exact.extra_ids, exact.top_ids,
+                                 exact.match_percentage, exact.total_resume_skills, exact.total_job_skills,
+                                 approximate=('match_percentage', 'top_relevant_skills'))
+    return analyzer, exact, approximate
+
+
+def _export(path, results, output_format: str = None):
+    _, exact, approximate = results
+    with ResultsWriter(str(path), output_format) as writer:
+        writer.write(exact, resume_id='exact', job_id='j')
+        writer.write(approximate, resume_id='approximate', job_id='j')
+    return str(path)
+
+
+def test_csv_has_an_approximate_column(tmp_path, results):
+    with open(_export(tmp_path / 'results.csv', results), newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert tuple(rows[0]) == COLUMNS
+    assert rows[0]['approximate'] == ''
+    assert rows[1]['approximate'] == LIST_SEPARATOR.join(['match_percentage', 'top_relevant_skills'])
+
+
+@pytest.mark.parametrize('output_format', ['parquet', 'arrow'])
+def test_columnar_exports_have_an_approximate_column(tmp_path, results, output_format):
+    pa = pytest.importorskip('pyarrow')
+    path = _export(tmp_path / f'results.{output_format}', results)
+    if output_format == 'parquet':
+        table = pytest.importorskip('pyarrow.parquet').read_table(path)
+    else:
+        with pa.memory_map(path) as source:
+            table = pa.ipc.open_file(source).read_all()
+    assert table.schema.field('approximate').type == pa.list_(pa.string())
+    assert table.column('approximate').to_pylist() == [None, ['match_percentage', 'top_relevant_skills']]
+
+
+@pytest.mark.parametrize('output_format', ['jsonl', 'parquet'])
+def test_result_store_keeps_the_approximate_label_of_exports(tmp_path, results, output_format):
+    if output_format == 'parquet':
+        pytest.importorskip('pyarrow.parquet')
+    analyzer, exact, approximate = results
+    path = _export(tmp_path / f'results.{output_format}', results)
+    with ResultStore(analyzer=analyzer) as store:
+        assert store.add_many(iter_result_records(path)) == 2
+        assert store.get('exact', 'j').exact
+        assert store.get('approximate', 'j').approximate == approximate.approximate
+        assert json.loads(store.get('approximate', 'j').to_json()) == approximate.to_dict()
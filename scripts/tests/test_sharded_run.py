@@ -0,0 +1,52 @@
+"""Shard leases and result files of sharded runs."""
+
+import os
+import shutil
+import threading
+import time
+
+from sharded_run import ShardQueue, run_worker, shard_path
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _plan(tmp_path, **settings) -> str:
+    for kind, name in (('resumes', 'sample_resume.txt'), ('jobs', 'sample_job_description.txt')):
+        os.makedirs(tmp_path / kind)
+        shutil.copy(os.path.join(SCRIPTS_DIR, name), tmp_path / kind / name)
+    run_dir = str(tmp_path / 'run')
+    ShardQueue.create(run_dir, str(tmp_path / 'resumes'), str(tmp_path / 'jobs'), minimal=True,
+                      **settings).close()
+    return run_dir
+
+
+def test_worker_exits_when_the_last_attempt_dies_holding_the_lease(tmp_path):
+    run_dir = _plan(tmp_path, lease_seconds=0.2, max_attempts=1)
+    queue = ShardQueue(run_dir)
+    assert queue.claim('dead') is not None
+    time.sleep(0.3)
+
+    summary = {}
+    thread = threading.Thread(target=lambda: summary.update(
+        run_worker(run_dir, 'live', poll_seconds=0.1, verbose=False)), daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert summary['shards'] == 0
+    assert queue.next_expiry() is None
+    assert queue.progress()['given_up'] == 1
+    assert queue.failures() == [(0, 1, 'Lease of dead expired on the last attempt')]
+
+    # Raising the limit retries the given-up shard
+    assert run_worker(run_dir, 'live', max_attempts=2, verbose=False)['shards'] == 1
+    queue.close()
+
+
+def test_shard_write_keeps_other_workers_temporary_files(tmp_path):
+    run_dir = _plan(tmp_path)
+    other = shard_path(run_dir, 0, 'jsonl') + '.other.tmp'
+    with open(other, 'w') as f:
+        f.write('{}\n')
+    assert run_worker(run_dir, 'live', verbose=False)['shards'] == 1
+    assert os.path.exists(shard_path(run_dir, 0, 'jsonl'))
+    assert os.path.exists(other)
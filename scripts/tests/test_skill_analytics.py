@@ -0,0 +1,118 @@
+"""Sketch bounds, all-pairs gaps and parallel scans of job and resume feeds."""
+
+import json
+import os
+import random
+from collections import Counter
+from typing import List
+
+import skill_analytics
+from skill_analytics import SkillDemandAnalytics, SkillSketch
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(SCRIPTS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_scan_with_bounded_pending_chunks_matches_sequential_counts(tmp_path):
+    resume, job = _read('sample_resume.txt'), _read('sample_job_description.txt')
+    jobs = [job, job.replace('Python', 'Go'), "Kubernetes, Terraform and AWS engineer", job]
+    resumes = [resume, "Java and Spring developer with SQL", resume.replace('Docker', '')]
+    for name, texts in (('jobs.jsonl', jobs), ('resumes.jsonl', resumes)):
+        with open(tmp_path / name, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps({'id': str(i), 'text': text}) + '\n' for i, text in enumerate(texts))
+
+    output = str(tmp_path / 'sketch.json')
+    assert skill_analytics.main(['scan', '--jobs', str(tmp_path / 'jobs.jsonl'),
+                                 '--resumes', str(tmp_path / 'resumes.jsonl'), '-o', output,
+                                 '--workers', '2', '--chunk-size', '1', '--max-pending', '1']) == 0
+
+    expected = SkillDemandAnalytics()
+    for text in jobs:
+        expected.add_job(text)
+    for text in resumes:
+        expected.add_resume(text)
+    scanned = SkillDemandAnalytics.load(output)
+    assert (scanned.jobs, scanned.resumes) == (len(jobs), len(resumes))
+    assert scanned.report(20) == expected.report(20)
+
+
+def _zipf_stream(rng: random.Random, items: int, length: int) -> List[str]:
+    weights = [1 / (rank + 1) for rank in range(items)]
+    return rng.choices([f"skill-{rank}" for rank in range(items)], weights, k=length)
+
+
+def test_merged_sketch_bounds_and_top_contain_exact_counts():
+    rng = random.Random(3)
+    # Few counters and summary slots, so both sketches collide and evict
+    for width, capacity, buffer_size in ((8, 4, 1), (16, 8, 5), (32, 12, 10000)):
+        first, second = _zipf_stream(rng, 60, 700), _zipf_stream(rng, 60, 500)
+        sketch = SkillSketch(width, depth=3, capacity=capacity, buffer_size=buffer_size)
+        other = SkillSketch(width, depth=3, capacity=capacity, buffer_size=buffer_size)
+        for item in first:
+            sketch.add(item)
+        other.add_many(second[:250])
+        for item in second[250:]:
+            other.add(item, 1)
+        sketch.merge(other)
+        exact = Counter(first + second)
+        assert sketch.total == sum(exact.values())
+
+        for item in list(exact) + ['never-seen']:
+            lower, upper = sketch.bounds(item)
+            assert upper >= exact[item], (item, width, capacity)
+            # Untracked lower bounds hold with probability 1 - delta; these tiny sketches give them no slack
+            if item in sketch.heavy.counts:
+                assert lower <= exact[item]
+
+        top = sketch.top(5)
+        assert len(top) == min(5, capacity)
+        for entry in top:
+            assert entry['lower'] <= exact[entry['item']] <= entry['count']
+            if entry['guaranteed']:
+                listed = {listed['item'] for listed in top}
+                assert all(exact[entry['item']] >= count for item, count in exact.items() if item not in listed)
+
+
+def _corpus(rng: random.Random, documents: int, skills: List[str]) -> List[List[str]]:
+    return [rng.sample(skills, rng.randint(0, 6)) for _ in range(documents)]
+
+
+def test_all_pairs_missing_matches_brute_force_counts():
+    rng = random.Random(8)
+    skills = [f"skill-{i}" for i in range(12)]
+    # Every job requires skill-0 and few resumes have it, so it stands out even in a tiny sketch
+    jobs = [['skill-0'] + job for job in _corpus(rng, 30, skills[1:])]
+    resumes = _corpus(rng, 22, skills[1:]) + _corpus(rng, 3, skills)
+    brute_force = Counter()
+    for job in jobs:
+        for resume in resumes:
+            brute_force.update(set(job) - set(resume))
+
+    def analytics(**settings) -> SkillDemandAnalytics:
+        # Two workers, each with part of both feeds
+        merged, other = SkillDemandAnalytics(**settings), SkillDemandAnalytics(**settings)
+        for index, job in enumerate(jobs):
+            (merged if index % 2 else other).add_job(skills=job)
+        for index, resume in enumerate(resumes):
+            (other if index % 3 else merged).add_resume(skills=resume)
+        merged.merge(other)
+        return merged
+
+    exact = analytics().all_pairs_missing(len(skills))
+    assert {entry['item']: entry['count'] for entry in exact} == +brute_force
+    assert all(entry['error'] == 0 for entry in exact)
+    assert [entry['count'] for entry in exact] == sorted(brute_force.values(), reverse=True)
+
+    sketched = analytics(width=4, depth=2, capacity=5)
+    approximate = sketched.all_pairs_missing(len(skills))
+    for entry in approximate:
+        assert entry['lower'] <= brute_force[entry['item']] <= entry['count']
+    demand = sketched.sketches['demand']
+    floor = len(resumes) * demand.total / demand.heavy.capacity
+    reported = {entry['item'] for entry in approximate}
+    assert 'skill-0' in reported and brute_force['skill-0'] > floor
+    assert all(item in reported for item, count in brute_force.items() if count > floor)
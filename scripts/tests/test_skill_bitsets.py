@@ -0,0 +1,75 @@
+"""Bitset skill gaps must equal set arithmetic on the extracted skills."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from resume_skill_gap_analyzer import SKILL_DICTIONARY, SkillGapAnalyzer  # noqa: E402
+from skill_bitsets import CandidatePool, popcount  # noqa: E402
+
+SKILLS = sorted(SKILL_DICTIONARY)
+
+
+@pytest.fixture(params=['bitwise_count', 'lookup-table'])
+def popcount_path(request, monkeypatch):
+    if request.param == 'lookup-table':
+        monkeypatch.delattr(np, 'bitwise_count', raising=False)
+    elif not hasattr(np, 'bitwise_count'):
+        pytest.skip("NumPy < 2.0 has no bitwise_count")
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def documents():
+    rng = random.Random(3)
+    resumes = [', '.join(rng.sample(SKILLS, rng.randint(0, 40))) + ' and teamwork' for _ in range(60)]
+    jobs = [', '.join(rng.sample(SKILLS, rng.randint(1, 25))) for _ in range(5)]
+    return resumes, jobs
+
+
+def test_popcount_matches_python_bit_counts(popcount_path):
+    rng = random.Random(popcount_path)
+    words = np.array([[rng.getrandbits(64) for _ in range(4)] for _ in range(50)], dtype=np.uint64)
+    expected = [sum(bin(int(word)).count('1') for word in row) for row in words]
+    assert popcount(words).tolist() == expected
+    assert int(popcount(words[0])) == expected[0]
+    assert popcount(np.full((2, 3), np.uint64(2 ** 64 - 1))).tolist() == [192, 192]
+
+
+def test_gap_counts_match_set_arithmetic(popcount_path, documents):
+    resumes, jobs = documents
+    analyzer = SkillGapAnalyzer(minimal=True)
+    pool = CandidatePool(analyzer)
+    assert pool.vocabulary.words > 1
+    skill_sets = []
+    for i, text in enumerate(resumes):
+        pool.add(f"r{i}", text)
+        skill_sets.append(analyzer.profile(text).skills)
+
+    for job in jobs:
+        job_skills = analyzer.profile(job).skills
+        matched, missing, extra = pool.gap_counts(job_skills)
+        assert matched.tolist() == [len(skills & job_skills) for skills in skill_sets]
+        assert missing.tolist() == [len(job_skills - skills) for skills in skill_sets]
+        assert extra.tolist() == [len(skills - job_skills) for skills in skill_sets]
+        assert popcount(pool.rows).tolist() == [len(skills) for skills in skill_sets]
+
+
+def test_screen_reports_the_gaps_of_analyze(documents):
+    resumes, jobs = documents
+    analyzer = SkillGapAnalyzer(minimal=True)
+    pool = CandidatePool(analyzer)
+    for i, text in enumerate(resumes):
+        pool.add(f"r{i}", text)
+    for job in jobs:
+        results = pool.screen(job, k=10)
+        full = {f"r{i}": analyzer.analyze(text, job) for i, text in enumerate(resumes)}
+        ranked = sorted(full, key=lambda resume_id: (-full[resume_id]['match_count'],
+                                                     len(full[resume_id]['extra_skills']),
+                                                     int(resume_id[1:])))
+        assert [resume_id for resume_id, _ in results] == ranked[:10]
+        for resume_id, gaps in results:
+            for field, value in gaps.items():
+                assert value == full[resume_id][field], field
@@ -0,0 +1,67 @@
+"""The Aho-Corasick skill scan must find what a word-bounded regex search finds."""
+
+import os
+import random
+import re
+from collections import Counter
+
+import pytest
+
+from resume_skill_gap_analyzer import SKILL_DICTIONARY, SkillExtractor
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Nested and overlapping forms, skills next to symbols, and near misses
+TRICKY = (
+    "C++ and C# developers; c++/c# interop, (C#) and c++11. Node.js, nodejs and node. "
+    "Machine learning, machine\nlearning, deep-learning and machine learningx. "
+    "JavaScript/TypeScript, go google golang, r rust docker, ci/cd asp.net, "
+    "data analysis data visualization, problem-solving, sql mysql postgresql."
+)
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(SCRIPTS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def _regex_counts(extractor: SkillExtractor, text: str) -> Counter:
+    """Baseline scan: one word-bounded regex per surface form, overlaps included."""
+    text = re.sub(r'[\t\n\r\x0b\x0c]', ' ', text.lower())
+    occurrences = set()
+    for surface, skill in extractor.skill_variations.items():
+        pattern = re.compile(r'(?<![^\W_])(?=' + re.escape(surface) + r'(?![^\W_]))')
+        # Forms of one skill sharing a start ("node", "node.js") are one occurrence
+        occurrences.update((match.start(), skill) for match in pattern.finditer(text))
+    return Counter(skill for _, skill in occurrences)
+
+
+@pytest.fixture(scope='module')
+def extractor():
+    return SkillExtractor(SKILL_DICTIONARY)
+
+
+def test_tricky_skills_match_the_regex_scan(extractor):
+    counts = extractor.extract_skill_counts([], TRICKY)
+    assert counts == _regex_counts(extractor, TRICKY)
+    for skill in ('c++', 'c#', 'node.js', 'machine learning', 'javascript', 'typescript', 'go', 'r',
+                  'ci/cd', 'asp.net', 'sql', 'mysql', 'postgresql', 'data analysis', 'problem solving'):
+        assert skill in counts, skill
+    assert counts['machine learning'] == 2
+
+
+def test_samples_match_the_regex_scan(extractor):
+    for name in ('sample_resume.txt', 'sample_job_description.txt'):
+        text = _read(name)
+        assert extractor.extract_skill_counts([], text) == _regex_counts(extractor, text)
+
+
+def test_random_texts_match_the_regex_scan(extractor):
+    surfaces = sorted(extractor.skill_variations)
+    glue = [' ', '  ', '\n', ', ', '/', '-', '.', '(', ')', '', 'x', '_', '+', '#']
+    rng = random.Random(0)
+    for _ in range(300):
+        text = ''.join(rng.choice(surfaces) + rng.choice(glue) for _ in range(rng.randint(1, 12)))
+        if rng.random() < 0.5:
+            text = text.upper()
+        assert extractor.extract_skill_counts([], text) == _regex_counts(extractor, text), text
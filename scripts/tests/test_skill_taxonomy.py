@@ -0,0 +1,87 @@
+"""Compiled taxonomies must extract what their source dictionaries extract."""
+
+import csv
+import json
+import os
+
+import pytest
+
+from resume_skill_gap_analyzer import SKILL_DICTIONARY, SkillExtractor, SkillGapAnalyzer
+from skill_taxonomy import SkillTaxonomy, write_default_source
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ALIAS_TEXT = ("Shipped on k8s and Amazon Web Services with JS, golang and ML; "
+              "machine\nlearning, problem-solving, node.js, c++ and c# on ci/cd.")
+
+SOURCE = [
+    {'skill': 'kubernetes', 'category': 'cloud', 'synonyms': ['k8s', 'kube'], 'resource': 'CKA course'},
+    {'skill': 'event sourcing', 'category': 'architecture', 'synonyms': ['es/cqrs']},
+    {'skill': 'c++', 'category': 'languages', 'synonyms': ['cpp']},
+    {'skill': 'dbt', 'category': '', 'synonyms': []},
+]
+TEXT = "Kube and K8S operator; event-sourcing with ES/CQRS in cpp and C++, dbt models. Eventsourcing."
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(SCRIPTS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def _round_trip(taxonomy: SkillTaxonomy, tmp_path) -> SkillTaxonomy:
+    path = str(tmp_path / 'taxonomy.bin')
+    taxonomy.save(path)
+    return SkillTaxonomy.load(path)
+
+
+def _source_extractor() -> SkillExtractor:
+    aliases = {synonym: item['skill'] for item in SOURCE for synonym in item['synonyms']}
+    return SkillExtractor({item['skill'] for item in SOURCE}, aliases=aliases)
+
+
+def test_default_source_round_trip_matches_the_built_in_dictionary(tmp_path):
+    path = str(tmp_path / 'taxonomy.csv')
+    write_default_source(path)
+    loaded = _round_trip(SkillTaxonomy.from_source(path), tmp_path)
+    assert loaded.skills == sorted(SKILL_DICTIONARY)
+    assert loaded.fingerprint == SkillTaxonomy.default().fingerprint
+
+    built_in, compiled = SkillGapAnalyzer(minimal=True), SkillGapAnalyzer(minimal=True, taxonomy=loaded)
+    extractor = built_in.skill_extractor
+    for text in (ALIAS_TEXT, _read('sample_resume.txt'), _read('sample_job_description.txt')):
+        assert compiled.skill_extractor.extract_skill_counts([], text) == extractor.extract_skill_counts([], text)
+    resume, job = _read('sample_resume.txt') + ALIAS_TEXT, _read('sample_job_description.txt')
+    assert compiled.analyze(resume, job) == built_in.analyze(resume, job)
+
+
+@pytest.mark.parametrize('source_format', ['json', 'csv'])
+def test_custom_source_round_trip(tmp_path, source_format):
+    path = tmp_path / f'taxonomy.{source_format}'
+    if source_format == 'json':
+        path.write_text(json.dumps({'categories': {'cloud': 'Cloud path', 'architecture': 'DDD book'},
+                                    'skills': SOURCE}), encoding='utf-8')
+    else:
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['skill', 'category', 'synonyms', 'resource'])
+            for item in SOURCE:
+                writer.writerow([item['skill'], item['category'], '|'.join(item['synonyms']),
+                                 item.get('resource', '')])
+    compiled = SkillTaxonomy.from_source(str(path))
+    loaded = _round_trip(compiled, tmp_path)
+
+    assert loaded.skills == compiled.skills == sorted(item['skill'] for item in SOURCE)
+    assert loaded.fingerprint == compiled.fingerprint
+    for item in SOURCE:
+        assert loaded.category_of(item['skill']) == (item['category'] or None)
+        assert loaded.resource_for(item['skill'], item['category']) == \
+            compiled.resource_for(item['skill'], item['category'])
+    assert loaded.resource_for('kubernetes', 'cloud') == 'CKA course'
+    if source_format == 'json':
+        assert loaded.resource_for('event sourcing', 'architecture') == 'DDD book'
+
+    expected = _source_extractor().extract_skill_counts([], TEXT)
+    assert expected == {'kubernetes': 2, 'event sourcing': 3, 'c++': 2, 'dbt': 1}
+    for taxonomy in (compiled, loaded):
+        extractor = SkillExtractor(taxonomy.skills, matcher=taxonomy.matcher)
+        assert extractor.extract_skill_counts([], TEXT) == expected
@@ -0,0 +1,57 @@
+"""Streamed file analysis must equal analyze() on the whole text, whatever the chunking."""
+
+import os
+
+import pytest
+
+from resume_skill_gap_analyzer import SkillGapAnalyzer
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Multi-word and symbol skills that straddle boundaries of small chunks, and multi-byte characters
+STRADDLING = ("Résumé — machine learning, node.js and c++ / c# engineer; deep learning, "
+              "ci/cd, asp.net and problem solving. Naïve Bayes, data visualization, c#\n")
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(SCRIPTS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def _write(path, text: str) -> str:
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return SkillGapAnalyzer(minimal=True)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1024 * 1024])
+def test_chunked_files_match_analyze(tmp_path, analyzer, chunk_size):
+    resume = STRADDLING * 3 + _read('sample_resume.txt')
+    job = _read('sample_job_description.txt') + STRADDLING
+    result = analyzer.analyze_files(_write(tmp_path / 'resume.txt', resume), _write(tmp_path / 'job.txt', job),
+                                    chunk_size=chunk_size)
+    assert result.to_dict() == analyzer.analyze(resume, job).to_dict()
+    assert 'machine learning' in result['matched_skills']
+
+
+@pytest.mark.parametrize('text', ['a', '!!', ' x ', 'c#'])
+def test_tiny_documents_are_analyzed_like_analyze(tmp_path, analyzer, text):
+    job = _read('sample_job_description.txt')
+    result = analyzer.analyze_files(_write(tmp_path / 'resume.txt', text), _write(tmp_path / 'job.txt', job),
+                                    chunk_size=1)
+    assert result.to_dict() == analyzer.analyze(text, job).to_dict()
+
+
+@pytest.mark.parametrize('text', ['', ' ', ' \n\t '])
+def test_blank_documents_are_rejected_like_analyze(tmp_path, analyzer, text):
+    job = _write(tmp_path / 'job.txt', _read('sample_job_description.txt'))
+    with pytest.raises(ValueError, match="Resume text cannot be empty"):
+        analyzer.analyze(text, _read('sample_job_description.txt'))
+    with pytest.raises(ValueError, match="Resume text cannot be empty"):
+        analyzer.analyze_files(_write(tmp_path / 'resume.txt', text), job, chunk_size=1)
+    with pytest.raises(ValueError, match="Job description text cannot be empty"):
+        analyzer.analyze_files(job, _write(tmp_path / 'blank.txt', text))
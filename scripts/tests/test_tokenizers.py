@@ -0,0 +1,45 @@
+"""The regex and NLTK tokenizer engines must give the same analyses."""
+
+import os
+
+import pytest
+
+from resume_skill_gap_analyzer import SkillGapAnalyzer, TextPreprocessor, nltk_data_available
+
+pytest.importorskip('nltk')
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(SCRIPTS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture(scope='module')
+def samples():
+    return _read('sample_resume.txt'), _read('sample_job_description.txt')
+
+
+def test_engines_give_identical_skills_and_results(samples):
+    regex = SkillGapAnalyzer(tokenizer='regex')
+    nltk = SkillGapAnalyzer(tokenizer='nltk')
+    for text in samples:
+        regex_profile, nltk_profile = regex.profile(text), nltk.profile(text)
+        assert regex_profile.skill_counts == nltk_profile.skill_counts
+        assert regex_profile.term_counts == nltk_profile.term_counts
+    resume, job = samples
+    assert regex.analyze(resume, job) == nltk.analyze(resume, job)
+    assert regex.analyze(resume, job)['match_percentage'] == 39.84
+
+
+@pytest.mark.skipif(not (nltk_data_available('punkt') or nltk_data_available('punkt_tab')),
+                    reason="NLTK tokenizer data not installed (run with --provision-nltk)")
+def test_regex_tokens_agree_with_word_tokenize(samples):
+    regex = TextPreprocessor(tokenizer='regex')
+    nltk = TextPreprocessor(tokenizer='nltk')
+    for text in samples:
+        regex_tokens, nltk_tokens = set(regex.preprocess(text)), set(nltk.preprocess(text))
+        # Only edge cases of punctuation inside words may differ
+        assert len(regex_tokens & nltk_tokens) / len(regex_tokens | nltk_tokens) >= 0.95
+        assert {'python', 'node.js', 'c++'} & nltk_tokens <= regex_tokens